@@ -0,0 +1,63 @@
+import glob
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+import tableauserverclient as TSC
+
+TEST_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'test')
+ASSET_DIR = os.path.join(TEST_DIR, 'assets')
+
+# The benchmarks use the tests' stub server
+sys.path.append(TEST_DIR)
+from _stub_server import StubServer, slow  # noqa: E402
+
+# Model used to parse each list fixture, keyed by the fixture name prefix
+MODELS = {
+    'data_alerts': TSC.DataAlertItem,
+    'database': TSC.DatabaseItem,
+    'datasource': TSC.DatasourceItem,
+    'flow': TSC.FlowItem,
+    'group': TSC.GroupItem,
+    'job': TSC.BackgroundJobItem,
+    'project': TSC.ProjectItem,
+    'schedule': TSC.ScheduleItem,
+    'site': TSC.SiteItem,
+    'subscription': TSC.SubscriptionItem,
+    'table': TSC.TableItem,
+    'user': TSC.UserItem,
+    'view': TSC.ViewItem,
+    'webhook': TSC.WebhookItem,
+    'workbook': TSC.WorkbookItem,
+}
+
+
+def list_fixtures():
+    """
+    Yields (fixture name, model class, response body) for every non-empty `*_get*.xml` list fixture.
+    """
+    for path in sorted(glob.glob(os.path.join(ASSET_DIR, '*_get*.xml'))):
+        name = os.path.basename(path)
+        if '_by_' in name or name.endswith('_empty.xml'):
+            continue
+        model = MODELS.get(name.split('_get')[0])
+        if model is None:
+            continue
+        with open(path, 'rb') as f:
+            yield name, model, f.read()
+
+
+def scale_fixture(content, count):
+    """
+    Returns the response body with the items in its list element repeated up to `count` items.
+    """
+    ET.register_namespace('', TSC.DEFAULT_NAMESPACE)
+    root = ET.fromstring(content)
+    for container in root:
+        if container.tag.endswith('pagination') or len(container) == 0:
+            continue
+        items = list(container)
+        for i in range(count - len(items)):
+            container.append(items[i % len(items)])
+        break
+    return b"<?xml version='1.0' encoding='UTF-8'?>" + ET.tostring(root)
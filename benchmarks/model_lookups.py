@@ -0,0 +1,68 @@
+####
+# This script compares the two ways models look up the child elements of each item:
+# descendant searches such as `.//t:owner`, and direct child lookups by qualified tag name.
+#
+# The workbook, datasource, flow and view list fixtures in test/assets are scaled up and
+# every item's children are looked up both ways, with each available XML backend.
+#
+# Run with tableauserverclient installed (pip install -e .):
+#   python benchmarks/model_lookups.py
+####
+
+import argparse
+import timeit
+
+import tableauserverclient as TSC
+from tableauserverclient import xml_helpers
+from tableauserverclient.xml_helpers import find_child, findall, fromstring
+
+from _fixtures import ASSET_DIR, scale_fixture
+
+NS = {'t': TSC.DEFAULT_NAMESPACE}
+
+# Fixture, item tag and the children each model looks up
+FIXTURES = [
+    ('workbook_get.xml', 'workbook', ['project', 'owner', 'tags', 'views', 'dataAccelerationConfig']),
+    ('datasource_get.xml', 'datasource', ['tags', 'project', 'owner', 'askData']),
+    ('flow_get.xml', 'flow', ['tags', 'project', 'owner']),
+    ('view_get_usage.xml', 'view', ['usage', 'workbook', 'owner', 'project', 'tags']),
+]
+
+
+def descendant_lookups(items, children):
+    for item in items:
+        for child in children:
+            item.find('.//t:{0}'.format(child), namespaces=NS)
+
+
+def child_lookups(items, children):
+    for item in items:
+        for child in children:
+            find_child(item, child, NS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare descendant and direct child element lookups.')
+    parser.add_argument('--scale', type=int, default=10000, help='number of items to scale each fixture up to')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    args = parser.parse_args()
+
+    backends = ['etree'] + (['lxml'] if xml_helpers.lxml_etree is not None else [])
+
+    print("{:<22} {:>8} {:>16} {:>12} {:>8}".format('fixture', 'backend', 'descendant ms', 'child ms', 'speedup'))
+    for filename, tag, children in FIXTURES:
+        with open('{0}/{1}'.format(ASSET_DIR, filename), 'rb') as f:
+            content = scale_fixture(f.read(), args.scale)
+        for backend in backends:
+            xml_helpers.set_xml_backend(backend)
+            items = findall(fromstring(bytes(bytearray(content))), './/t:{0}'.format(tag), NS)
+            descendant = min(timeit.repeat(lambda: descendant_lookups(items, children), number=1,
+                                           repeat=args.repeat))
+            child = min(timeit.repeat(lambda: child_lookups(items, children), number=1, repeat=args.repeat))
+            speedup = descendant / child
+            print("{:<22} {:>8} {:>16.1f} {:>12.1f} {:>7.2f}x".format(filename, backend, descendant * 1e3,
+                                                                      child * 1e3, speedup))
+
+
+if __name__ == '__main__':
+    main()
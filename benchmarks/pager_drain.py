@@ -0,0 +1,77 @@
+####
+# This script measures the per-item cost of draining pages with Pager and QuerySet.
+#
+# No Server is needed: pages are served from memory by a fake endpoint so only the
+# iteration overhead is timed. For comparison it also times the old approach of
+# draining each page with list.pop(0).
+#
+# Run with tableauserverclient installed (pip install -e .):
+#   python benchmarks/pager_drain.py
+####
+
+import argparse
+import timeit
+
+import tableauserverclient as TSC
+from tableauserverclient.server.query import QuerySet
+
+
+class FakeEndpoint(object):
+    def __init__(self, total):
+        self.total = total
+
+    def get(self, req_options=None):
+        req_options = req_options or TSC.RequestOptions()
+        start = (req_options.pagenumber - 1) * req_options.pagesize
+        items = list(range(start, min(start + req_options.pagesize, self.total)))
+
+        pagination_item = TSC.PaginationItem()
+        pagination_item._page_number = req_options.pagenumber
+        pagination_item._page_size = req_options.pagesize
+        pagination_item._total_available = self.total
+        return items, pagination_item
+
+
+def drain_with_pop(endpoint, page_size):
+    # The pre-cursor Pager loop, kept here as the baseline
+    page_number = 1
+    items, pagination_item = endpoint.get(TSC.RequestOptions(page_number, page_size))
+    count = 0
+    while count < pagination_item.total_available:
+        if not items:
+            page_number += 1
+            items, pagination_item = endpoint.get(TSC.RequestOptions(page_number, page_size))
+        items.pop(0)
+        count += 1
+
+
+def drain_with_pager(endpoint, page_size):
+    for _ in TSC.Pager(endpoint, TSC.RequestOptions(1, page_size)):
+        pass
+
+
+def index_queryset(endpoint, page_size):
+    queryset = QuerySet(endpoint).paginate(page_size=page_size)
+    for i in range(page_size):
+        queryset[i]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time per-item cost of Pager and QuerySet iteration.')
+    parser.add_argument('--pages', type=int, default=20, help='number of pages to drain')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    args = parser.parse_args()
+
+    print("{:>9} {:>16} {:>16} {:>16}".format('page size', 'pop(0) ns/item', 'Pager ns/item', 'QuerySet ns/item'))
+    for page_size in (100, 250, 500, 1000):
+        endpoint = FakeEndpoint(page_size * args.pages)
+        results = []
+        for func, items in ((drain_with_pop, endpoint.total), (drain_with_pager, endpoint.total),
+                            (index_queryset, page_size)):
+            best = min(timeit.repeat(lambda: func(endpoint, page_size), number=1, repeat=args.repeat))
+            results.append(best / items * 1e9)
+        print("{:>9} {:>16.0f} {:>16.0f} {:>16.0f}".format(page_size, *results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+####
+# This script measures request throughput from threads sharing one Server, against a local
+# stub HTTP server that answers every request with a workbook list.
+#
+# "default" is the requests connection pool of 10 connections. "sized" sets pool_maxsize to
+# the number of threads. Once there are more threads than pooled connections, connections are
+# closed after use and new ones opened, which the "conns" columns show.
+#
+# Run with tableauserverclient installed (pip install -e .):
+#   python benchmarks/pool_throughput.py --requests 2000
+####
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import time
+
+import tableauserverclient as TSC
+
+from _fixtures import ASSET_DIR, StubServer, slow
+
+
+def throughput(stub, threads, requests, **pool_options):
+    server = TSC.Server(stub.address, **pool_options)
+    # Fake sign in
+    server._site_id = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+    server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+    connections = stub.connections
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(lambda _: server.workbooks.get(), range(requests)))
+    elapsed = time.time() - start
+    return requests / elapsed, stub.connections - connections
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare request throughput with default and sized connection pools.')
+    parser.add_argument('--requests', type=int, default=2000, help='requests per run')
+    parser.add_argument('--latency', type=float, default=0.002, help='stub server response delay in seconds')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8, 32], help='thread counts to compare')
+    args = parser.parse_args()
+
+    # Keep urllib3's "Connection pool is full" warnings out of the output
+    logging.getLogger('urllib3').setLevel(logging.ERROR)
+
+    print("{:>8} {:>14} {:>8} {:>14} {:>8}".format('threads', 'default req/s', 'conns', 'sized req/s', 'conns'))
+    with open(os.path.join(ASSET_DIR, 'workbook_get.xml'), 'rb') as f:
+        route = (200, {'Content-Type': 'text/xml'}, f.read())
+    with StubServer(default=slow(args.latency, route)) as stub:
+        for threads in args.threads:
+            default_rate, default_conns = throughput(stub, threads, args.requests)
+            sized_rate, sized_conns = throughput(stub, threads, args.requests, pool_maxsize=threads)
+            print("{:>8} {:>14.0f} {:>8} {:>14.0f} {:>8}".format(threads, default_rate, default_conns,
+                                                                 sized_rate, sized_conns))
+
+
+if __name__ == '__main__':
+    main()
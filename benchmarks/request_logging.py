@@ -0,0 +1,89 @@
+####
+# This script measures what logging costs each request on large list responses, with the
+# default logging level (warning) and with debug logging on.
+#
+# "before" logs the way requests were logged until now: the whole body is decoded for the
+# debug message, and passed to logger.debug, whether or not debug is enabled. "after" is
+# the current Endpoint code, which checks the level first and logs a bounded preview.
+# "endpoint info" is an endpoint's logger.info('... {0}'.format(id)) message, for scale.
+#
+# Run with tableauserverclient installed (pip install -e .):
+#   python benchmarks/request_logging.py --scale 10000
+####
+
+import argparse
+import logging
+import timeit
+
+import requests
+
+import tableauserverclient as TSC
+from tableauserverclient.server.endpoint import endpoint
+
+from _fixtures import list_fixtures, scale_fixture
+
+URL = 'http://test/api/2.3/sites/dad65087-b08b-4603-af4e-2887b8aafc67/workbooks'
+
+
+class _FormattingHandler(logging.Handler):
+    # Formats every record like a real handler would, then drops it
+    def emit(self, record):
+        self.format(record)
+
+
+def make_response(content):
+    server_response = requests.Response()
+    server_response.status_code = 200
+    server_response.headers['Content-Type'] = 'application/xml'
+    server_response.encoding = 'utf-8'
+    server_response._content = content
+    return server_response
+
+
+def before(server_response):
+    endpoint.logger.debug(server_response.content)
+    endpoint.logger.debug(u'Server response from {0}:\n\t{1}'.format(
+        URL, server_response.content.decode(server_response.encoding)))
+
+
+def after(server_response):
+    if endpoint.logger.isEnabledFor(logging.DEBUG):
+        endpoint.logger.debug(endpoint.Endpoint._safe_to_log(server_response))
+    if server_response.encoding and endpoint.logger.isEnabledFor(logging.DEBUG):
+        endpoint.logger.debug(u'Server response from %s:\n\t%s', URL,
+                              endpoint._preview(server_response.content, server_response.encoding))
+
+
+def endpoint_info(server_response):
+    endpoint.logger.info('Populated connections for workbook (ID: {0})'.format('1f951daf-4061-451a-9df1-69a8062664f2'))
+
+
+def best(func, server_response, number, repeat):
+    return min(timeit.repeat(lambda: func(server_response), number=number, repeat=repeat)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time request logging at the default level and with debug on.')
+    parser.add_argument('--scale', type=int, default=10000, help='number of items to scale the fixture up to')
+    parser.add_argument('--number', type=int, default=20, help='requests per run')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    args = parser.parse_args()
+
+    name, model, content = next((f for f in list_fixtures() if f[0] == 'workbook_get.xml'))
+    server_response = make_response(scale_fixture(content, args.scale))
+    print("{} scaled to {} items: {:.1f} MB".format(name, args.scale, len(server_response.content) / 1e6))
+
+    endpoint.logger.addHandler(_FormattingHandler())
+    endpoint.logger.propagate = False
+
+    print("{:<15} {:>18} {:>18}".format('', 'default us/req', 'debug us/req'))
+    for label, func in (('before', before), ('after', after), ('endpoint info', endpoint_info)):
+        endpoint.logger.setLevel(logging.WARNING)
+        off = best(func, server_response, args.number, args.repeat)
+        endpoint.logger.setLevel(logging.DEBUG)
+        on = best(func, server_response, args.number, args.repeat)
+        print("{:<15} {:>18.1f} {:>18.1f}".format(label, off * 1e6, on * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+####
+# This script compares the peak memory used to decode a large list response with
+# Model.from_response and with the streaming decoder that endpoint get(stream=True) uses.
+#
+# Run with tableauserverclient installed (pip install -e .):
+#   python benchmarks/streaming_memory.py
+####
+
+import argparse
+from io import BytesIO
+import tracemalloc
+
+import tableauserverclient as TSC
+from tableauserverclient.xml_helpers import StreamingDecoder
+
+from _fixtures import ASSET_DIR, scale_fixture
+
+NS = {'t': TSC.DEFAULT_NAMESPACE}
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def decode_whole(content):
+    # Consume one item at a time, as a caller looping over Pager would
+    for _ in TSC.ViewItem.from_response(content, NS):
+        pass
+
+
+def decode_streamed(content):
+    for _ in StreamingDecoder(BytesIO(content), TSC.ViewItem):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare peak memory of whole and streamed decoding.')
+    parser.add_argument('--fixture', default='view_get_usage.xml', help='list fixture in test/assets to scale up')
+    args = parser.parse_args()
+
+    with open('{0}/{1}'.format(ASSET_DIR, args.fixture), 'rb') as f:
+        fixture = f.read()
+
+    print("{:>9} {:>14} {:>14}".format('items', 'whole KiB', 'streamed KiB'))
+    for count in (100, 1000, 10000):
+        content = scale_fixture(fixture, count)
+        # The body itself is allocated before measuring, both approaches start from the same bytes
+        whole = peak_memory(lambda: decode_whole(content))
+        streamed = peak_memory(lambda: decode_streamed(content))
+        print("{:>9} {:>14.0f} {:>14.0f}".format(count, whole / 1024.0, streamed / 1024.0))
+
+
+if __name__ == '__main__':
+    main()
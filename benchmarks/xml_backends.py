@@ -0,0 +1,52 @@
+####
+# This script compares the stdlib ElementTree and lxml backends used to parse responses.
+#
+# Each list fixture in test/assets is scaled up to 10k items, then parsed and decoded into
+# models the way an endpoint's get() does, once with each backend.
+#
+# Run with tableauserverclient and lxml installed (pip install -e .[lxml]):
+#   python benchmarks/xml_backends.py
+####
+
+import argparse
+import timeit
+
+import tableauserverclient as TSC
+from tableauserverclient import xml_helpers
+
+from _fixtures import list_fixtures, scale_fixture
+
+NS = {'t': TSC.DEFAULT_NAMESPACE}
+
+
+def decode(content, model):
+    # A fresh copy per call so nothing is left over from the previous run
+    content = bytes(bytearray(content))
+    TSC.PaginationItem.from_response(content, NS)
+    model.from_response(content, NS)
+
+
+def time_backend(backend, content, model, repeat):
+    xml_helpers.set_xml_backend(backend)
+    return min(timeit.repeat(lambda: decode(content, model), number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the XML backends on scaled up list fixtures.')
+    parser.add_argument('--scale', type=int, default=10000, help='number of items to scale each fixture up to')
+    parser.add_argument('--repeat', type=int, default=3, help='best of N runs')
+    args = parser.parse_args()
+
+    if xml_helpers.lxml_etree is None:
+        parser.error('lxml is not installed')
+
+    print("{:<35} {:>12} {:>12} {:>8}".format('fixture', 'etree ms', 'lxml ms', 'speedup'))
+    for name, model, content in list_fixtures():
+        content = scale_fixture(content, args.scale)
+        etree = time_backend('etree', content, model, args.repeat)
+        lxml = time_backend('lxml', content, model, args.repeat)
+        print("{:<35} {:>12.1f} {:>12.1f} {:>7.2f}x".format(name, etree * 1e3, lxml * 1e3, etree / lxml))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+####
+# This script measures how long it takes to decode each list fixture in test/assets
+# the way an endpoint's get() does: namespace detection, pagination and then the model.
+#
+# "separate" gives every parser its own copy of the body, which is how responses were
+# handled before they were shared, so each one parses the XML again. "shared" passes
+# the same body to all of them so it is parsed once.
+#
+# Run with tableauserverclient installed (pip install -e .):
+#   python benchmarks/xml_parse_once.py --scale 1000
+####
+
+import argparse
+import timeit
+
+import tableauserverclient as TSC
+from tableauserverclient.namespace import Namespace
+
+from _fixtures import list_fixtures, scale_fixture
+
+
+def decode(content, model, shared):
+    # A fresh copy per call so nothing is left over from the previous run
+    bodies = [bytes(bytearray(content))] * 3 if shared else [bytes(bytearray(content)) for _ in range(3)]
+    namespace = Namespace()
+    namespace.detect(bodies[0])
+    TSC.PaginationItem.from_response(bodies[1], namespace())
+    model.from_response(bodies[2], namespace())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time decoding list responses with and without a shared parse.')
+    parser.add_argument('--scale', type=int, default=1000, help='number of items to scale each fixture up to')
+    parser.add_argument('--repeat', type=int, default=5, help='best of N runs')
+    args = parser.parse_args()
+
+    print("{:<45} {:>14} {:>14} {:>8}".format('fixture', 'separate ms', 'shared ms', 'saving'))
+    for name, model, content in list_fixtures():
+        content = scale_fixture(content, args.scale)
+        separate = min(timeit.repeat(lambda: decode(content, model, False), number=1, repeat=args.repeat))
+        shared = min(timeit.repeat(lambda: decode(content, model, True), number=1, repeat=args.repeat))
+        saving = (1 - shared / separate) * 100
+        print("{:<45} {:>14.2f} {:>14.2f} {:>7.0f}%".format(name, separate * 1e3, shared * 1e3, saving))
+
+
+if __name__ == '__main__':
+    main()
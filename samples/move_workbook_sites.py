@@ -36,13 +36,11 @@ def main():
     logging_level = getattr(logging, args.logging_level.upper())
     logging.basicConfig(level=logging_level)
 
-    # Step 1: Sign in to both sites on server
+    # Step 1: Sign in to both sites on server. The pool signs into each site the first time it is used.
     tableau_auth = TSC.TableauAuth(args.username, password)
 
-    source_server = TSC.Server(args.server)
-    dest_server = TSC.Server(args.server)
-
-    with source_server.auth.sign_in(tableau_auth):
+    with TSC.SitePool(args.server, tableau_auth) as pool:
+        source_server = pool.server(tableau_auth.site_id)
         # Step 2: Query workbook to move
         req_option = TSC.RequestOptions()
         req_option.filter.add(TSC.Filter(TSC.RequestOptions.Field.Name,
@@ -65,18 +63,14 @@ def main():
                     error = "No site named {} found.".format(args.destination_site)
                     raise LookupError(error)
 
-                tableau_auth.site_id = args.destination_site
-
-                # Signing into another site requires another server object
-                # because of the different auth token and site ID.
-                with dest_server.auth.sign_in(tableau_auth):
+                dest_server = pool.server(args.destination_site)
 
-                    # Step 5: Create a new workbook item and publish workbook. Note that
-                    # an empty project_id will publish to the 'Default' project.
-                    new_workbook = TSC.WorkbookItem(name=args.workbook_name, project_id="")
-                    new_workbook = dest_server.workbooks.publish(new_workbook, workbook_path,
-                                                                 mode=TSC.Server.PublishMode.Overwrite)
-                    print("Successfully moved {0} ({1})".format(new_workbook.name, new_workbook.id))
+                # Step 5: Create a new workbook item and publish workbook. Note that
+                # an empty project_id will publish to the 'Default' project.
+                new_workbook = TSC.WorkbookItem(name=args.workbook_name, project_id="")
+                new_workbook = dest_server.workbooks.publish(new_workbook, workbook_path,
+                                                             mode=TSC.Server.PublishMode.Overwrite)
+                print("Successfully moved {0} ({1})".format(new_workbook.name, new_workbook.id))
 
                 # Step 6: Delete workbook from source site and delete temp directory
                 source_server.workbooks.delete(all_workbooks[0].id)
@@ -66,6 +66,12 @@ def main():
         # >>> request_options = TSC.RequestOptions(pagesize=1000)
         # >>> all_workbooks = list(TSC.Pager(server.workbooks, request_options))
 
+        # On large sites most of the time is spent waiting on Server. Pager can request
+        # the next few pages in the background while you work through the current one.
+        # Items are still returned in order.
+
+        # >>> all_workbooks = list(TSC.Pager(server.workbooks, request_options, prefetch=4, workers=8))
+
 
 if __name__ == '__main__':
     main()
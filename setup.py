@@ -34,6 +34,10 @@ setup(
     install_requires=[
         'requests>=2.11,<3.0',
     ],
+    extras_require={
+        'lxml': ['lxml'],
+        'httpx': ['httpx[http2]'],
+    },
     tests_require=[
         'requests-mock>=1.0,<2.0',
         'pytest',
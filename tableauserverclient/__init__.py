@@ -6,7 +6,10 @@ from .models import ConnectionCredentials, ConnectionItem, DataAlertItem, Dataso
     SubscriptionItem, Target, PermissionsRule, Permission, DatabaseItem, TableItem, ColumnItem, FlowItem, \
     WebhookItem, PersonalAccessTokenAuth
 from .server import RequestOptions, CSVRequestOptions, ImageRequestOptions, PDFRequestOptions, Filter, Sort, \
-    Server, ServerResponseError, MissingRequiredFieldError, NotSignedInError, Pager
+    Server, ServerHandle, ServerResponseError, MissingRequiredFieldError, NotSignedInError, Pager, \
+    AsyncServer, ThreadedAsyncServer, AsyncPager, RetryPolicy, RateLimiter, ConcurrencyGovernor, LoadBalancer, \
+    HedgePolicy, MetricsCollector, Transport, RequestsTransport, Urllib3Transport, HttpxTransport, \
+    AsyncHttpxTransport, ServerInfoCache, TokenStore, FileTokenStore, SitePool, PersonalAccessTokenPool
 from ._version import get_versions
 __version__ = get_versions()['version']
 __VERSION__ = __version__
@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall
 
 from .property_decorators import property_not_empty
 
@@ -47,8 +47,8 @@ class ColumnItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_column_items = list()
-        parsed_response = ET.fromstring(resp)
-        all_column_xml = parsed_response.findall('.//t:column', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_column_xml = findall(parsed_response, './/t:column', ns)
 
         for column_xml in all_column_xml:
             (id, name, description, remote_type) = cls._parse_element(column_xml, ns)
@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall, find_child
 from .connection_credentials import ConnectionCredentials
 
 
@@ -40,8 +40,8 @@ class ConnectionItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_connection_items = list()
-        parsed_response = ET.fromstring(resp)
-        all_connection_xml = parsed_response.findall('.//t:connection', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_connection_xml = findall(parsed_response, './/t:connection', ns)
         for connection_xml in all_connection_xml:
             connection_item = cls()
             connection_item._id = connection_xml.get('id', None)
@@ -50,7 +50,7 @@ class ConnectionItem(object):
             connection_item.server_address = connection_xml.get('serverAddress', None)
             connection_item.server_port = connection_xml.get('serverPort', None)
             connection_item.username = connection_xml.get('userName', None)
-            datasource_elem = connection_xml.find('.//t:datasource', namespaces=ns)
+            datasource_elem = find_child(connection_xml, 'datasource', ns)
             if datasource_elem is not None:
                 connection_item._datasource_id = datasource_elem.get('id', None)
                 connection_item._datasource_name = datasource_elem.get('name', None)
@@ -70,7 +70,7 @@ class ConnectionItem(object):
         </connections>
         '''
         all_connection_items = list()
-        all_connection_xml = parsed_response.findall('.//t:connection', namespaces=ns)
+        all_connection_xml = findall(parsed_response, './/t:connection', ns)
 
         for connection_xml in all_connection_xml:
             connection_item = cls()
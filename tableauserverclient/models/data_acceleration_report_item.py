@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall
 
 
 class DataAccelerationReportItem(object):
@@ -58,8 +58,8 @@ class DataAccelerationReportItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         comparison_records = list()
-        parsed_response = ET.fromstring(resp)
-        all_comparison_records_xml = parsed_response.findall('.//t:comparisonRecord', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_comparison_records_xml = findall(parsed_response, './/t:comparisonRecord', ns)
         for comparison_record_xml in all_comparison_records_xml:
             (site, sheet_uri, unaccelerated_session_count, avg_non_accelerated_plt,
              accelerated_session_count, avg_accelerated_plt) = cls._parse_element(comparison_record_xml, ns)
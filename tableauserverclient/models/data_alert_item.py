@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall
 
 from .property_decorators import property_not_empty, property_is_enum, property_is_boolean
 from .user_item import UserItem
@@ -154,8 +154,8 @@ class DataAlertItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_alert_items = list()
-        parsed_response = ET.fromstring(resp)
-        all_alert_xml = parsed_response.findall('.//t:dataAlert', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_alert_xml = findall(parsed_response, './/t:dataAlert', ns)
 
         for alert_xml in all_alert_xml:
             kwargs = cls._parse_element(alert_xml, ns)
@@ -176,22 +176,22 @@ class DataAlertItem(object):
         kwargs['frequency'] = alert_xml.get('frequency', None)
         kwargs['public'] = alert_xml.get('public', None)
 
-        owner = alert_xml.findall('.//t:owner', namespaces=ns)[0]
+        owner = findall(alert_xml, './/t:owner', ns)[0]
         kwargs['owner_id'] = owner.get('id', None)
         kwargs['owner_name'] = owner.get('name', None)
 
-        view_response = alert_xml.findall('.//t:view', namespaces=ns)[0]
+        view_response = findall(alert_xml, './/t:view', ns)[0]
         kwargs['view_id'] = view_response.get('id', None)
         kwargs['view_name'] = view_response.get('name', None)
 
-        workbook_response = view_response.findall('.//t:workbook', namespaces=ns)[0]
+        workbook_response = findall(view_response, './/t:workbook', ns)[0]
         kwargs['workbook_id'] = workbook_response.get('id', None)
         kwargs['workbook_name'] = workbook_response.get('name', None)
-        project_response = view_response.findall('.//t:project', namespaces=ns)[0]
+        project_response = findall(view_response, './/t:project', ns)[0]
         kwargs['project_id'] = project_response.get('id', None)
         kwargs['project_name'] = project_response.get('name', None)
 
-        recipients = alert_xml.findall('.//t:recipient', namespaces=ns)
+        recipients = findall(alert_xml, './/t:recipient', ns)
         kwargs['recipients'] = [recipient.get('id', None) for recipient in recipients]
 
         return kwargs
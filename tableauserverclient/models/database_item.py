@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall, find_child
 
 from .property_decorators import property_is_enum, property_not_empty, property_is_boolean
 from .exceptions import UnpopulatedPropertyError
@@ -234,8 +234,8 @@ class DatabaseItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_database_items = list()
-        parsed_response = ET.fromstring(resp)
-        all_database_xml = parsed_response.findall('.//t:database', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_database_xml = findall(parsed_response, './/t:database', ns)
 
         for database_xml in all_database_xml:
             parsed_database = cls._parse_element(database_xml, ns)
@@ -246,10 +246,10 @@ class DatabaseItem(object):
 
     @staticmethod
     def _parse_element(database_xml, ns):
-        database_values = database_xml.attrib.copy()
-        contact = database_xml.find('.//t:contact', namespaces=ns)
+        database_values = dict(database_xml.attrib)
+        contact = find_child(database_xml, 'contact', ns)
         if contact is not None:
-            database_values['contact'] = contact.attrib.copy()
+            database_values['contact'] = dict(contact.attrib)
         return database_values
 
 
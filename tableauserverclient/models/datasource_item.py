@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, iselement, findall, find_child
 from .exceptions import UnpopulatedPropertyError
 from .property_decorators import property_not_nullable, property_is_boolean, property_is_enum
 from .tag_item import TagItem
@@ -143,8 +143,8 @@ class DatasourceItem(object):
         self._permissions = permissions
 
     def _parse_common_elements(self, datasource_xml, ns):
-        if not isinstance(datasource_xml, ET.Element):
-            datasource_xml = ET.fromstring(datasource_xml).find('.//t:datasource', namespaces=ns)
+        if not iselement(datasource_xml):
+            datasource_xml = fromstring(datasource_xml).find('.//t:datasource', namespaces=ns)
         if datasource_xml is not None:
             (ask_data_enablement, certified, certification_note, _, _, _, _, encrypt_extracts, has_extracts,
              _, _, owner_id, project_id, project_name, _, updated_at, use_remote_query_agent,
@@ -197,8 +197,8 @@ class DatasourceItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_datasource_items = list()
-        parsed_response = ET.fromstring(resp)
-        all_datasource_xml = parsed_response.findall('.//t:datasource', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_datasource_xml = findall(parsed_response, './/t:datasource', ns)
 
         for datasource_xml in all_datasource_xml:
             (ask_data_enablement, certified, certification_note, content_url, created_at, datasource_type,
@@ -229,24 +229,24 @@ class DatasourceItem(object):
         webpage_url = datasource_xml.get('webpageUrl', None)
 
         tags = None
-        tags_elem = datasource_xml.find('.//t:tags', namespaces=ns)
+        tags_elem = find_child(datasource_xml, 'tags', ns)
         if tags_elem is not None:
             tags = TagItem.from_xml_element(tags_elem, ns)
 
         project_id = None
         project_name = None
-        project_elem = datasource_xml.find('.//t:project', namespaces=ns)
+        project_elem = find_child(datasource_xml, 'project', ns)
         if project_elem is not None:
             project_id = project_elem.get('id', None)
             project_name = project_elem.get('name', None)
 
         owner_id = None
-        owner_elem = datasource_xml.find('.//t:owner', namespaces=ns)
+        owner_elem = find_child(datasource_xml, 'owner', ns)
         if owner_elem is not None:
             owner_id = owner_elem.get('id', None)
 
         ask_data_enablement = None
-        ask_data_elem = datasource_xml.find('.//t:askData', namespaces=ns)
+        ask_data_elem = find_child(datasource_xml, 'askData', ns)
         if ask_data_elem is not None:
             ask_data_enablement = ask_data_elem.get('enablement', None)
 
@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, iselement, findall, find_child
 from .exceptions import UnpopulatedPropertyError
 from .property_decorators import property_not_nullable
 from .tag_item import TagItem
@@ -85,8 +85,8 @@ class FlowItem(object):
         self._permissions = permissions
 
     def _parse_common_elements(self, flow_xml, ns):
-        if not isinstance(flow_xml, ET.Element):
-            flow_xml = ET.fromstring(flow_xml).find('.//t:flow', namespaces=ns)
+        if not iselement(flow_xml):
+            flow_xml = fromstring(flow_xml).find('.//t:flow', namespaces=ns)
         if flow_xml is not None:
             (_, _, _, _, _, updated_at, _, project_id, project_name, owner_id) = self._parse_element(flow_xml, ns)
             self._set_values(None, None, None, None, None, updated_at, None, project_id,
@@ -120,8 +120,8 @@ class FlowItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_flow_items = list()
-        parsed_response = ET.fromstring(resp)
-        all_flow_xml = parsed_response.findall('.//t:flow', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_flow_xml = findall(parsed_response, './/t:flow', ns)
 
         for flow_xml in all_flow_xml:
             (id_, name, description, webpage_url, created_at, updated_at,
@@ -142,19 +142,19 @@ class FlowItem(object):
         updated_at = parse_datetime(flow_xml.get('updatedAt', None))
 
         tags = None
-        tags_elem = flow_xml.find('.//t:tags', namespaces=ns)
+        tags_elem = find_child(flow_xml, 'tags', ns)
         if tags_elem is not None:
             tags = TagItem.from_xml_element(tags_elem, ns)
 
         project_id = None
         project_name = None
-        project_elem = flow_xml.find('.//t:project', namespaces=ns)
+        project_elem = find_child(flow_xml, 'project', ns)
         if project_elem is not None:
             project_id = project_elem.get('id', None)
             project_name = project_elem.get('name', None)
 
         owner_id = None
-        owner_elem = flow_xml.find('.//t:owner', namespaces=ns)
+        owner_elem = find_child(flow_xml, 'owner', ns)
         if owner_elem is not None:
             owner_id = owner_elem.get('id', None)
 
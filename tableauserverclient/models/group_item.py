@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall, find_child
 from .exceptions import UnpopulatedPropertyError
 from .property_decorators import property_not_empty, property_is_enum
 from .reference_item import ResourceReference
@@ -73,14 +73,14 @@ class GroupItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_group_items = list()
-        parsed_response = ET.fromstring(resp)
-        all_group_xml = parsed_response.findall('.//t:group', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_group_xml = findall(parsed_response, './/t:group', ns)
         for group_xml in all_group_xml:
             name = group_xml.get('name', None)
             group_item = cls(name)
             group_item._id = group_xml.get('id', None)
             # AD groups have an extra element under this
-            import_elem = group_xml.find('.//t:import', namespaces=ns)
+            import_elem = find_child(group_xml, 'import', ns)
             if (import_elem is not None):
                 group_item.domain_name = import_elem.get('domainName')
                 group_item.license_mode = import_elem.get('grantLicenseMode')
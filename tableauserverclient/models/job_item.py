@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall
 from ..datetime_helpers import parse_datetime
 
 
@@ -62,9 +62,8 @@ class JobItem(object):
 
     @classmethod
     def from_response(cls, xml, ns):
-        parsed_response = ET.fromstring(xml)
-        all_tasks_xml = parsed_response.findall(
-            './/t:job', namespaces=ns)
+        parsed_response = fromstring(xml)
+        all_tasks_xml = findall(parsed_response, './/t:job', ns)
 
         all_tasks = [JobItem._parse_element(x, ns) for x in all_tasks_xml]
 
@@ -80,7 +79,7 @@ class JobItem(object):
         completed_at = parse_datetime(element.get('completedAt', None))
         finish_code = element.get('finishCode', -1)
         notes = [note.text for note in
-                 element.findall('.//t:notes', namespaces=ns)] or None
+                 findall(element, './/t:notes', ns)] or None
         mode = element.get('mode', None)
         return cls(id_, type_, progress, created_at, started_at, completed_at, finish_code, notes, mode)
 
@@ -149,9 +148,8 @@ class BackgroundJobItem(object):
 
     @classmethod
     def from_response(cls, xml, ns):
-        parsed_response = ET.fromstring(xml)
-        all_tasks_xml = parsed_response.findall(
-            './/t:backgroundJob', namespaces=ns)
+        parsed_response = fromstring(xml)
+        all_tasks_xml = findall(parsed_response, './/t:backgroundJob', ns)
         return [cls._parse_element(x, ns) for x in all_tasks_xml]
 
     @classmethod
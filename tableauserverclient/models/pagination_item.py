@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, find
 
 
 class PaginationItem(object):
@@ -21,8 +21,8 @@ class PaginationItem(object):
 
     @classmethod
     def from_response(cls, resp, ns):
-        parsed_response = ET.fromstring(resp)
-        pagination_xml = parsed_response.find('t:pagination', namespaces=ns)
+        parsed_response = fromstring(resp)
+        pagination_xml = find(parsed_response, 't:pagination', ns)
         pagination_item = cls()
         if pagination_xml is not None:
             pagination_item._page_number = int(pagination_xml.get('pageNumber', '-1'))
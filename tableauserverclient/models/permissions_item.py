@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall
 import logging
 
 from .exceptions import UnknownGranteeTypeError
@@ -50,11 +50,10 @@ class PermissionsRule(object):
 
     @classmethod
     def from_response(cls, resp, ns=None):
-        parsed_response = ET.fromstring(resp)
+        parsed_response = fromstring(resp)
 
         rules = []
-        permissions_rules_list_xml = parsed_response.findall('.//t:granteeCapabilities',
-                                                             namespaces=ns)
+        permissions_rules_list_xml = findall(parsed_response, './/t:granteeCapabilities', ns)
 
         for grantee_capability_xml in permissions_rules_list_xml:
             capability_dict = {}
@@ -79,7 +78,7 @@ class PermissionsRule(object):
         """Use Xpath magic and some string splitting to get the right object type from the xml"""
 
         # Get the first element in the tree with an 'id' attribute
-        grantee_element = grantee_capability_xml.findall('.//*[@id]', namespaces=ns).pop()
+        grantee_element = findall(grantee_capability_xml, './/*[@id]', ns).pop()
         grantee_id = grantee_element.get('id', None)
         grantee_type = grantee_element.tag.split('}').pop()
 
@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, iselement, findall
 
 from .permissions_item import Permission
 
@@ -78,8 +78,8 @@ class ProjectItem(object):
         return self.name.lower() == 'default'
 
     def _parse_common_tags(self, project_xml, ns):
-        if not isinstance(project_xml, ET.Element):
-            project_xml = ET.fromstring(project_xml).find('.//t:project', namespaces=ns)
+        if not iselement(project_xml):
+            project_xml = fromstring(project_xml).find('.//t:project', namespaces=ns)
 
         if project_xml is not None:
             (_, name, description, content_permissions, parent_id) = self._parse_element(project_xml)
@@ -107,8 +107,8 @@ class ProjectItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_project_items = list()
-        parsed_response = ET.fromstring(resp)
-        all_project_xml = parsed_response.findall('.//t:project', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_project_xml = findall(parsed_response, './/t:project', ns)
 
         for project_xml in all_project_xml:
             (id, name, description, content_permissions, parent_id) = cls._parse_element(project_xml)
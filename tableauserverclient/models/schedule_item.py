@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, iselement, findall, find_child
 from datetime import datetime
 
 from .interval_item import IntervalItem, HourlyInterval, DailyInterval, WeeklyInterval, MonthlyInterval
@@ -108,8 +108,8 @@ class ScheduleItem(object):
         return self._warnings
 
     def _parse_common_tags(self, schedule_xml, ns):
-        if not isinstance(schedule_xml, ET.Element):
-            schedule_xml = ET.fromstring(schedule_xml).find('.//t:schedule', namespaces=ns)
+        if not iselement(schedule_xml):
+            schedule_xml = fromstring(schedule_xml).find('.//t:schedule', namespaces=ns)
         if schedule_xml is not None:
             (_, name, _, _, updated_at, _, next_run_at, end_schedule_at, execution_order,
              priority, interval_item) = self._parse_element(schedule_xml, ns)
@@ -157,7 +157,7 @@ class ScheduleItem(object):
 
     @classmethod
     def from_response(cls, resp, ns):
-        parsed_response = ET.fromstring(resp)
+        parsed_response = fromstring(resp)
         return cls.from_element(parsed_response, ns)
 
     @classmethod
@@ -165,7 +165,7 @@ class ScheduleItem(object):
         warnings = cls._read_warnings(parsed_response, ns)
 
         all_schedule_items = []
-        all_schedule_xml = parsed_response.findall('.//t:schedule', namespaces=ns)
+        all_schedule_xml = findall(parsed_response, './/t:schedule', ns)
         for schedule_xml in all_schedule_xml:
             (id_, name, state, created_at, updated_at, schedule_type, next_run_at,
              end_schedule_at, execution_order, priority, interval_item) = cls._parse_element(schedule_xml, ns)
@@ -195,7 +195,7 @@ class ScheduleItem(object):
         end_time = parsed_response.get("end", None)
         if end_time is not None:
             end_time = datetime.strptime(end_time, "%H:%M:%S").time()
-        interval_elems = parsed_response.findall(".//t:intervals/t:interval", namespaces=ns)
+        interval_elems = findall(parsed_response, ".//t:intervals/t:interval", ns)
         interval = []
         for interval_elem in interval_elems:
             interval.extend(interval_elem.attrib.items())
@@ -239,7 +239,7 @@ class ScheduleItem(object):
             priority = int(priority)
 
         interval_item = None
-        frequency_detail_elem = schedule_xml.find('.//t:frequencyDetails', namespaces=ns)
+        frequency_detail_elem = find_child(schedule_xml, 'frequencyDetails', ns)
         if frequency_detail_elem is not None:
             interval_item = ScheduleItem._parse_interval_item(frequency_detail_elem, frequency, ns)
 
@@ -248,9 +248,9 @@ class ScheduleItem(object):
 
     @staticmethod
     def parse_add_to_schedule_response(response, ns):
-        parsed_response = ET.fromstring(response.content)
+        parsed_response = fromstring(response.parsed_response)
         warnings = ScheduleItem._read_warnings(parsed_response, ns)
-        all_task_xml = parsed_response.findall('.//t:task', namespaces=ns)
+        all_task_xml = findall(parsed_response, './/t:task', ns)
 
         error = "Status {}: {}".format(response.status_code, response.reason) \
             if response.status_code < 200 or response.status_code >= 300 else None
@@ -259,7 +259,7 @@ class ScheduleItem(object):
 
     @staticmethod
     def _read_warnings(parsed_response, ns):
-        all_warning_xml = parsed_response.findall('.//t:warning', namespaces=ns)
+        all_warning_xml = findall(parsed_response, './/t:warning', ns)
         warnings = list() if len(all_warning_xml) > 0 else None
         for warning_xml in all_warning_xml:
             warnings.append(warning_xml.get('message', None))
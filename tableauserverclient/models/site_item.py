@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, iselement, findall, find_child
 from .property_decorators import (property_is_enum, property_is_boolean, property_matches,
                                   property_not_empty, property_not_nullable, property_is_int)
 
@@ -154,8 +154,8 @@ class SiteItem(object):
         return self.name.lower() == 'default'
 
     def _parse_common_tags(self, site_xml, ns):
-        if not isinstance(site_xml, ET.Element):
-            site_xml = ET.fromstring(site_xml).find('.//t:site', namespaces=ns)
+        if not iselement(site_xml):
+            site_xml = fromstring(site_xml).find('.//t:site', namespaces=ns)
         if site_xml is not None:
             (_, name, content_url, _, admin_mode, state,
              subscribe_others_enabled, disable_subscriptions, revision_history_enabled,
@@ -210,8 +210,8 @@ class SiteItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_site_items = list()
-        parsed_response = ET.fromstring(resp)
-        all_site_xml = parsed_response.findall('.//t:site', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_site_xml = findall(parsed_response, './/t:site', ns)
         for site_xml in all_site_xml:
             (id, name, content_url, status_reason, admin_mode, state, subscribe_others_enabled,
                 disable_subscriptions, revision_history_enabled, user_quota, storage_quota,
@@ -252,7 +252,7 @@ class SiteItem(object):
 
         num_users = None
         storage = None
-        usage_elem = site_xml.find('.//t:usage', namespaces=ns)
+        usage_elem = find_child(site_xml, 'usage', ns)
         if usage_elem is not None:
             num_users = usage_elem.get('numUsers', None)
             storage = usage_elem.get('storage', None)
@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall, find_child
 from .target import Target
 
 
@@ -24,9 +24,8 @@ class SubscriptionItem(object):
 
     @classmethod
     def from_response(cls, xml, ns):
-        parsed_response = ET.fromstring(xml)
-        all_subscriptions_xml = parsed_response.findall(
-            './/t:subscription', namespaces=ns)
+        parsed_response = fromstring(xml)
+        all_subscriptions_xml = findall(parsed_response, './/t:subscription', ns)
 
         all_subscriptions = [SubscriptionItem._parse_element(x, ns) for x in all_subscriptions_xml]
         return all_subscriptions
@@ -36,9 +35,9 @@ class SubscriptionItem(object):
         schedule_id = None
         target = None
 
-        schedule_element = element.find('.//t:schedule', namespaces=ns)
-        content_element = element.find('.//t:content', namespaces=ns)
-        user_element = element.find('.//t:user', namespaces=ns)
+        schedule_element = find_child(element, 'schedule', ns)
+        content_element = find_child(element, 'content', ns)
+        user_element = find_child(element, 'user', ns)
 
         if schedule_element is not None:
             schedule_id = schedule_element.get('id', None)
@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall, find_child
 
 from .property_decorators import property_not_empty, property_is_boolean
 from .exceptions import UnpopulatedPropertyError
@@ -117,8 +117,8 @@ class TableItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_table_items = list()
-        parsed_response = ET.fromstring(resp)
-        all_table_xml = parsed_response.findall('.//t:table', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_table_xml = findall(parsed_response, './/t:table', ns)
 
         for table_xml in all_table_xml:
             parsed_table = cls._parse_element(table_xml, ns)
@@ -130,11 +130,11 @@ class TableItem(object):
     @staticmethod
     def _parse_element(table_xml, ns):
 
-        table_values = table_xml.attrib.copy()
+        table_values = dict(table_xml.attrib)
 
-        contact = table_xml.find('.//t:contact', namespaces=ns)
+        contact = find_child(table_xml, 'contact', ns)
         if contact is not None:
-            table_values['contact'] = contact.attrib.copy()
+            table_values['contact'] = dict(contact.attrib)
 
         return table_values
 
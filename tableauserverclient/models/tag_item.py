@@ -1,15 +1,15 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall
 
 
 class TagItem(object):
     @classmethod
     def from_response(cls, resp, ns):
-        return cls.from_xml_element(ET.fromstring(resp), ns)
+        return cls.from_xml_element(fromstring(resp), ns)
 
     @classmethod
     def from_xml_element(cls, parsed_response, ns):
         all_tags = set()
-        tag_elem = parsed_response.findall('.//t:tag', namespaces=ns)
+        tag_elem = findall(parsed_response, './/t:tag', ns)
         for tag_xml in tag_elem:
             tag = tag_xml.get('label', None)
             if tag is not None:
@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall
 from .target import Target
 from .schedule_item import ScheduleItem
 from ..datetime_helpers import parse_datetime
@@ -26,9 +26,8 @@ class TaskItem(object):
 
     @classmethod
     def from_response(cls, xml, ns, task_type=Type.ExtractRefresh):
-        parsed_response = ET.fromstring(xml)
-        all_tasks_xml = parsed_response.findall(
-            './/t:task/t:{}'.format(task_type), namespaces=ns)
+        parsed_response = fromstring(xml)
+        all_tasks_xml = findall(parsed_response, './/t:task/t:{}'.format(task_type), ns)
 
         all_tasks = (TaskItem._parse_element(x, ns) for x in all_tasks_xml)
 
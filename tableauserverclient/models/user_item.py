@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, iselement, findall, find_child
 from .exceptions import UnpopulatedPropertyError
 from .property_decorators import property_is_enum, property_not_empty, property_not_nullable
 from ..datetime_helpers import parse_datetime
@@ -114,8 +114,8 @@ class UserItem(object):
         self._workbooks = workbooks
 
     def _parse_common_tags(self, user_xml, ns):
-        if not isinstance(user_xml, ET.Element):
-            user_xml = ET.fromstring(user_xml).find('.//t:user', namespaces=ns)
+        if not iselement(user_xml):
+            user_xml = fromstring(user_xml).find('.//t:user', namespaces=ns)
         if user_xml is not None:
             (_, _, site_role, _, _, fullname, email, auth_setting, _) = self._parse_element(user_xml, ns)
             self._set_values(None, None, site_role, None, None, fullname, email, auth_setting, None)
@@ -145,8 +145,8 @@ class UserItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_user_items = []
-        parsed_response = ET.fromstring(resp)
-        all_user_xml = parsed_response.findall('.//t:user', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_user_xml = findall(parsed_response, './/t:user', ns)
         for user_xml in all_user_xml:
             (id, name, site_role, last_login, external_auth_user_id,
              fullname, email, auth_setting, domain_name) = cls._parse_element(user_xml, ns)
@@ -172,7 +172,7 @@ class UserItem(object):
         auth_setting = user_xml.get('authSetting', None)
 
         domain_name = None
-        domain_elem = user_xml.find('.//t:domain', namespaces=ns)
+        domain_elem = find_child(user_xml, 'domain', ns)
         if domain_elem is not None:
             domain_name = domain_elem.get('name', None)
 
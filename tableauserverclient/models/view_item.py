@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall, find_child
 from ..datetime_helpers import parse_datetime
 from .exceptions import UnpopulatedPropertyError
 from .tag_item import TagItem
@@ -120,19 +120,19 @@ class ViewItem(object):
 
     @classmethod
     def from_response(cls, resp, ns, workbook_id=''):
-        return cls.from_xml_element(ET.fromstring(resp), ns, workbook_id)
+        return cls.from_xml_element(fromstring(resp), ns, workbook_id)
 
     @classmethod
     def from_xml_element(cls, parsed_response, ns, workbook_id=''):
         all_view_items = list()
-        all_view_xml = parsed_response.findall('.//t:view', namespaces=ns)
+        all_view_xml = findall(parsed_response, './/t:view', ns)
         for view_xml in all_view_xml:
             view_item = cls()
-            usage_elem = view_xml.find('.//t:usage', namespaces=ns)
-            workbook_elem = view_xml.find('.//t:workbook', namespaces=ns)
-            owner_elem = view_xml.find('.//t:owner', namespaces=ns)
-            project_elem = view_xml.find('.//t:project', namespaces=ns)
-            tags_elem = view_xml.find('.//t:tags', namespaces=ns)
+            usage_elem = find_child(view_xml, 'usage', ns)
+            workbook_elem = find_child(view_xml, 'workbook', ns)
+            owner_elem = find_child(view_xml, 'owner', ns)
+            project_elem = find_child(view_xml, 'project', ns)
+            tags_elem = find_child(view_xml, 'tags', ns)
             view_item._created_at = parse_datetime(view_xml.get('createdAt', None))
             view_item._updated_at = parse_datetime(view_xml.get('updatedAt', None))
             view_item._id = view_xml.get('id', None)
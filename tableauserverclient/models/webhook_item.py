@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, findall, find_child
 
 import re
 
@@ -49,8 +49,8 @@ class WebhookItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_webhooks_items = list()
-        parsed_response = ET.fromstring(resp)
-        all_webhooks_xml = parsed_response.findall('.//t:webhook', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_webhooks_xml = findall(parsed_response, './/t:webhook', ns)
         for webhook_xml in all_webhooks_xml:
             values = cls._parse_element(webhook_xml, ns)
 
@@ -69,12 +69,12 @@ class WebhookItem(object):
         if url_tag is not None:
             url = url_tag.get('url', None)
 
-        event = webhook_xml.findall('.//t:webhook-source/*', namespaces=ns)
+        event = findall(webhook_xml, './/t:webhook-source/*', ns)
         if event is not None and len(event) > 0:
             event = _parse_event(event)
 
         owner_id = None
-        owner_tag = webhook_xml.find('.//t:owner', namespaces=ns)
+        owner_tag = find_child(webhook_xml, 'owner', ns)
         if owner_tag is not None:
             owner_id = owner_tag.get('id', None)
 
@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as ET
+from ..xml_helpers import fromstring, iselement, findall, find_child
 from .exceptions import UnpopulatedPropertyError
 from .property_decorators import property_not_nullable, property_is_boolean, property_is_data_acceleration_config
 from .tag_item import TagItem
@@ -154,8 +154,8 @@ class WorkbookItem(object):
         self._preview_image = preview_image
 
     def _parse_common_tags(self, workbook_xml, ns):
-        if not isinstance(workbook_xml, ET.Element):
-            workbook_xml = ET.fromstring(workbook_xml).find('.//t:workbook', namespaces=ns)
+        if not iselement(workbook_xml):
+            workbook_xml = fromstring(workbook_xml).find('.//t:workbook', namespaces=ns)
         if workbook_xml is not None:
             (_, _, _, _, _, description, updated_at, _, show_tabs,
              project_id, project_name, owner_id, _, _,
@@ -205,8 +205,8 @@ class WorkbookItem(object):
     @classmethod
     def from_response(cls, resp, ns):
         all_workbook_items = list()
-        parsed_response = ET.fromstring(resp)
-        all_workbook_xml = parsed_response.findall('.//t:workbook', namespaces=ns)
+        parsed_response = fromstring(resp)
+        all_workbook_xml = findall(parsed_response, './/t:workbook', ns)
         for workbook_xml in all_workbook_xml:
             (id, name, content_url, webpage_url, created_at, description, updated_at, size, show_tabs,
              project_id, project_name, owner_id, tags, views,
@@ -237,30 +237,30 @@ class WorkbookItem(object):
 
         project_id = None
         project_name = None
-        project_tag = workbook_xml.find('.//t:project', namespaces=ns)
+        project_tag = find_child(workbook_xml, 'project', ns)
         if project_tag is not None:
             project_id = project_tag.get('id', None)
             project_name = project_tag.get('name', None)
 
         owner_id = None
-        owner_tag = workbook_xml.find('.//t:owner', namespaces=ns)
+        owner_tag = find_child(workbook_xml, 'owner', ns)
         if owner_tag is not None:
             owner_id = owner_tag.get('id', None)
 
         tags = None
-        tags_elem = workbook_xml.find('.//t:tags', namespaces=ns)
+        tags_elem = find_child(workbook_xml, 'tags', ns)
         if tags_elem is not None:
             all_tags = TagItem.from_xml_element(tags_elem, ns)
             tags = all_tags
 
         views = None
-        views_elem = workbook_xml.find('.//t:views', namespaces=ns)
+        views_elem = find_child(workbook_xml, 'views', ns)
         if views_elem is not None:
             views = ViewItem.from_xml_element(views_elem, ns)
 
         data_acceleration_config = {'acceleration_enabled': None, 'accelerate_now': None,
                                     'last_updated_at': None, 'acceleration_status': None}
-        data_acceleration_elem = workbook_xml.find('.//t:dataAccelerationConfig', namespaces=ns)
+        data_acceleration_elem = find_child(workbook_xml, 'dataAccelerationConfig', ns)
         if data_acceleration_elem is not None:
             data_acceleration_config = parse_data_acceleration_config(data_acceleration_elem)
 
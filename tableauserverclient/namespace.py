@@ -1,9 +1,9 @@
-from xml.etree import ElementTree as ET
-import re
+import threading
+
+from .xml_helpers import parse_response, NAMESPACE_RE
 
 OLD_NAMESPACE = 'http://tableausoftware.com/api'
 NEW_NAMESPACE = 'http://tableau.com/api'
-NAMESPACE_RE = re.compile(r'\{(.*?)\}')
 
 
 class UnknownNamespaceError(Exception):
@@ -14,23 +14,51 @@ class Namespace(object):
     def __init__(self):
         self._namespace = {'t': NEW_NAMESPACE}
         self._detected = False
+        self._on_mismatch = None
+        self._lock = threading.Lock()
 
     def __call__(self):
         return self._namespace
 
+    def seed(self, namespace, on_mismatch=None):
+        """
+        Use a namespace known from an earlier session until the first response confirms it.
+        `on_mismatch` is called if that response is in another namespace.
+        """
+        self._namespace = {'t': namespace}
+        self._detected = False
+        self._on_mismatch = on_mismatch
+
+    def after_fork(self):
+        # Another thread of the parent may have held the lock when it forked
+        self._lock = threading.Lock()
+
     def detect(self, xml):
         if self._detected:
             return
 
-        if not xml.startswith(b'<?xml'):
+        parsed_response = parse_response(xml)
+        if not parsed_response.is_xml():
             return  # Not an xml file, don't detect anything
 
-        root = ET.fromstring(xml)
-        matches = NAMESPACE_RE.match(root.tag)
+        self.detect_tag(parsed_response.root.tag)
+
+    def detect_tag(self, tag):
+        if self._detected:
+            return
+
+        matches = NAMESPACE_RE.match(tag)
         if matches:
             detected_ns = matches.group(1)
             if detected_ns in (OLD_NAMESPACE, NEW_NAMESPACE):
-                self._namespace = {'t': detected_ns}
-                self._detected = True
+                with self._lock:
+                    if self._detected:
+                        return
+                    on_mismatch, self._on_mismatch = self._on_mismatch, None
+                    mismatch = on_mismatch is not None and detected_ns != self._namespace['t']
+                    self._namespace = {'t': detected_ns}
+                    self._detected = True
+                if mismatch:
+                    on_mismatch()
             else:
                 raise UnknownNamespaceError(detected_ns)
@@ -9,6 +9,19 @@ from .. import ConnectionItem, DataAlertItem, DatasourceItem, DatabaseItem, JobI
 from .endpoint import Auth, DataAlerts, Datasources, Endpoint, Groups, Projects, Schedules, \
     Sites, Tables, Users, Views, Workbooks, Subscriptions, ServerResponseError, \
     MissingRequiredFieldError, Flows, Favorites
-from .server import Server
+from .transport import Transport, RequestsTransport, Urllib3Transport, HttpxTransport, AsyncHttpxTransport
+from .server_info_cache import ServerInfoCache
+from .token_store import TokenStore, FileTokenStore
+from .server import Server, ServerHandle
 from .pager import Pager
+from .bulk import Bulk, BulkResult
+from .retry import RetryPolicy, RetryEvent
+from .rate_limit import RateLimiter
+from .concurrency import ConcurrencyGovernor
+from .load_balancer import LoadBalancer
+from .hedging import HedgePolicy
+from .instrumentation import MetricsCollector, RequestEvent, ResponseEvent
+from .async_server import AsyncServer, ThreadedAsyncServer, AsyncPager
+from .site_pool import SitePool
+from .personal_access_token_pool import PersonalAccessTokenPool
 from .exceptions import NotSignedInError
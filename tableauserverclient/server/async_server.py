@@ -0,0 +1,405 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import math
+import time
+
+import requests
+
+from .bulk import fetch_populated
+from .endpoint import Endpoint
+from .endpoint.endpoint import Success_codes
+from .instrumentation import RequestEvent, url_template, content_length, report_response
+from .request_factory import RequestFactory
+from .request_options import RequestOptions
+from .retry import RetryEvent
+from .server import Server
+from .transport import AsyncHttpxTransport
+from ..models import DatasourceItem, FlowItem, GroupItem, PaginationItem, ProjectItem, ServerInfoItem, SiteItem, \
+    UserItem, ViewItem, WorkbookItem
+from ..xml_helpers import fromstring, ParsedResponse
+
+
+def _running_loop():
+    # get_running_loop is new in Python 3.7, before that get_event_loop returns the running loop in a coroutine
+    return getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)()
+
+
+# The endpoints of an AsyncServer: the item they list, the API version they need and whether
+# they ask for all fields
+_QUERY_ENDPOINTS = {
+    'datasources': (DatasourceItem, '2.0', False),
+    'flows': (FlowItem, '3.3', False),
+    'groups': (GroupItem, '2.0', False),
+    'projects': (ProjectItem, '2.0', False),
+    'sites': (SiteItem, '2.0', False),
+    'users': (UserItem, '2.0', True),
+    'views': (ViewItem, '2.0', False),
+    'workbooks': (WorkbookItem, '2.0', False),
+}
+
+
+class AsyncEndpoint(object):
+    """
+    Endpoint of an AsyncServer. `get` and `get_by_id` are coroutines returning what the Server endpoint's
+    methods return. `get_by_id` is only available where the Server endpoint has one.
+    """
+
+    def __init__(self, async_server, endpoint, item_class, version='2.0', all_fields=False):
+        self._async_server = async_server
+        self._endpoint = endpoint
+        self._item_class = item_class
+        self._version = version
+        self._all_fields = all_fields
+
+    @property
+    def baseurl(self):
+        return self._endpoint.baseurl
+
+    async def get(self, req_options=None):
+        server = self._async_server.server
+        server.assert_at_least_version(self._version)
+        if self._all_fields:
+            if req_options is None:
+                req_options = RequestOptions()
+            req_options._all_fields = True
+        server_response = await self._async_server._request('GET', self.baseurl, request_object=req_options,
+                                                            auth_token=server.auth_token,
+                                                            rate_limiter=self._endpoint.rate_limiter)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, server.namespace)
+        all_items = self._item_class.from_response(server_response.parsed_response, server.namespace)
+        return all_items, pagination_item
+
+    async def get_by_id(self, item_id):
+        if not hasattr(self._endpoint, 'get_by_id'):
+            raise AttributeError("{0} has no get_by_id".format(type(self._endpoint).__name__))
+        if not item_id:
+            raise ValueError("ID undefined.")
+        server = self._async_server.server
+        server.assert_at_least_version(self._version)
+        url = "{0}/{1}".format(self.baseurl, item_id)
+        server_response = await self._async_server._request('GET', url, auth_token=server.auth_token,
+                                                            rate_limiter=self._endpoint.rate_limiter)
+        return self._item_class.from_response(server_response.parsed_response, server.namespace)[0]
+
+
+class AsyncAuth(object):
+    """
+    Auth endpoint of an AsyncServer, `sign_in` and `sign_out` are coroutines.
+    """
+
+    def __init__(self, async_server):
+        self._async_server = async_server
+        self._endpoint = async_server.server.auth
+        # Made on first use, so that it belongs to the running event loop
+        self._reauthenticate_lock = None
+
+    @property
+    def baseurl(self):
+        return self._endpoint.baseurl
+
+    async def sign_in(self, auth_req):
+        """
+        Signs in. The credentials are kept so that a session that expires is replaced by signing in again.
+        """
+        await self._sign_in(auth_req)
+        self._async_server.server._auth_request = auth_req
+
+    async def sign_in_with_personal_access_token(self, auth_req):
+        self._async_server.server.assert_at_least_version('3.6')
+        await self.sign_in(auth_req)
+
+    async def _sign_in(self, auth_req):
+        server = self._async_server.server
+        url = "{0}/{1}".format(self.baseurl, 'signin')
+        server_response = await self._async_server._request('POST', url, RequestFactory.Auth.signin_req(auth_req))
+        parsed_response = fromstring(server_response.parsed_response)
+        site_id = parsed_response.find('.//t:site', namespaces=server.namespace).get('id', None)
+        user_id = parsed_response.find('.//t:user', namespaces=server.namespace).get('id', None)
+        auth_token = parsed_response.find('t:credentials', namespaces=server.namespace).get('token', None)
+        server._set_auth(site_id, user_id, auth_token)
+
+    async def _reauthenticate(self, failed_token):
+        # See Auth._reauthenticate
+        server = self._async_server.server
+        auth_req = server._auth_request
+        if auth_req is None:
+            return None
+        if self._reauthenticate_lock is None:
+            self._reauthenticate_lock = asyncio.Lock()
+        async with self._reauthenticate_lock:
+            if server._auth_token == failed_token:
+                await self._sign_in(auth_req)
+            return server._auth_token
+
+    async def sign_out(self):
+        server = self._async_server.server
+        if not server.is_signed_in():
+            return
+        url = "{0}/{1}".format(self.baseurl, 'signout')
+        await self._async_server._request('POST', url, '', auth_token=server.auth_token)
+        server._clear_auth()
+        self._async_server.transport.clear_cookies()
+
+
+class AsyncServer(object):
+    """
+    asyncio client sending its requests on an `httpx.AsyncClient` (an AsyncHttpxTransport), so they are
+    awaited on the event loop and hundreds can be in flight from one thread:
+
+    >>> server = TSC.AsyncServer('https://tableau.example.com')
+    >>> await server.auth.sign_in(tableau_auth)
+    >>> all_workbooks, pagination_item = await server.workbooks.get()
+    >>> async for user in TSC.AsyncPager(server.users):
+    >>>     ...
+    >>> await server.close()
+
+    It covers signing in and out and the `get` and `get_by_id` methods of the datasources, flows, groups,
+    projects, sites, users, views and workbooks endpoints. The wrapped `Server` (`server.server`) holds the
+    version, session and http options, and its retry policy, rate limiters and request hooks apply to these
+    requests as well; its hedge policy, load balancer, concurrency governor and token store do not. Other
+    calls are made on the wrapped Server, which blocks, or on a ThreadedAsyncServer.
+    """
+
+    def __init__(self, server_address=None, server=None, transport=None):
+        if server is None:
+            if server_address is None:
+                raise ValueError("AsyncServer needs a server address or a Server to wrap.")
+            server = Server(server_address)
+        self._server = server
+        self.transport = transport if transport is not None else AsyncHttpxTransport()
+        self._owns_transport = transport is None
+        self.auth = AsyncAuth(self)
+        for name, (item_class, version, all_fields) in _QUERY_ENDPOINTS.items():
+            setattr(self, name, AsyncEndpoint(self, getattr(server, name), item_class, version, all_fields))
+
+    def __getattr__(self, name):
+        value = getattr(self._server, name)
+        if isinstance(value, Endpoint):
+            raise AttributeError("AsyncServer has no {0} endpoint, use server.server.{0} or a "
+                                 "ThreadedAsyncServer.".format(name))
+        return value
+
+    @property
+    def server(self):
+        return self._server
+
+    async def use_server_version(self):
+        """
+        As Server.use_server_version, without its server info cache and the fallback for servers older than 10.1.
+        """
+        url = "{0}/api/2.4/serverInfo".format(self._server.server_address)
+        server_response = await self._request('GET', url)
+        server_info = ServerInfoItem.from_response(server_response.parsed_response, self._server.namespace)
+        self._server.version = server_info.rest_api_version
+
+    async def _request(self, method, url, content=None, request_object=None, auth_token=None,
+                       content_type=None, rate_limiter=None):
+        # As Endpoint._make_request, awaiting the transport
+        server = self._server
+        parameters = dict()
+        if request_object is not None:
+            parameters['params'] = request_object.get_query_params()
+        parameters.update(server.http_options)
+        parameters['headers'] = Endpoint._make_common_headers(auth_token, content_type)
+        parameters['headers']['accept-encoding'] = server.accept_encoding
+        if content is not None:
+            parameters['data'] = content
+
+        rate_limiters = [limiter for limiter in (server.rate_limiter, rate_limiter) if limiter is not None]
+        server_response = await self._send(method, url, parameters, rate_limiters)
+        if server_response.status_code == 401 and auth_token is not None:
+            new_token = await self.auth._reauthenticate(auth_token)
+            if new_token is not None and new_token != auth_token:
+                parameters['headers']['x-tableau-auth'] = new_token
+                server_response = await self._send(method, url, parameters, rate_limiters)
+
+        parsed_response = ParsedResponse(server_response.content)
+        server._namespace.detect(parsed_response)
+        server.auth._check_status(server_response, parsed_response)
+        server_response.parsed_response = parsed_response
+        return server_response
+
+    async def _send(self, method, url, parameters, rate_limiters=()):
+        retry_policy = self._server.retry_policy
+        started = time.time()
+        attempt = 0
+        while True:
+            attempt += 1
+            for limiter in rate_limiters:
+                await asyncio.sleep(limiter.reserve())
+            try:
+                server_response = await self._call(method, url, parameters)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not retry_policy.is_retryable(method, attempt, error=e):
+                    raise
+                status_code, error = None, e
+                delay = retry_policy.get_delay(attempt)
+            else:
+                status_code, error = server_response.status_code, None
+                if status_code in Success_codes or not retry_policy.is_retryable(method, attempt, status_code):
+                    return server_response
+                delay = retry_policy.get_delay(attempt, server_response)
+            retry_policy.before_retry(RetryEvent(method, url, attempt, status_code, error, delay,
+                                                 time.time() - started))
+            await asyncio.sleep(delay)
+
+    async def _call(self, method, url, parameters):
+        before_hooks, after_hooks = self._server.request_hooks
+        if not before_hooks and not after_hooks:
+            return await self.transport.request(method, url, **parameters)
+
+        request = RequestEvent(method, url_template(url), url, content_length(parameters.get('data')))
+        for hook in before_hooks:
+            hook(request)
+        started = time.time()
+        try:
+            server_response = await self.transport.request(method, url, **parameters)
+        except Exception as e:
+            report_response(after_hooks, request, started, None, e)
+            raise
+        report_response(after_hooks, request, started, server_response)
+        return server_response
+
+    async def close(self):
+        """
+        Closes the connections of the transport, unless it was passed in, and the wrapped Server.
+        """
+        if self._owns_transport:
+            await self.transport.close()
+        self._server.close()
+
+
+class ThreadedAsyncEndpoint(object):
+    """
+    Awaitable version of a Server endpoint. Every method of the wrapped endpoint can be awaited,
+    the blocking call runs on the ThreadedAsyncServer's thread pool so the event loop is not blocked.
+
+    `populate_*` methods fetch their content straight away, so reading the populated property
+    afterwards (e.g. `workbook.connections`) does not make a blocking request.
+    """
+
+    def __init__(self, endpoint, async_server):
+        self._endpoint = endpoint
+        self._async_server = async_server
+
+    def __getattr__(self, name):
+        attr = getattr(self._endpoint, name)
+        if not callable(attr):
+            return attr
+        if name.startswith('populate_'):
+            return partial(self._async_server._run, fetch_populated, attr)
+        return partial(self._async_server._run, attr)
+
+
+class ThreadedAsyncServer(object):
+    """
+    asyncio front end for `Server` that runs its blocking calls on a thread pool. Unlike AsyncServer it
+    covers every endpoint, but each request holds a thread. It has the same
+    endpoints (`server.workbooks`, `server.users`, ...) but their methods are awaited:
+
+    >>> server = TSC.ThreadedAsyncServer('https://tableau.example.com')
+    >>> await server.auth.sign_in(tableau_auth)
+    >>> all_workbooks, pagination_item = await server.workbooks.get()
+    >>> async for user in TSC.AsyncPager(server.users):
+    >>>     ...
+
+    This is not non-blocking I/O: each awaited call holds one of `max_workers` threads until its
+    response has been read, so `max_workers` is how many requests can be in flight at once, and
+    hundreds of them take hundreds of threads. A wrapped `Server` should have a `pool_maxsize` of
+    at least `max_workers`. Everything else (`version`, `site_id`, `add_http_options`, ...) is read
+    straight from the wrapped `Server`.
+    """
+
+    def __init__(self, server_address=None, max_workers=32, server=None):
+        if server is None:
+            if server_address is None:
+                raise ValueError("ThreadedAsyncServer needs a server address or a Server to wrap.")
+            server = Server(server_address, pool_maxsize=max_workers)
+        self._server = server
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+        for name, value in vars(server).items():
+            if isinstance(value, Endpoint):
+                setattr(self, name, ThreadedAsyncEndpoint(value, self))
+
+    def __getattr__(self, name):
+        return getattr(self._server, name)
+
+    @property
+    def server(self):
+        return self._server
+
+    async def _run(self, func, *args, **kwargs):
+        return await _running_loop().run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    async def use_server_version(self):
+        await self._run(self._server.use_server_version)
+
+    def close(self):
+        """
+        Stops the thread pool and closes the wrapped Server.
+        """
+        self._executor.shutdown(wait=False)
+        self._server.close()
+
+
+class AsyncPager(object):
+    """
+    `async for` version of `Pager`. Takes an AsyncServer or ThreadedAsyncServer endpoint (or any coroutine
+    function returning (List[ModelItem], PaginationItem)) and fetches each page as the previous one runs out.
+    """
+
+    def __init__(self, endpoint, request_opts=None, **kwargs):
+        if hasattr(endpoint, 'get'):
+            self._endpoint = partial(endpoint.get, **kwargs)
+        elif callable(endpoint):
+            self._endpoint = partial(endpoint, **kwargs)
+        else:
+            raise ValueError("AsyncPager needs a server endpoint to page through.")
+
+        self._options = request_opts or RequestOptions()
+        self._count = (self._options.pagenumber - 1) * self._options.pagesize
+        self._items = None
+        self._index = 0
+        self._pagination_item = None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._items is None:
+            self._items, self._pagination_item = await self._endpoint(self._options)
+            self._items = list(self._items)
+
+        total = self._pagination_item.total_available
+        if total is not None and self._count >= total:
+            raise StopAsyncIteration
+
+        if self._index == len(self._items):
+            if total is None or self._is_last_page():
+                # Either the endpoint does not page or the total count on Server changed while fetching
+                raise StopAsyncIteration
+            await self._load_next_page()
+            if not self._items:
+                raise StopAsyncIteration
+
+        item = self._items[self._index]
+        self._index += 1
+        self._count += 1
+        return item
+
+    def _is_last_page(self):
+        pagination_item = self._pagination_item
+        if (pagination_item.page_size or 0) <= 0:
+            return True
+        last_page = int(math.ceil(pagination_item.total_available / float(pagination_item.page_size)))
+        return pagination_item.page_number >= last_page
+
+    async def _load_next_page(self):
+        opts = RequestOptions(pagenumber=self._pagination_item.page_number + 1,
+                              pagesize=self._pagination_item.page_size)
+        opts.sort, opts.filter = self._options.sort, self._options.filter
+        items, self._pagination_item = await self._endpoint(opts)
+        self._items = list(items)
+        self._index = 0
@@ -0,0 +1,135 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import logging
+import threading
+
+from .pager import Pager
+
+logger = logging.getLogger('tableau.bulk')
+
+
+def fetch_populated(populate, item, *args, **kwargs):
+    """
+    Calls a `populate_*` method and fetches its content straight away instead of on first access.
+    Returns the fetched content, which the item keeps for later reads.
+    """
+    populate(item, *args, **kwargs)
+    attr_name = '_' + populate.__name__[len('populate_'):]
+    fetcher = getattr(item, attr_name, None)
+    if not callable(fetcher):
+        return fetcher
+    value = fetcher()
+    if isinstance(value, Pager) or (value is not None and iter(value) is value):
+        # Pagers and iterators (e.g. the chunks of a csv) can only be read once, keep what they return.
+        # Chunks stay a list so the property is still read the same way, e.g. b''.join(view.csv)
+        value = list(value)
+    setattr(item, attr_name, lambda: value)
+    return value
+
+
+class BulkResult(object):
+    def __init__(self, item, result=None, error=None):
+        self.item = item
+        self.result = result
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        return "<BulkResult item={} ok={}>".format(getattr(self.item, 'id', self.item), self.ok)
+
+
+def run_pooled(executor, call, items, name=None):
+    """
+    Calls `call(item)` for every item on `executor` and returns a list of BulkResult in the order of `items`.
+    """
+    items = list(items)
+    futures = [executor.submit(call, item) for item in items]
+
+    results = []
+    for item, future in zip(items, futures):
+        try:
+            results.append(BulkResult(item, result=future.result()))
+        except Exception as e:
+            logger.debug("{} failed for {}: {}".format(name or getattr(call, '__name__', call), item, e))
+            results.append(BulkResult(item, error=e))
+    return results
+
+
+class Bulk(object):
+    """
+    Runs one operation against many items on a thread pool shared by everything using this server,
+    so `max_workers` is the most requests the server will have in flight through `bulk` at once.
+    With a `concurrency_governor` on the server the pool grows to the governor's `max_limit` and
+    the governor decides how many of those run.
+
+    >>> results = server.bulk.run(server.workbooks.populate_connections, all_workbooks)
+    >>> failed = [r for r in results if not r.ok]
+
+    Results come back in the order of `items`. A failing item records its exception in `error`
+    instead of stopping the rest of the batch. `populate_*` operations fetch their content
+    straight away (otherwise they would only store a fetcher) and return it as the result.
+    """
+
+    def __init__(self, parent_srv, max_workers=8):
+        self.parent_srv = parent_srv
+        self._lock = threading.Lock()
+        self._executor = None
+        self._executor_workers = None
+        self.max_workers = max_workers
+
+    @property
+    def max_workers(self):
+        return self._max_workers
+
+    @max_workers.setter
+    def max_workers(self, value):
+        if value < 1:
+            raise ValueError("max_workers must be at least 1")
+        with self._lock:
+            self._max_workers = value
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def _get_executor(self):
+        # With a concurrency governor the governor sets the pace, so allow as many threads as it may use
+        workers = self._max_workers
+        governor = self.parent_srv.concurrency_governor
+        if governor is not None:
+            workers = max(workers, governor.max_limit)
+        with self._lock:
+            if self._executor is not None and self._executor_workers != workers:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=workers)
+                self._executor_workers = workers
+            return self._executor
+
+    def run(self, operation, items, *args, **kwargs):
+        """
+        Calls `operation(item, *args, **kwargs)` for every item and returns a list of BulkResult.
+        """
+        call = operation
+        if getattr(operation, '__name__', '').startswith('populate_'):
+            call = partial(fetch_populated, operation)
+
+        def call_item(item):
+            return call(item, *args, **kwargs)
+
+        name = 'Bulk {}'.format(getattr(operation, '__name__', operation))
+        return run_pooled(self._get_executor(), call_item, items, name)
+
+    def after_fork(self):
+        # The pool's threads only exist in the parent process
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def close(self):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
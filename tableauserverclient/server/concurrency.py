@@ -0,0 +1,95 @@
+import threading
+
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
+
+
+class ConcurrencyGovernor(object):
+    """
+    Adapts how many requests a Server has in flight to how the server is coping (AIMD).
+
+    Each request that completes while latency stays within `latency_tolerance` times the usual latency
+    of its endpoint (the URL with its ids replaced, so a download is not compared with a quick lookup)
+    raises the limit a little, adding up to one more request per round trip. A 429, a 5xx, a connection
+    error or a latency spike multiplies the limit by `backoff` instead, at most once per round trip.
+    The limit stays between `min_limit` and `max_limit`.
+
+    Once set on a Server, every request waits for a free slot, so any fan-out (Pager prefetching,
+    `server.bulk`, ThreadedAsyncServer) is held to the limit. Give those enough threads to use it:
+
+    >>> server.concurrency_governor = TSC.ConcurrencyGovernor(max_limit=32)
+    >>> results = server.bulk.run(server.workbooks.populate_connections, all_workbooks)
+    >>> all_workbooks = list(TSC.Pager(server.workbooks, prefetch=32))
+    """
+
+    def __init__(self, initial=4, min_limit=1, max_limit=32, backoff=0.5, latency_tolerance=2.0, smoothing=0.1):
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+
+        self._condition = threading.Condition()
+        self._limit = float(initial)
+        self._in_flight = 0
+        # Smoothed latency of each endpoint
+        self._latencies = dict()
+        self._last_backoff = None
+
+    @property
+    def limit(self):
+        return int(self._limit)
+
+    @property
+    def in_flight(self):
+        return self._in_flight
+
+    def latency(self, key=None):
+        """Smoothed latency of recent successful requests to endpoint `key`, in seconds."""
+        return self._latencies.get(key)
+
+    def after_fork(self):
+        # The requests in flight belong to threads of the parent process, which the child does not have
+        self._condition = threading.Condition()
+        self._in_flight = 0
+
+    @staticmethod
+    def is_overloaded(status_code):
+        return status_code == 429 or status_code >= 500
+
+    def acquire(self):
+        """
+        Waits for a free slot and returns the time the request started, to pass to `release`.
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+        return monotonic()
+
+    def release(self, started, overloaded=False, key=None):
+        """
+        Frees the slot taken at `started` and adjusts the limit based on how the request to endpoint `key` went.
+        """
+        latency = monotonic() - started
+        with self._condition:
+            self._in_flight -= 1
+            usual = self._latencies.get(key)
+            spike = usual is not None and latency > usual * self.latency_tolerance
+            if not overloaded:
+                self._latencies[key] = latency if usual is None else usual + self.smoothing * (latency - usual)
+
+            if overloaded or spike:
+                # Requests sent before the last back off were already counted in it
+                if self._last_backoff is None or started >= self._last_backoff:
+                    self._limit = max(self.min_limit, self._limit * self.backoff)
+                    self._last_backoff = monotonic()
+            else:
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            self._condition.notify_all()
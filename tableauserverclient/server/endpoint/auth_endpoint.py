@@ -1,7 +1,9 @@
 from ..request_factory import RequestFactory
 from .exceptions import ServerResponseError
 from .endpoint import Endpoint, api
-import xml.etree.ElementTree as ET
+from ..token_store import token_key
+from ...xml_helpers import fromstring, ParsedResponse
+import copy
 import logging
 
 logger = logging.getLogger('tableau.endpoint.auth')
@@ -24,19 +26,62 @@ class Auth(Endpoint):
 
     @api(version="2.0")
     def sign_in(self, auth_req):
+        """
+        Signs in, or with a token store on the server reuses a session of the same user on the same site.
+        The credentials are kept so that a session that expires is replaced by signing in again.
+        """
+        self._sign_in_or_reuse(auth_req)
+        self.parent_srv._auth_request = auth_req
+        return Auth.contextmgr(self.sign_out)
+
+    def _sign_in(self, auth_req):
         url = "{0}/{1}".format(self.baseurl, 'signin')
         signin_req = RequestFactory.Auth.signin_req(auth_req)
-        server_response = self.parent_srv.session.post(url, data=signin_req,
-                                                       **self.parent_srv.http_options)
-        self.parent_srv._namespace.detect(server_response.content)
-        self._check_status(server_response)
-        parsed_response = ET.fromstring(server_response.content)
+        parameters = dict(self.parent_srv.http_options, data=signin_req)
+        server_response = self._send(self.parent_srv.transport.post, url, parameters)
+        server_response.parsed_response = ParsedResponse(server_response.content)
+        self.parent_srv._namespace.detect(server_response.parsed_response)
+        self._check_status(server_response, server_response.parsed_response)
+        parsed_response = fromstring(server_response.parsed_response)
         site_id = parsed_response.find('.//t:site', namespaces=self.parent_srv.namespace).get('id', None)
         user_id = parsed_response.find('.//t:user', namespaces=self.parent_srv.namespace).get('id', None)
         auth_token = parsed_response.find('t:credentials', namespaces=self.parent_srv.namespace).get('token', None)
         self.parent_srv._set_auth(site_id, user_id, auth_token)
         logger.info('Signed into {0} as user with id {1}'.format(self.parent_srv.server_address, user_id))
-        return Auth.contextmgr(self.sign_out)
+
+    def _sign_in_or_reuse(self, auth_req, failed_token=None):
+        store = self.parent_srv.token_store
+        if store is None:
+            self._sign_in(auth_req)
+            return
+
+        key = token_key(self.parent_srv.server_address, auth_req)
+        with store.lock():
+            if failed_token is not None:
+                store.invalidate(key, failed_token)
+            entry = store.get(key)
+            if entry is not None:
+                self.parent_srv._set_auth(entry['site_id'], entry['user_id'], entry['auth_token'])
+                logger.info('Reusing the session of user with id {0} on {1}'.format(
+                    entry['user_id'], self.parent_srv.server_address))
+                return
+            self._sign_in(auth_req)
+            store.set(key, self.parent_srv._site_id, self.parent_srv._user_id, self.parent_srv._auth_token)
+
+    def _reauthenticate(self, failed_token):
+        """
+        Replaces the session after a request made with `failed_token` got a 401. Returns the token to retry
+        the request with, or None if the credentials are not known.
+        """
+        auth_req = self.parent_srv._auth_request
+        if auth_req is None:
+            return None
+        with self.parent_srv._signed_in.reauthenticate_lock:
+            # Threads sharing the session get their 401s together, only the first one signs in again
+            if self.parent_srv._auth_token == failed_token:
+                logger.info('Session expired, signing into {0} again'.format(self.parent_srv.server_address))
+                self._sign_in_or_reuse(auth_req, failed_token)
+            return self.parent_srv._auth_token
 
     @api(version="3.6")
     def sign_in_with_personal_access_token(self, auth_req):
@@ -44,17 +89,44 @@ class Auth(Endpoint):
         return self.sign_in(auth_req)
 
     @api(version="2.0")
-    def sign_out(self):
+    def sign_out(self, force=False):
+        """
+        Signs out. With a token store on the server the session is shared with other Servers, so it is
+        only forgotten here and left for them to use. `force=True` ends it on the server as well and drops
+        it from the store, e.g. when the credentials were compromised; the other Servers then sign in again.
+        """
         url = "{0}/{1}".format(self.baseurl, 'signout')
         # If there are no auth tokens you're already signed out. No-op
         if not self.parent_srv.is_signed_in():
             return
+        store = self.parent_srv.token_store
+        if store is not None and not force:
+            self.parent_srv._clear_auth()
+            logger.info('Left the shared session')
+            return
+        auth_token, auth_req = self.parent_srv._auth_token, self.parent_srv._auth_request
         self.post_request(url, '')
+        if store is not None and auth_req is not None:
+            with store.lock():
+                store.invalidate(token_key(self.parent_srv.server_address, auth_req), auth_token)
         self.parent_srv._clear_auth()
         logger.info('Signed out')
 
     @api(version="2.6")
     def switch_site(self, site_item):
+        """
+        Moves the session to another site. With a token store on the server the session is shared with
+        other Servers, which switching would end, so this Server signs in to the other site instead,
+        reusing a stored session for that site if there is one. That needs the credentials of `sign_in`;
+        a Server without them (e.g. made from a ServerHandle) switches the shared session.
+        """
+        if self.parent_srv.token_store is not None and self.parent_srv._auth_request is not None:
+            auth_req = copy.copy(self.parent_srv._auth_request)
+            auth_req.site_id = site_item.content_url
+            self._sign_in_or_reuse(auth_req)
+            self.parent_srv._auth_request = auth_req
+            return Auth.contextmgr(self.sign_out)
+
         url = "{0}/{1}".format(self.baseurl, 'switchSite')
         switch_req = RequestFactory.Auth.switch_req(site_item.content_url)
         try:
@@ -64,13 +136,16 @@ class Auth(Endpoint):
                 return Auth.contextmgr(self.sign_out)
             else:
                 raise e
-        self.parent_srv._namespace.detect(server_response.content)
-        self._check_status(server_response)
-        parsed_response = ET.fromstring(server_response.content)
+        parsed_response = fromstring(server_response.parsed_response)
         site_id = parsed_response.find('.//t:site', namespaces=self.parent_srv.namespace).get('id', None)
         user_id = parsed_response.find('.//t:user', namespaces=self.parent_srv.namespace).get('id', None)
         auth_token = parsed_response.find('t:credentials', namespaces=self.parent_srv.namespace).get('token', None)
         self.parent_srv._set_auth(site_id, user_id, auth_token)
+        if self.parent_srv._auth_request is not None:
+            # Sign in to the new site if the session expires
+            auth_req = copy.copy(self.parent_srv._auth_request)
+            auth_req.site_id = site_item.content_url
+            self.parent_srv._auth_request = auth_req
         logger.info('Signed into {0} as user with id {1}'.format(self.parent_srv.server_address, user_id))
         return Auth.contextmgr(self.sign_out)
 
@@ -27,5 +27,5 @@ class DataAccelerationReport(Endpoint):
         url = self.baseurl
         server_response = self.get_request(url, req_options)
         data_acceleration_report = DataAccelerationReportItem.from_response(
-            server_response.content, self.parent_srv.namespace)
+            server_response.parsed_response, self.parent_srv.namespace)
         return data_acceleration_report
@@ -23,8 +23,8 @@ class DataAlerts(Endpoint):
         logger.info('Querying all dataAlerts on site')
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_dataAlert_items = DataAlertItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        all_dataAlert_items = DataAlertItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return all_dataAlert_items, pagination_item
 
     # Get 1 dataAlert
@@ -36,7 +36,7 @@ class DataAlerts(Endpoint):
         logger.info('Querying single dataAlert (ID: {0})'.format(dataAlert_id))
         url = "{0}/{1}".format(self.baseurl, dataAlert_id)
         server_response = self.get_request(url)
-        return DataAlertItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return DataAlertItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     @api(version="3.2")
     def delete(self, dataAlert):
@@ -77,7 +77,7 @@ class DataAlerts(Endpoint):
         update_req = RequestFactory.DataAlert.add_user_to_alert(dataAlert_item, user_id)
         server_response = self.post_request(url, update_req)
         logger.info('Added user (ID {0}) to dataAlert item (ID: {1})'.format(user_id, dataAlert_item.id))
-        user = UserItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        user = UserItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         return user
 
     @api(version="3.2")
@@ -90,5 +90,5 @@ class DataAlerts(Endpoint):
         update_req = RequestFactory.DataAlert.update_req(dataAlert_item)
         server_response = self.put_request(url, update_req)
         logger.info('Updated dataAlert item (ID: {0})'.format(dataAlert_item.id))
-        updated_dataAlert = DataAlertItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        updated_dataAlert = DataAlertItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         return updated_dataAlert
@@ -26,8 +26,8 @@ class Databases(Endpoint):
         logger.info('Querying all databases on site')
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_database_items = DatabaseItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        all_database_items = DatabaseItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return all_database_items, pagination_item
 
     # Get 1 database
@@ -39,7 +39,7 @@ class Databases(Endpoint):
         logger.info('Querying single database (ID: {0})'.format(database_id))
         url = "{0}/{1}".format(self.baseurl, database_id)
         server_response = self.get_request(url)
-        return DatabaseItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return DatabaseItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     @api(version="3.5")
     def delete(self, database_id):
@@ -60,7 +60,7 @@ class Databases(Endpoint):
         update_req = RequestFactory.Database.update_req(database_item)
         server_response = self.put_request(url, update_req)
         logger.info('Updated database item (ID: {0})'.format(database_item.id))
-        updated_database = DatabaseItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        updated_database = DatabaseItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         return updated_database
 
     # Not Implemented Yet
@@ -79,7 +79,7 @@ class Databases(Endpoint):
     def _get_tables_for_database(self, database_item):
         url = "{0}/{1}/tables".format(self.baseurl, database_item.id)
         server_response = self.get_request(url)
-        tables = TableItem.from_response(server_response.content,
+        tables = TableItem.from_response(server_response.parsed_response,
                                          self.parent_srv.namespace)
         return tables
 
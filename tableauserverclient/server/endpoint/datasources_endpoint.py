@@ -34,12 +34,14 @@ class Datasources(QuerysetEndpoint):
 
     # Get all datasources
     @api(version="2.0")
-    def get(self, req_options=None):
+    def get(self, req_options=None, stream=False):
         logger.info('Querying all datasources on site')
         url = self.baseurl
+        if stream:
+            return self.get_streamed_request(url, DatasourceItem, req_options)
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_datasource_items = DatasourceItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        all_datasource_items = DatasourceItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return all_datasource_items, pagination_item
 
     # Get 1 datasource by id
@@ -51,7 +53,7 @@ class Datasources(QuerysetEndpoint):
         logger.info('Querying single datasource (ID: {0})'.format(datasource_id))
         url = "{0}/{1}".format(self.baseurl, datasource_id)
         server_response = self.get_request(url)
-        return DatasourceItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return DatasourceItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     # Populate datasource item's connections
     @api(version="2.0")
@@ -69,7 +71,7 @@ class Datasources(QuerysetEndpoint):
     def _get_datasource_connections(self, datasource_item, req_options=None):
         url = '{0}/{1}/connections'.format(self.baseurl, datasource_item.id)
         server_response = self.get_request(url, req_options)
-        connections = ConnectionItem.from_response(server_response.content, self.parent_srv.namespace)
+        connections = ConnectionItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return connections
 
     # Delete 1 datasource by id
@@ -129,7 +131,7 @@ class Datasources(QuerysetEndpoint):
         logger.info('Updated datasource item (ID: {0})'.format(datasource_item.id))
         updated_datasource = copy.copy(datasource_item)
         return updated_datasource._parse_common_elements(
-            server_response.content, self.parent_srv.namespace)
+            server_response.parsed_response, self.parent_srv.namespace)
 
     # Update datasource connections
     @api(version="2.3")
@@ -138,7 +140,7 @@ class Datasources(QuerysetEndpoint):
 
         update_req = RequestFactory.Connection.update_req(connection_item)
         server_response = self.put_request(url, update_req)
-        connection = ConnectionItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        connection = ConnectionItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
         logger.info('Updated datasource item (ID: {0} & connection item {1}'.format(datasource_item.id,
                                                                                     connection_item.id))
@@ -150,7 +152,7 @@ class Datasources(QuerysetEndpoint):
         url = "{0}/{1}/refresh".format(self.baseurl, id_)
         empty_req = RequestFactory.Empty.empty_req()
         server_response = self.post_request(url, empty_req)
-        new_job = JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        new_job = JobItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         return new_job
 
     @api(version='3.5')
@@ -159,7 +161,7 @@ class Datasources(QuerysetEndpoint):
         url = "{0}/{1}/createExtract?encrypt={2}".format(self.baseurl, id_, encrypt)
         empty_req = RequestFactory.Empty.empty_req()
         server_response = self.post_request(url, empty_req)
-        new_job = JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        new_job = JobItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         return new_job
 
     @api(version='3.5')
@@ -254,15 +256,15 @@ class Datasources(QuerysetEndpoint):
             raise err
 
         if as_job:
-            new_job = JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+            new_job = JobItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
             logger.info('Published {0} (JOB_ID: {1}'.format(filename, new_job.id))
             return new_job
         else:
-            new_datasource = DatasourceItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+            new_datasource = DatasourceItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
             logger.info('Published {0} (ID: {1})'.format(filename, new_datasource.id))
             return new_datasource
         server_response = self.post_request(url, xml_request, content_type)
-        new_datasource = DatasourceItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        new_datasource = DatasourceItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         logger.info('Published {0} (ID: {1})'.format(filename, new_datasource.id))
         return new_datasource
 
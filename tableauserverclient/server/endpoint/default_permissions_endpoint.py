@@ -31,7 +31,7 @@ class _DefaultPermissionsEndpoint(Endpoint):
         url = '{0}/{1}/default-permissions/{2}'.format(self.owner_baseurl(), resource.id, content_type + 's')
         update_req = RequestFactory.Permission.add_req(permissions)
         response = self.put_request(url, update_req)
-        permissions = PermissionsRule.from_response(response.content,
+        permissions = PermissionsRule.from_response(response.parsed_response,
                                                     self.parent_srv.namespace)
         logger.info('Updated permissions for resource {0}'.format(resource.id))
 
@@ -75,7 +75,7 @@ class _DefaultPermissionsEndpoint(Endpoint):
     def _get_default_permissions(self, item, content_type, req_options=None):
         url = "{0}/{1}/default-permissions/{2}".format(self.owner_baseurl(), item.id, content_type + "s")
         server_response = self.get_request(url, req_options)
-        permissions = PermissionsRule.from_response(server_response.content,
+        permissions = PermissionsRule.from_response(server_response.parsed_response,
                                                     self.parent_srv.namespace)
 
         return permissions
@@ -1,8 +1,14 @@
 from .exceptions import ServerResponseError, InternalServerError, NonXMLResponseError
-from functools import wraps
+from functools import partial, wraps
 from xml.etree.ElementTree import ParseError
 from ..query import QuerySet
+from ..instrumentation import RequestEvent, url_template, content_length, report_response
+from ..retry import RetryEvent
+from ...xml_helpers import ParsedResponse, StreamingDecoder
 import logging
+import time
+
+import requests
 
 try:
     from distutils2.version import NormalizedVersion as Version
@@ -13,10 +19,22 @@ logger = logging.getLogger('tableau.endpoint')
 
 Success_codes = [200, 201, 202, 204]
 
+# Response bodies in debug logs are cut to this many bytes
+LOG_PREVIEW_BYTES = 1024
+
+
+def _preview(content, encoding=None):
+    text = content[:LOG_PREVIEW_BYTES].decode(encoding or 'utf-8', 'replace')
+    if len(content) > LOG_PREVIEW_BYTES:
+        text += u'... ({0} bytes)'.format(len(content))
+    return text
+
 
 class Endpoint(object):
     def __init__(self, parent_srv):
         self.parent_srv = parent_srv
+        # Optional RateLimiter for the requests made by this endpoint, on top of the server's one
+        self.rate_limiter = None
 
     @staticmethod
     def _make_common_headers(auth_token, content_type):
@@ -37,66 +55,225 @@ class Endpoint(object):
         if server_response.headers.get('Content-Type', None) not in ALLOWED_CONTENT_TYPES:
             return '[Truncated File Contents]'
         else:
-            return server_response.content
+            return _preview(server_response.content)
 
     def _make_request(self, method, url, content=None, request_object=None,
-                      auth_token=None, content_type=None, parameters=None):
+                      auth_token=None, content_type=None, parameters=None, streaming=False, rate_limiter=None):
         parameters = parameters or {}
         if request_object is not None:
             parameters["params"] = request_object.get_query_params()
         parameters.update(self.parent_srv.http_options)
         parameters['headers'] = Endpoint._make_common_headers(auth_token, content_type)
+        parameters['headers']['accept-encoding'] = self.parent_srv.accept_encoding
 
         if content is not None:
             parameters['data'] = content
-
-        server_response = method(url, **parameters)
-        self.parent_srv._namespace.detect(server_response.content)
-        self._check_status(server_response)
+        if streaming:
+            parameters['stream'] = True
+
+        rate_limiters = [limiter for limiter in (self.parent_srv.rate_limiter, self.rate_limiter, rate_limiter)
+                         if limiter is not None]
+        server_response = self._send(method, url, parameters, rate_limiters)
+        if server_response.status_code == 401 and auth_token is not None and not hasattr(content, 'read'):
+            # The session may have expired, sign in again and replay the request once
+            new_token = self.parent_srv.auth._reauthenticate(auth_token)
+            if new_token is not None and new_token != auth_token:
+                server_response.close()
+                parameters['headers']['x-tableau-auth'] = new_token
+                server_response = self._send(method, url, parameters, rate_limiters)
+        if streaming and server_response.status_code in Success_codes:
+            # Leave the body unread so the caller can decode it as it arrives
+            return server_response
+
+        # Parsed at most once, then shared by namespace detection, error handling and the model parsers,
+        # which are handed `server_response.parsed_response`. It lives only as long as the response.
+        parsed_response = ParsedResponse(server_response.content)
+        if streaming:
+            server_response.close()
+        self.parent_srv._namespace.detect(parsed_response)
+        self._check_status(server_response, parsed_response)
+        server_response.parsed_response = parsed_response
 
         # This check is to determine if the response is a text response (xml or otherwise)
         # so that we do not attempt to log bytes and other binary data.
-        if server_response.encoding:
-            logger.debug(u'Server response from {0}:\n\t{1}'.format(
-                url, server_response.content.decode(server_response.encoding)))
+        if server_response.encoding and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(u'Server response from %s:\n\t%s', url,
+                         _preview(server_response.content, server_response.encoding))
+        return server_response
+
+    def _send(self, method, url, parameters, rate_limiters=()):
+        retry_policy = self.parent_srv.retry_policy
+        http_method = getattr(method, '__name__', '').upper()
+        started = time.time()
+        attempt = 0
+        while True:
+            attempt += 1
+            for limiter in rate_limiters:
+                limiter.acquire()
+            try:
+                server_response = self._send_hedged(method, http_method, url, parameters, rate_limiters)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if not retry_policy.is_retryable(http_method, attempt, error=e):
+                    raise
+                status_code, error = None, e
+                delay = retry_policy.get_delay(attempt)
+            else:
+                status_code, error = server_response.status_code, None
+                if status_code in Success_codes or not retry_policy.is_retryable(http_method, attempt, status_code):
+                    return server_response
+                delay = retry_policy.get_delay(attempt, server_response)
+                server_response.close()
+            retry_policy.wait(RetryEvent(http_method, url, attempt, status_code, error, delay, time.time() - started))
+
+    def _send_hedged(self, method, http_method, url, parameters, rate_limiters=()):
+        hedge_policy = self.parent_srv.hedge_policy
+        if hedge_policy is None or parameters.get('stream') or not hedge_policy.applies(http_method):
+            return self._send_once(method, url, parameters)
+        return hedge_policy.send(partial(self._send_once, method, url, parameters),
+                                 partial(self._send_duplicate, method, url, parameters, rate_limiters),
+                                 url_template(url))
+
+    def _send_duplicate(self, method, url, parameters, rate_limiters):
+        # A duplicate is a request like any other and counts against the same limits
+        for limiter in rate_limiters:
+            limiter.acquire()
+        return self._send_once(method, url, parameters, hedge=True)
+
+    def _send_once(self, method, url, parameters, hedge=False):
+        balancer = self.parent_srv.load_balancer
+        if balancer is None:
+            return self._send_governed(method, url, parameters, hedge)
+        # Each attempt picks a node, so a retry goes to another node when there is one
+        node = balancer.acquire()
+        try:
+            server_response = self._send_governed(method, balancer.url_for(node, url, self.parent_srv.server_address),
+                                                  parameters, hedge)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            balancer.release(node, failed=True)
+            raise
+        except Exception:
+            balancer.release(node, failed=False)
+            raise
+
+        failed = balancer.is_failure(server_response.status_code)
+        if failed or not parameters.get('stream'):
+            balancer.release(node, failed)
+            return server_response
+
+        # The body has not been read yet, the request is in flight until the response is closed
+        close = server_response.close
+
+        def close_and_release():
+            server_response.close = close
+            close()
+            balancer.release(node, failed=False)
+
+        server_response.close = close_and_release
         return server_response
 
-    def _check_status(self, server_response):
-        logger.debug(self._safe_to_log(server_response))
+    def _send_governed(self, method, url, parameters, hedge=False):
+        governor = self.parent_srv.concurrency_governor
+        if governor is None:
+            return self._call(method, url, parameters, hedge)
+        started = governor.acquire()
+        overloaded = True
+        try:
+            server_response = self._call(method, url, parameters, hedge)
+            overloaded = governor.is_overloaded(server_response.status_code)
+            return server_response
+        finally:
+            governor.release(started, overloaded, url_template(url))
+
+    def _call(self, method, url, parameters, hedge=False):
+        before_hooks, after_hooks = self.parent_srv.request_hooks
+        if not before_hooks and not after_hooks:
+            return method(url, **parameters)
+
+        http_method = getattr(method, '__name__', '').upper()
+        request = RequestEvent(http_method, url_template(url), url, content_length(parameters.get('data')), hedge)
+        for hook in before_hooks:
+            hook(request)
+
+        started = time.time()
+        try:
+            server_response = method(url, **parameters)
+        except Exception as e:
+            report_response(after_hooks, request, started, None, e)
+            raise
+
+        if not parameters.get('stream'):
+            report_response(after_hooks, request, started, server_response)
+            return server_response
+
+        # The body has not been read yet, report the response once it is closed
+        close = server_response.close
+
+        def close_and_report():
+            server_response.close = close
+            close()
+            report_response(after_hooks, request, started, server_response)
+
+        server_response.close = close_and_report
+        return server_response
+
+    def _check_status(self, server_response, parsed_response=None):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(self._safe_to_log(server_response))
         if server_response.status_code >= 500:
             raise InternalServerError(server_response)
         elif server_response.status_code not in Success_codes:
             try:
-                raise ServerResponseError.from_response(server_response.content, self.parent_srv.namespace)
+                raise ServerResponseError.from_response(parsed_response or server_response.content,
+                                                        self.parent_srv.namespace)
             except ParseError:
                 # This will happen if we get a non-success HTTP code that
                 # doesn't return an xml error object (like metadata endpoints)
                 # we convert this to a better exception and pass through the raw
                 # response body
+                if server_response.status_code == 404:
+                    # Not a REST API error, the API version may not exist on this server
+                    self.parent_srv._verify_server_info()
                 raise NonXMLResponseError(server_response.content)
             except Exception:
                 # anything else re-raise here
                 raise
 
     def get_unauthenticated_request(self, url, request_object=None):
-        return self._make_request(self.parent_srv.session.get, url, request_object=request_object)
+        return self._make_request(self.parent_srv.transport.get, url, request_object=request_object)
+
+    def get_request(self, url, request_object=None, parameters=None, rate_limiter=None):
+        return self._make_request(self.parent_srv.transport.get, url, auth_token=self.parent_srv.auth_token,
+                                  request_object=request_object, parameters=parameters, rate_limiter=rate_limiter)
+
+    def get_streamed_request(self, url, model, request_object=None):
+        """
+        Makes a GET request for a list of `model` items and returns a generator of the items,
+        decoded as the response is read, along with the response's PaginationItem.
+        """
+        server_response = self._make_request(self.parent_srv.transport.get, url, auth_token=self.parent_srv.auth_token,
+                                             request_object=request_object, streaming=True)
+        # Compressed bodies are decompressed as they are read and fed straight to the parser
+        server_response.raw.decode_content = True
+
+        def on_close():
+            server_response.decoded_bytes = decoder.bytes_read
+            server_response.close()
 
-    def get_request(self, url, request_object=None, parameters=None):
-        return self._make_request(self.parent_srv.session.get, url, auth_token=self.parent_srv.auth_token,
-                                  request_object=request_object, parameters=parameters)
+        decoder = StreamingDecoder(server_response.raw, model, self.parent_srv._namespace, on_close=on_close)
+        return iter(decoder), decoder.pagination_item
 
     def delete_request(self, url):
         # We don't return anything for a delete
-        self._make_request(self.parent_srv.session.delete, url, auth_token=self.parent_srv.auth_token)
+        self._make_request(self.parent_srv.transport.delete, url, auth_token=self.parent_srv.auth_token)
 
     def put_request(self, url, xml_request=None, content_type='text/xml'):
-        return self._make_request(self.parent_srv.session.put, url,
+        return self._make_request(self.parent_srv.transport.put, url,
                                   content=xml_request,
                                   auth_token=self.parent_srv.auth_token,
                                   content_type=content_type)
 
     def post_request(self, url, xml_request, content_type='text/xml'):
-        return self._make_request(self.parent_srv.session.post, url,
+        return self._make_request(self.parent_srv.transport.post, url,
                                   content=xml_request,
                                   auth_token=self.parent_srv.auth_token,
                                   content_type=content_type)
@@ -33,12 +33,14 @@ class Flows(Endpoint):
 
     # Get all flows
     @api(version="3.3")
-    def get(self, req_options=None):
+    def get(self, req_options=None, stream=False):
         logger.info('Querying all flows on site')
         url = self.baseurl
+        if stream:
+            return self.get_streamed_request(url, FlowItem, req_options)
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_flow_items = FlowItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        all_flow_items = FlowItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return all_flow_items, pagination_item
 
     # Get 1 flow by id
@@ -50,7 +52,7 @@ class Flows(Endpoint):
         logger.info('Querying single flow (ID: {0})'.format(flow_id))
         url = "{0}/{1}".format(self.baseurl, flow_id)
         server_response = self.get_request(url)
-        return FlowItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return FlowItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     # Populate flow item's connections
     @api(version="3.3")
@@ -68,7 +70,7 @@ class Flows(Endpoint):
     def _get_flow_connections(self, flow_item, req_options=None):
         url = '{0}/{1}/connections'.format(self.baseurl, flow_item.id)
         server_response = self.get_request(url, req_options)
-        connections = ConnectionItem.from_response(server_response.content, self.parent_srv.namespace)
+        connections = ConnectionItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return connections
 
     # Delete 1 flow by id
@@ -117,7 +119,7 @@ class Flows(Endpoint):
         server_response = self.put_request(url, update_req)
         logger.info('Updated flow item (ID: {0})'.format(flow_item.id))
         updated_flow = copy.copy(flow_item)
-        return updated_flow._parse_common_elements(server_response.content, self.parent_srv.namespace)
+        return updated_flow._parse_common_elements(server_response.parsed_response, self.parent_srv.namespace)
 
     # Update flow connections
     @api(version="3.3")
@@ -126,7 +128,7 @@ class Flows(Endpoint):
 
         update_req = RequestFactory.Connection.update_req(connection_item)
         server_response = self.put_request(url, update_req)
-        connection = ConnectionItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        connection = ConnectionItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
         logger.info('Updated flow item (ID: {0} & connection item {1}'.format(flow_item.id,
                                                                               connection_item.id))
@@ -137,7 +139,7 @@ class Flows(Endpoint):
         url = "{0}/{1}/run".format(self.baseurl, flow_item.id)
         empty_req = RequestFactory.Empty.empty_req()
         server_response = self.post_request(url, empty_req)
-        new_job = JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        new_job = JobItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         return new_job
 
     # Publish flow
@@ -189,12 +191,12 @@ class Flows(Endpoint):
                 err.content = "Timeout error while publishing. Please use asynchronous publishing to avoid timeouts."
             raise err
         else:
-            new_flow = FlowItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+            new_flow = FlowItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
             logger.info('Published {0} (ID: {1})'.format(filename, new_flow.id))
             return new_flow
 
         server_response = self.post_request(url, xml_request, content_type)
-        new_flow = FlowItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        new_flow = FlowItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         logger.info('Published {0} (ID: {1})'.format(filename, new_flow.id))
         return new_flow
 
@@ -17,12 +17,14 @@ class Groups(Endpoint):
 
     # Gets all groups
     @api(version="2.0")
-    def get(self, req_options=None):
+    def get(self, req_options=None, stream=False):
         logger.info('Querying all groups on site')
         url = self.baseurl
+        if stream:
+            return self.get_streamed_request(url, GroupItem, req_options)
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_group_items = GroupItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        all_group_items = GroupItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return all_group_items, pagination_item
 
     # Gets all users in a given group
@@ -42,8 +44,8 @@ class Groups(Endpoint):
     def _get_users_for_group(self, group_item, req_options=None):
         url = "{0}/{1}/users".format(self.baseurl, group_item.id)
         server_response = self.get_request(url, req_options)
-        user_item = UserItem.from_response(server_response.content, self.parent_srv.namespace)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
+        user_item = UserItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         logger.info('Populated users for group (ID: {0})'.format(group_item.id))
         return user_item, pagination_item
 
@@ -67,9 +69,9 @@ class Groups(Endpoint):
         server_response = self.put_request(url, update_req)
         logger.info('Updated group item (ID: {0})'.format(group_item.id))
         if (as_job):
-            return JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+            return JobItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         else:
-            return GroupItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+            return GroupItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     # Create a 'local' Tableau group
     @api(version="2.0")
@@ -77,7 +79,7 @@ class Groups(Endpoint):
         url = self.baseurl
         create_req = RequestFactory.Group.create_local_req(group_item)
         server_response = self.post_request(url, create_req)
-        return GroupItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return GroupItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     # Create a group based on Active Directory
     @api(version="2.0")
@@ -87,9 +89,9 @@ class Groups(Endpoint):
         create_req = RequestFactory.Group.create_ad_req(group_item)
         server_response = self.post_request(url, create_req)
         if (asJob):
-            return JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+            return JobItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         else:
-            return GroupItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+            return GroupItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     # Removes 1 user from 1 group
     @api(version="2.0")
@@ -116,6 +118,6 @@ class Groups(Endpoint):
         url = "{0}/{1}/users".format(self.baseurl, group_item.id)
         add_req = RequestFactory.Group.add_user_req(user_id)
         server_response = self.post_request(url, add_req)
-        user = UserItem.from_response(server_response.content, self.parent_srv.namespace).pop()
+        user = UserItem.from_response(server_response.parsed_response, self.parent_srv.namespace).pop()
         logger.info('Added user (id: {0}) to group (ID: {1})'.format(user_id, group_item.id))
         return user
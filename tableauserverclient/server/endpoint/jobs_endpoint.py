@@ -30,8 +30,8 @@ class Jobs(Endpoint):
 
         self.parent_srv.assert_at_least_version('3.1')
         server_response = self.get_request(self.baseurl, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        jobs = BackgroundJobItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        jobs = BackgroundJobItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return jobs, pagination_item
 
     @api(version='3.1')
@@ -45,5 +45,5 @@ class Jobs(Endpoint):
         logger.info('Query for information about job ' + job_id)
         url = "{0}/{1}".format(self.baseurl, job_id)
         server_response = self.get_request(url)
-        new_job = JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        new_job = JobItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         return new_job
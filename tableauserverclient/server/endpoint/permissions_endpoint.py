@@ -30,7 +30,7 @@ class _PermissionsEndpoint(Endpoint):
         url = '{0}/{1}/permissions'.format(self.owner_baseurl(), resource.id)
         update_req = RequestFactory.Permission.add_req(permissions)
         response = self.put_request(url, update_req)
-        permissions = PermissionsRule.from_response(response.content,
+        permissions = PermissionsRule.from_response(response.parsed_response,
                                                     self.parent_srv.namespace)
         logger.info('Updated permissions for resource {0}'.format(resource.id))
 
@@ -78,7 +78,7 @@ class _PermissionsEndpoint(Endpoint):
     def _get_permissions(self, item, req_options=None):
         url = "{0}/{1}/permissions".format(self.owner_baseurl(), item.id)
         server_response = self.get_request(url, req_options)
-        permissions = PermissionsRule.from_response(server_response.content,
+        permissions = PermissionsRule.from_response(server_response.parsed_response,
                                                     self.parent_srv.namespace)
 
         return permissions
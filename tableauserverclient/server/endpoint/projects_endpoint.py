@@ -22,12 +22,14 @@ class Projects(Endpoint):
         return "{0}/sites/{1}/projects".format(self.parent_srv.baseurl, self.parent_srv.site_id)
 
     @api(version="2.0")
-    def get(self, req_options=None):
+    def get(self, req_options=None, stream=False):
         logger.info('Querying all projects on site')
         url = self.baseurl
+        if stream:
+            return self.get_streamed_request(url, ProjectItem, req_options)
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_project_items = ProjectItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        all_project_items = ProjectItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return all_project_items, pagination_item
 
     @api(version="2.0")
@@ -49,7 +51,7 @@ class Projects(Endpoint):
         update_req = RequestFactory.Project.update_req(project_item)
         server_response = self.put_request(url, update_req)
         logger.info('Updated project item (ID: {0})'.format(project_item.id))
-        updated_project = ProjectItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        updated_project = ProjectItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         return updated_project
 
     @api(version="2.0")
@@ -57,7 +59,7 @@ class Projects(Endpoint):
         url = self.baseurl
         create_req = RequestFactory.Project.create_req(project_item)
         server_response = self.post_request(url, create_req)
-        new_project = ProjectItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        new_project = ProjectItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         logger.info('Created new project (ID: {0})'.format(new_project.id))
         return new_project
 
@@ -14,13 +14,16 @@ class ServerInfo(Endpoint):
     @api(version="2.4")
     def get(self):
         """ Retrieve the server info for the server.  This is an unauthenticated call """
+        return self._get(self.baseurl)
+
+    def _get(self, url):
         try:
-            server_response = self.get_unauthenticated_request(self.baseurl)
+            server_response = self.get_unauthenticated_request(url)
         except ServerResponseError as e:
             if e.code == "404003":
                 raise ServerInfoEndpointNotFoundError
             if e.code == "404001":
                 raise EndpointUnavailableError
 
-        server_info = ServerInfoItem.from_response(server_response.content, self.parent_srv.namespace)
+        server_info = ServerInfoItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return server_info
@@ -19,8 +19,8 @@ class Sites(Endpoint):
         logger.info('Querying all sites on site')
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_site_items = SiteItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        all_site_items = SiteItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return all_site_items, pagination_item
 
     # Gets 1 site by id
@@ -32,7 +32,7 @@ class Sites(Endpoint):
         logger.info('Querying single site (ID: {0})'.format(site_id))
         url = "{0}/{1}".format(self.baseurl, site_id)
         server_response = self.get_request(url)
-        return SiteItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return SiteItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     # Gets 1 site by name
     @api(version="2.0")
@@ -43,7 +43,7 @@ class Sites(Endpoint):
         logger.info('Querying single site (Name: {0})'.format(site_name))
         url = "{0}/{1}?key=name".format(self.baseurl, site_name)
         server_response = self.get_request(url)
-        return SiteItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return SiteItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     # Gets 1 site by content url
     @api(version="2.0")
@@ -54,7 +54,7 @@ class Sites(Endpoint):
         logger.info('Querying single site (Content URL: {0})'.format(content_url))
         url = "{0}/{1}?key=contentUrl".format(self.baseurl, content_url)
         server_response = self.get_request(url)
-        return SiteItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return SiteItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     # Update site
     @api(version="2.0")
@@ -72,7 +72,7 @@ class Sites(Endpoint):
         server_response = self.put_request(url, update_req)
         logger.info('Updated site item (ID: {0})'.format(site_item.id))
         update_site = copy.copy(site_item)
-        return update_site._parse_common_tags(server_response.content, self.parent_srv.namespace)
+        return update_site._parse_common_tags(server_response.parsed_response, self.parent_srv.namespace)
 
     # Delete 1 site object
     @api(version="2.0")
@@ -100,7 +100,7 @@ class Sites(Endpoint):
         url = self.baseurl
         create_req = RequestFactory.Site.create_req(site_item)
         server_response = self.post_request(url, create_req)
-        new_site = SiteItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        new_site = SiteItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         logger.info('Created new site (ID: {0})'.format(new_site.id))
         return new_site
 
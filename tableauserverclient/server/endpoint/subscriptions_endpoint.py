@@ -18,8 +18,8 @@ class Subscriptions(Endpoint):
         url = self.baseurl
         server_response = self.get_request(url, req_options)
 
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_subscriptions = SubscriptionItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        all_subscriptions = SubscriptionItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return all_subscriptions, pagination_item
 
     @api(version='2.3')
@@ -30,7 +30,7 @@ class Subscriptions(Endpoint):
         logger.info("Querying a single subscription by id ({})".format(subscription_id))
         url = "{}/{}".format(self.baseurl, subscription_id)
         server_response = self.get_request(url)
-        return SubscriptionItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return SubscriptionItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     @api(version='2.3')
     def create(self, subscription_item):
@@ -41,7 +41,7 @@ class Subscriptions(Endpoint):
         url = self.baseurl
         create_req = RequestFactory.Subscription.create_req(subscription_item)
         server_response = self.post_request(url, create_req)
-        return SubscriptionItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return SubscriptionItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     @api(version='2.3')
     def delete(self, subscription_id):
@@ -25,8 +25,8 @@ class Tables(Endpoint):
         logger.info('Querying all tables on site')
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_table_items = TableItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        all_table_items = TableItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return all_table_items, pagination_item
 
     # Get 1 table
@@ -38,7 +38,7 @@ class Tables(Endpoint):
         logger.info('Querying single table (ID: {0})'.format(table_id))
         url = "{0}/{1}".format(self.baseurl, table_id)
         server_response = self.get_request(url)
-        return TableItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return TableItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     @api(version="3.5")
     def delete(self, table_id):
@@ -59,7 +59,7 @@ class Tables(Endpoint):
         update_req = RequestFactory.Table.update_req(table_item)
         server_response = self.put_request(url, update_req)
         logger.info('Updated table item (ID: {0})'.format(table_item.id))
-        updated_table = TableItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        updated_table = TableItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         return updated_table
 
     # Get all columns of the table
@@ -78,9 +78,9 @@ class Tables(Endpoint):
     def _get_columns_for_table(self, table_item, req_options=None):
         url = "{0}/{1}/columns".format(self.baseurl, table_item.id)
         server_response = self.get_request(url, req_options)
-        columns = ColumnItem.from_response(server_response.content,
+        columns = ColumnItem.from_response(server_response.parsed_response,
                                            self.parent_srv.namespace)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return columns, pagination_item
 
     @api(version="3.5")
@@ -88,7 +88,7 @@ class Tables(Endpoint):
         url = "{0}/{1}/columns/{2}".format(self.baseurl, table_item.id, column_item.id)
         update_req = RequestFactory.Column.update_req(column_item)
         server_response = self.put_request(url, update_req)
-        column = ColumnItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        column = ColumnItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
         logger.info('Updated table item (ID: {0} & column item {1}'.format(table_item.id,
                                                                            column_item.id))
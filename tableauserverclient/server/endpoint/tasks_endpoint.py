@@ -33,9 +33,9 @@ class Tasks(Endpoint):
         url = "{0}/{1}".format(self.baseurl, self.__normalize_task_type(task_type))
         server_response = self.get_request(url, req_options)
 
-        pagination_item = PaginationItem.from_response(server_response.content,
+        pagination_item = PaginationItem.from_response(server_response.parsed_response,
                                                        self.parent_srv.namespace)
-        all_tasks = TaskItem.from_response(server_response.content,
+        all_tasks = TaskItem.from_response(server_response.parsed_response,
                                            self.parent_srv.namespace,
                                            task_type)
         return all_tasks, pagination_item
@@ -49,7 +49,7 @@ class Tasks(Endpoint):
         url = "{}/{}/{}".format(self.baseurl,
                                 self.__normalize_task_type(TaskItem.Type.ExtractRefresh), task_id)
         server_response = self.get_request(url)
-        return TaskItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return TaskItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     @api(version='2.6')
     def run(self, task_item):
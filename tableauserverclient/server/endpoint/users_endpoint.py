@@ -16,7 +16,7 @@ class Users(QuerysetEndpoint):
 
     # Gets all users
     @api(version="2.0")
-    def get(self, req_options=None):
+    def get(self, req_options=None, stream=False):
         logger.info('Querying all users on site')
 
         if req_options is None:
@@ -24,9 +24,11 @@ class Users(QuerysetEndpoint):
         req_options._all_fields = True
 
         url = self.baseurl
+        if stream:
+            return self.get_streamed_request(url, UserItem, req_options)
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_user_items = UserItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        all_user_items = UserItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return all_user_items, pagination_item
 
     # Gets 1 user by id
@@ -38,7 +40,7 @@ class Users(QuerysetEndpoint):
         logger.info('Querying single user (ID: {0})'.format(user_id))
         url = "{0}/{1}".format(self.baseurl, user_id)
         server_response = self.get_request(url)
-        return UserItem.from_response(server_response.content, self.parent_srv.namespace).pop()
+        return UserItem.from_response(server_response.parsed_response, self.parent_srv.namespace).pop()
 
     # Update user
     @api(version="2.0")
@@ -52,7 +54,7 @@ class Users(QuerysetEndpoint):
         server_response = self.put_request(url, update_req)
         logger.info('Updated user item (ID: {0})'.format(user_item.id))
         updated_item = copy.copy(user_item)
-        return updated_item._parse_common_tags(server_response.content, self.parent_srv.namespace)
+        return updated_item._parse_common_tags(server_response.parsed_response, self.parent_srv.namespace)
 
     # Delete 1 user by id
     @api(version="2.0")
@@ -70,7 +72,7 @@ class Users(QuerysetEndpoint):
         url = self.baseurl
         add_req = RequestFactory.User.add_req(user_item)
         server_response = self.post_request(url, add_req)
-        new_user = UserItem.from_response(server_response.content, self.parent_srv.namespace).pop()
+        new_user = UserItem.from_response(server_response.parsed_response, self.parent_srv.namespace).pop()
         logger.info('Added new user (ID: {0})'.format(new_user.id))
         return new_user
 
@@ -90,8 +92,8 @@ class Users(QuerysetEndpoint):
         url = "{0}/{1}/workbooks".format(self.baseurl, user_item.id)
         server_response = self.get_request(url, req_options)
         logger.info('Populated workbooks for user (ID: {0})'.format(user_item.id))
-        workbook_item = WorkbookItem.from_response(server_response.content, self.parent_srv.namespace)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
+        workbook_item = WorkbookItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return workbook_item, pagination_item
 
     def populate_favorites(self, user_item):
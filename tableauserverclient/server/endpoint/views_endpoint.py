@@ -13,6 +13,8 @@ logger = logging.getLogger('tableau.endpoint.views')
 class Views(QuerysetEndpoint):
     def __init__(self, parent_srv):
         super(Views, self).__init__(parent_srv)
+        # Optional RateLimiter for rendered images, pdfs and csvs, which cost the server far more than other calls
+        self.render_rate_limiter = None
         self._resource_tagger = _ResourceTagger(parent_srv)
         self._permissions = _PermissionsEndpoint(parent_srv, lambda: self.baseurl)
 
@@ -26,14 +28,16 @@ class Views(QuerysetEndpoint):
         return "{0}/views".format(self.siteurl)
 
     @api(version="2.2")
-    def get(self, req_options=None, usage=False):
+    def get(self, req_options=None, usage=False, stream=False):
         logger.info('Querying all views on site')
         url = self.baseurl
         if usage:
             url += "?includeUsageStatistics=true"
+        if stream:
+            return self.get_streamed_request(url, ViewItem, req_options)
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_view_items = ViewItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
+        all_view_items = ViewItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return all_view_items, pagination_item
 
     @api(version="2.0")
@@ -52,7 +56,7 @@ class Views(QuerysetEndpoint):
         url = "{0}/workbooks/{1}/views/{2}/previewImage".format(self.siteurl,
                                                                 view_item.workbook_id,
                                                                 view_item.id)
-        server_response = self.get_request(url)
+        server_response = self.get_request(url, rate_limiter=self.render_rate_limiter)
         image = server_response.content
         return image
 
@@ -70,7 +74,7 @@ class Views(QuerysetEndpoint):
 
     def _get_view_image(self, view_item, req_options):
         url = "{0}/{1}/image".format(self.baseurl, view_item.id)
-        server_response = self.get_request(url, req_options)
+        server_response = self.get_request(url, req_options, rate_limiter=self.render_rate_limiter)
         image = server_response.content
         return image
 
@@ -88,7 +92,7 @@ class Views(QuerysetEndpoint):
 
     def _get_view_pdf(self, view_item, req_options):
         url = "{0}/{1}/pdf".format(self.baseurl, view_item.id)
-        server_response = self.get_request(url, req_options)
+        server_response = self.get_request(url, req_options, rate_limiter=self.render_rate_limiter)
         pdf = server_response.content
         return pdf
 
@@ -107,7 +111,8 @@ class Views(QuerysetEndpoint):
     def _get_view_csv(self, view_item, req_options):
         url = "{0}/{1}/data".format(self.baseurl, view_item.id)
 
-        with closing(self.get_request(url, request_object=req_options, parameters={"stream": True})) as server_response:
+        with closing(self.get_request(url, request_object=req_options, parameters={"stream": True},
+                                      rate_limiter=self.render_rate_limiter)) as server_response:
             csv = server_response.iter_content(1024)
         return csv
 
@@ -20,7 +20,7 @@ class Webhooks(Endpoint):
         logger.info('Querying all Webhooks on site')
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        all_webhook_items = WebhookItem.from_response(server_response.content, self.parent_srv.namespace)
+        all_webhook_items = WebhookItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         pagination_item = PaginationItem.from_single_page_list(all_webhook_items)
         return all_webhook_items, pagination_item
 
@@ -32,7 +32,7 @@ class Webhooks(Endpoint):
         logger.info('Querying single webhook (ID: {0})'.format(webhook_id))
         url = "{0}/{1}".format(self.baseurl, webhook_id)
         server_response = self.get_request(url)
-        return WebhookItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return WebhookItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     @api(version="3.6")
     def delete(self, webhook_id):
@@ -48,7 +48,7 @@ class Webhooks(Endpoint):
         url = self.baseurl
         create_req = RequestFactory.Webhook.create_req(webhook_item)
         server_response = self.post_request(url, create_req)
-        new_webhook = WebhookItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        new_webhook = WebhookItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
         logger.info('Created new webhook (ID: {0})'.format(new_webhook.id))
         return new_webhook
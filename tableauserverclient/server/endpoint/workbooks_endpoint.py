@@ -24,6 +24,8 @@ logger = logging.getLogger('tableau.endpoint.workbooks')
 class Workbooks(QuerysetEndpoint):
     def __init__(self, parent_srv):
         super(Workbooks, self).__init__(parent_srv)
+        # Optional RateLimiter for rendered pdfs and preview images, which cost the server far more than other calls
+        self.render_rate_limiter = None
         self._resource_tagger = _ResourceTagger(parent_srv)
         self._permissions = _PermissionsEndpoint(parent_srv, lambda: self.baseurl)
 
@@ -33,14 +35,16 @@ class Workbooks(QuerysetEndpoint):
 
     # Get all workbooks on site
     @api(version="2.0")
-    def get(self, req_options=None):
+    def get(self, req_options=None, stream=False):
         logger.info('Querying all workbooks on site')
         url = self.baseurl
+        if stream:
+            return self.get_streamed_request(url, WorkbookItem, req_options)
         server_response = self.get_request(url, req_options)
         pagination_item = PaginationItem.from_response(
-            server_response.content, self.parent_srv.namespace)
+            server_response.parsed_response, self.parent_srv.namespace)
         all_workbook_items = WorkbookItem.from_response(
-            server_response.content, self.parent_srv.namespace)
+            server_response.parsed_response, self.parent_srv.namespace)
         return all_workbook_items, pagination_item
 
     # Get 1 workbook
@@ -52,7 +56,7 @@ class Workbooks(QuerysetEndpoint):
         logger.info('Querying single workbook (ID: {0})'.format(workbook_id))
         url = "{0}/{1}".format(self.baseurl, workbook_id)
         server_response = self.get_request(url)
-        return WorkbookItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        return WorkbookItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
     @api(version="2.8")
     def refresh(self, workbook_id):
@@ -60,7 +64,7 @@ class Workbooks(QuerysetEndpoint):
         url = "{0}/{1}/refresh".format(self.baseurl, id_)
         empty_req = RequestFactory.Empty.empty_req()
         server_response = self.post_request(url, empty_req)
-        new_job = JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        new_job = JobItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         return new_job
 
     # create one or more extracts on 1 workbook, optionally encrypted
@@ -71,7 +75,7 @@ class Workbooks(QuerysetEndpoint):
 
         datasource_req = RequestFactory.Workbook.embedded_extract_req(includeAll, datasources)
         server_response = self.post_request(url, datasource_req)
-        new_job = JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        new_job = JobItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
         return new_job
 
     # delete all the extracts on 1 workbook
@@ -107,7 +111,7 @@ class Workbooks(QuerysetEndpoint):
         server_response = self.put_request(url, update_req)
         logger.info('Updated workbook item (ID: {0})'.format(workbook_item.id))
         updated_workbook = copy.copy(workbook_item)
-        return updated_workbook._parse_common_tags(server_response.content, self.parent_srv.namespace)
+        return updated_workbook._parse_common_tags(server_response.parsed_response, self.parent_srv.namespace)
 
     @api(version="2.3")
     def update_conn(self, *args, **kwargs):
@@ -121,7 +125,7 @@ class Workbooks(QuerysetEndpoint):
         url = "{0}/{1}/connections/{2}".format(self.baseurl, workbook_item.id, connection_item.id)
         update_req = RequestFactory.Connection.update_req(connection_item)
         server_response = self.put_request(url, update_req)
-        connection = ConnectionItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+        connection = ConnectionItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
 
         logger.info('Updated workbook item (ID: {0} & connection item {1})'.format(workbook_item.id,
                                                                                    connection_item.id))
@@ -175,7 +179,7 @@ class Workbooks(QuerysetEndpoint):
         if usage:
             url += "?includeUsageStatistics=true"
         server_response = self.get_request(url)
-        views = ViewItem.from_response(server_response.content,
+        views = ViewItem.from_response(server_response.parsed_response,
                                        self.parent_srv.namespace,
                                        workbook_id=workbook_item.id)
         return views
@@ -196,7 +200,7 @@ class Workbooks(QuerysetEndpoint):
     def _get_workbook_connections(self, workbook_item, req_options=None):
         url = "{0}/{1}/connections".format(self.baseurl, workbook_item.id)
         server_response = self.get_request(url, req_options)
-        connections = ConnectionItem.from_response(server_response.content, self.parent_srv.namespace)
+        connections = ConnectionItem.from_response(server_response.parsed_response, self.parent_srv.namespace)
         return connections
 
     # Get the pdf of the entire workbook if its tabs are enabled, pdf of the default view if its tabs are disabled
@@ -214,7 +218,7 @@ class Workbooks(QuerysetEndpoint):
 
     def _get_wb_pdf(self, workbook_item, req_options):
         url = "{0}/{1}/pdf".format(self.baseurl, workbook_item.id)
-        server_response = self.get_request(url, req_options)
+        server_response = self.get_request(url, req_options, rate_limiter=self.render_rate_limiter)
         pdf = server_response.content
         return pdf
 
@@ -233,7 +237,7 @@ class Workbooks(QuerysetEndpoint):
 
     def _get_wb_preview_image(self, workbook_item):
         url = "{0}/{1}/previewImage".format(self.baseurl, workbook_item.id)
-        server_response = self.get_request(url)
+        server_response = self.get_request(url, rate_limiter=self.render_rate_limiter)
         preview_image = server_response.content
         return preview_image
 
@@ -356,10 +360,10 @@ class Workbooks(QuerysetEndpoint):
             raise err
 
         if as_job:
-            new_job = JobItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+            new_job = JobItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
             logger.info('Published {0} (JOB_ID: {1}'.format(workbook_item.name, new_job.id))
             return new_job
         else:
-            new_workbook = WorkbookItem.from_response(server_response.content, self.parent_srv.namespace)[0]
+            new_workbook = WorkbookItem.from_response(server_response.parsed_response, self.parent_srv.namespace)[0]
             logger.info('Published {0} (ID: {1})'.format(workbook_item.name, new_workbook.id))
             return new_workbook
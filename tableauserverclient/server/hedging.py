@@ -0,0 +1,185 @@
+from collections import deque
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED, TimeoutError as FutureTimeoutError
+import logging
+import math
+import threading
+import time
+
+logger = logging.getLogger('tableau.hedging')
+
+
+def _discard(future):
+    # The slower of two duplicate requests, free its connection once it completes
+    if future.exception() is None:
+        future.result().close()
+
+
+class HedgePolicy(object):
+    """
+    Sends a duplicate of a request that is taking longer than most, and uses whichever response arrives
+    first. This cuts the tail latency caused by a slow node, at the cost of some extra requests.
+
+    >>> server = TSC.Server('https://tableau.example.com', hedge_policy=TSC.HedgePolicy(percentile=95))
+
+    The duplicate is sent once the request has taken longer than the `percentile` of the last `window`
+    response times of the same endpoint (and at least `min_delay` seconds), so a quick lookup is not
+    measured against a large download. Requests are grouped by URL with their ids replaced, as in the
+    request hooks' `endpoint`. Until an endpoint has `min_samples` responses timed, `initial_delay` is
+    used instead, or nothing is duplicated if it is None. At most `budget` (a fraction)
+    of the requests are duplicated. Only `methods` are duplicated and never streamed requests, since the
+    slower request cannot be cancelled and still completes in the background.
+
+    A hedged request and its duplicate run on a pool of `max_workers` threads. The delay is counted from
+    when the request starts, not from when it was queued. When every thread is busy, requests run on the
+    caller's thread without a duplicate instead of waiting for one, so the pool never limits how many
+    requests a Server has in flight.
+
+    `requests`, `hedges` and `wins` count the requests sent through the policy, the duplicates sent and
+    the duplicates that answered first. Duplicates are also reported to the request hooks with `hedge=True`.
+    """
+
+    def __init__(self, percentile=95, window=200, min_samples=20, min_delay=0.01, initial_delay=None,
+                 budget=0.05, methods=None, max_workers=32):
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be between 0 and 1")
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.initial_delay = initial_delay
+        self.budget = budget
+        self.methods = frozenset(methods or ('GET',))
+        self.max_workers = max_workers
+        self.window = window
+        self.requests = 0
+        self.hedges = 0
+        self.wins = 0
+        # Recent response times of each endpoint
+        self._latencies = dict()
+        self._lock = threading.Lock()
+        self._executor = None
+        # Threads of the pool reserved for a request
+        self._busy = 0
+
+    @property
+    def hedge_rate(self):
+        return self.hedges / float(self.requests) if self.requests else 0.0
+
+    def applies(self, method):
+        return method in self.methods
+
+    def get_delay(self, key=None):
+        """
+        How long to wait for a response from endpoint `key` before sending a duplicate, or None not to send one.
+        """
+        with self._lock:
+            latencies = self._latencies.get(key, ())
+            if len(latencies) < self.min_samples:
+                return self.initial_delay
+            latencies = sorted(latencies)
+        index = min(len(latencies) - 1, int(math.ceil(self.percentile / 100.0 * len(latencies))) - 1)
+        return max(self.min_delay, latencies[index])
+
+    def observe(self, elapsed, key=None):
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self.window)
+            latencies.append(elapsed)
+
+    def _take_budget(self):
+        with self._lock:
+            if self.hedges + 1 > self.budget * self.requests:
+                return False
+            self.hedges += 1
+            return True
+
+    def _reserve(self):
+        # Takes a thread of the pool, if one is free
+        with self._lock:
+            if self._busy >= self.max_workers:
+                return False
+            self._busy += 1
+            return True
+
+    def _release(self):
+        with self._lock:
+            self._busy -= 1
+
+    def _run_reserved(self, request, started=None):
+        if started is not None:
+            started.set()
+        try:
+            return request()
+        finally:
+            self._release()
+
+    def _get_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def after_fork(self):
+        # The pool's threads only exist in the parent process
+        self._lock = threading.Lock()
+        self._executor = None
+        self._busy = 0
+
+    def send(self, request, duplicate, key=None):
+        """
+        Calls `request()` and, if it is slower than usual for endpoint `key` and the budget allows,
+        `duplicate()` as well. Returns the first response received. An error is only raised if both fail,
+        the error of `request` then.
+        """
+        with self._lock:
+            self.requests += 1
+        delay = self.get_delay(key)
+        if delay is None or not self._reserve():
+            # Rather than wait for a thread of the pool, run on the caller's thread without a duplicate
+            return self._timed(request, key)
+
+        executor = self._get_executor()
+        started = threading.Event()
+        first = executor.submit(self._run_reserved, partial(self._timed, request, key), started)
+        # A free thread was reserved, so this only waits for the request to be picked up
+        started.wait()
+        try:
+            return first.result(timeout=delay)
+        except FutureTimeoutError:
+            pass
+        if not self._reserve():
+            return first.result()
+        if not self._take_budget():
+            self._release()
+            return first.result()
+
+        logger.debug('No response after %.3fs, sending a duplicate request', delay)
+        second = executor.submit(self._run_reserved, duplicate)
+        pending = {first, second}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in (first, second):
+                if future in done and future.exception() is None:
+                    for other in (first, second):
+                        if other is not future:
+                            other.add_done_callback(_discard)
+                    if future is second:
+                        with self._lock:
+                            self.wins += 1
+                    return future.result()
+        return first.result()
+
+    def _timed(self, request, key):
+        started = time.time()
+        server_response = request()
+        self.observe(time.time() - started, key)
+        return server_response
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
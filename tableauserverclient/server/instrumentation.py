@@ -0,0 +1,207 @@
+from collections import namedtuple
+import json
+import re
+import threading
+import time
+
+# Passed to the `before` hooks of Server.add_request_hook. `hedge` is True for the duplicate of a slow
+# request sent by a HedgePolicy.
+RequestEvent = namedtuple('RequestEvent', ('method', 'url_template', 'url', 'bytes_sent', 'hedge'))
+RequestEvent.__new__.__defaults__ = (False,)
+
+# Passed to the `after` hooks. `status_code` is None and `error` is set when no response was received.
+# `bytes_received` is the size of the body after decompression and `wire_bytes_received` its size as sent,
+# either is None when it is not known. Streamed responses are reported once they are closed, so their
+# `elapsed` time (in seconds) includes reading the body. `hedge` is as in RequestEvent.
+ResponseEvent = namedtuple('ResponseEvent', ('method', 'url_template', 'url', 'status_code', 'bytes_sent',
+                                             'bytes_received', 'wire_bytes_received', 'elapsed', 'error', 'hedge'))
+ResponseEvent.__new__.__defaults__ = (False,)
+
+_LUID_RE = re.compile(r'/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)')
+_NUMERIC_ID_RE = re.compile(r'/\d+(?=/|$)')
+_API_VERSION_RE = re.compile(r'^/api/[\d.]+(?=/|$)')
+# Sites are also looked up by name or content URL, so whatever follows /sites/ identifies one
+_SITE_RE = re.compile(r'/sites/[^/{][^/]*')
+# Lookups like /sites/Samples?key=name, where the last segment is a value of the `key` field
+_KEY_RE = re.compile(r'(?:^|&)key=(\w+)(?:&|$)')
+
+
+def url_template(url):
+    """
+    Returns the path of `url` with its IDs, names and API version replaced by placeholders, so that
+    requests to the same REST call are grouped together:
+
+    >>> url_template('https://tableau.example.com/api/3.4/sites/9a8b7c6d-.../workbooks?pageSize=100')
+    '/api/{version}/sites/{id}/workbooks'
+    >>> url_template('https://tableau.example.com/api/3.4/sites/Finance?key=contentUrl')
+    '/api/{version}/sites/{contentUrl}'
+    """
+    path, _, query = url.split('#', 1)[0].partition('?')
+    if '://' in path:
+        path = '/' + path.split('://', 1)[1].partition('/')[2]
+    key = _KEY_RE.search(query)
+    if key is not None and '/' in path:
+        path = '{0}/{{{1}}}'.format(path.rsplit('/', 1)[0], key.group(1))
+    path = _API_VERSION_RE.sub('/api/{version}', path)
+    path = _SITE_RE.sub('/sites/{id}', path)
+    path = _LUID_RE.sub('/{id}', path)
+    return _NUMERIC_ID_RE.sub('/{id}', path)
+
+
+def content_length(data):
+    if data is None:
+        return 0
+    if isinstance(data, (bytes, bytearray)):
+        return len(data)
+    if isinstance(data, str):
+        return len(data.encode('utf-8'))
+    return None
+
+
+def body_size(server_response):
+    """
+    Size of the response body after decompression, if it has been read.
+    """
+    decoded_bytes = getattr(server_response, 'decoded_bytes', None)
+    if decoded_bytes is not None:
+        return decoded_bytes
+    # Only look at a body that was already read, reading it here would defeat streaming
+    content = getattr(server_response, '_content', None)
+    return len(content) if isinstance(content, bytes) else None
+
+
+def wire_body_size(server_response):
+    """
+    Size of the response body as received, before decompression.
+    """
+    tell = getattr(server_response.raw, 'tell', None)
+    if tell is not None:
+        try:
+            return tell()
+        except (IOError, ValueError):
+            pass
+    length = server_response.headers.get('Content-Length')
+    return int(length) if length and length.isdigit() else None
+
+
+def report_response(after_hooks, request, started, server_response, error=None):
+    """
+    Calls the `after` hooks with the ResponseEvent of `request`, sent at `started`.
+    """
+    status_code = bytes_received = wire_bytes_received = None
+    if server_response is not None:
+        status_code = server_response.status_code
+        bytes_received = body_size(server_response)
+        wire_bytes_received = wire_body_size(server_response)
+    event = ResponseEvent(request.method, request.url_template, request.url, status_code, request.bytes_sent,
+                          bytes_received, wire_bytes_received, time.time() - started, error, request.hedge)
+    for hook in after_hooks:
+        hook(event)
+
+
+class MetricsCollector(object):
+    """
+    In-process collector of request counts, bytes and latency histograms per method and URL template.
+    Register it as an `after` hook and dump it whenever needed:
+
+    >>> collector = TSC.MetricsCollector()
+    >>> server.add_request_hook(after=collector)
+    >>> print(collector.to_prometheus())
+    """
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+    def __init__(self, buckets=None, prefix='tableau'):
+        self.buckets = tuple(sorted(buckets or self.DEFAULT_BUCKETS))
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._endpoints = dict()
+
+    def __call__(self, event):
+        self.observe(event)
+
+    def observe(self, event):
+        status = str(event.status_code) if event.status_code is not None else 'error'
+        with self._lock:
+            stats = self._endpoints.get((event.method, event.url_template))
+            if stats is None:
+                stats = self._endpoints[(event.method, event.url_template)] = {
+                    'statuses': dict(),
+                    'buckets': [0] * len(self.buckets),
+                    'count': 0,
+                    'sum': 0.0,
+                    'bytes_sent': 0,
+                    'bytes_received': 0,
+                    'wire_bytes_received': 0,
+                    'hedges': 0,
+                }
+            stats['statuses'][status] = stats['statuses'].get(status, 0) + 1
+            for i, bound in enumerate(self.buckets):
+                if event.elapsed <= bound:
+                    stats['buckets'][i] += 1
+            stats['count'] += 1
+            stats['sum'] += event.elapsed
+            stats['bytes_sent'] += event.bytes_sent or 0
+            stats['bytes_received'] += event.bytes_received or 0
+            stats['wire_bytes_received'] += event.wire_bytes_received or 0
+            stats['hedges'] += 1 if event.hedge else 0
+
+    def reset(self):
+        with self._lock:
+            self._endpoints = dict()
+
+    def snapshot(self):
+        """
+        Returns a list of the collected stats, one dict per method and URL template.
+        """
+        with self._lock:
+            return [dict(method=method, endpoint=template, requests=dict(stats['statuses']),
+                         duration_seconds=dict(count=stats['count'], sum=stats['sum'],
+                                               buckets=dict(zip([str(b) for b in self.buckets], stats['buckets']))),
+                         bytes_sent=stats['bytes_sent'], bytes_received=stats['bytes_received'],
+                         wire_bytes_received=stats['wire_bytes_received'], hedged_requests=stats['hedges'])
+                    for (method, template), stats in sorted(self._endpoints.items())]
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.snapshot(), **kwargs)
+
+    def to_prometheus(self):
+        """
+        Returns the stats in the Prometheus text exposition format.
+        """
+        prefix = self.prefix
+        requests = ['# HELP {}_requests_total Requests sent to Tableau Server.'.format(prefix),
+                    '# TYPE {}_requests_total counter'.format(prefix)]
+        durations = ['# HELP {}_request_duration_seconds Time until the response was received.'.format(prefix),
+                     '# TYPE {}_request_duration_seconds histogram'.format(prefix)]
+        sent = ['# HELP {}_request_bytes_total Request body bytes sent.'.format(prefix),
+                '# TYPE {}_request_bytes_total counter'.format(prefix)]
+        received = ['# HELP {}_response_bytes_total Response body bytes received, after decompression.'.format(prefix),
+                    '# TYPE {}_response_bytes_total counter'.format(prefix)]
+        wire = ['# HELP {}_response_wire_bytes_total Response body bytes received, as sent.'.format(prefix),
+                '# TYPE {}_response_wire_bytes_total counter'.format(prefix)]
+        hedged = ['# HELP {}_hedged_requests_total Duplicates of slow requests sent.'.format(prefix),
+                  '# TYPE {}_hedged_requests_total counter'.format(prefix)]
+
+        for stats in self.snapshot():
+            labels = 'method="{}",endpoint="{}"'.format(_escape(stats['method']), _escape(stats['endpoint']))
+            for status, count in sorted(stats['requests'].items()):
+                requests.append('{}_requests_total{{{},status="{}"}} {}'.format(prefix, labels, status, count))
+            histogram = stats['duration_seconds']
+            for bound in self.buckets:
+                durations.append('{}_request_duration_seconds_bucket{{{},le="{}"}} {}'.format(
+                    prefix, labels, bound, histogram['buckets'][str(bound)]))
+            durations.append('{}_request_duration_seconds_bucket{{{},le="+Inf"}} {}'.format(
+                prefix, labels, histogram['count']))
+            durations.append('{}_request_duration_seconds_sum{{{}}} {}'.format(prefix, labels, histogram['sum']))
+            durations.append('{}_request_duration_seconds_count{{{}}} {}'.format(prefix, labels, histogram['count']))
+            sent.append('{}_request_bytes_total{{{}}} {}'.format(prefix, labels, stats['bytes_sent']))
+            received.append('{}_response_bytes_total{{{}}} {}'.format(prefix, labels, stats['bytes_received']))
+            wire.append('{}_response_wire_bytes_total{{{}}} {}'.format(prefix, labels, stats['wire_bytes_received']))
+            hedged.append('{}_hedged_requests_total{{{}}} {}'.format(prefix, labels, stats['hedged_requests']))
+
+        return '\n'.join(requests + durations + sent + received + wire + hedged) + '\n'
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,90 @@
+import json
+import logging
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger('tableau.json_file')
+
+
+class JsonFile(object):
+    """
+    A dict kept in a JSON file shared by every process of the same OS user, for FileTokenStore and
+    ServerInfoCache. Writes replace the file in one step and updates are serialized between processes
+    with `lock` (on Windows only between the threads of a process).
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def lock(self, thread_lock):
+        """
+        Holds `thread_lock` and a lock file next to the file, for reading and writing it in one step.
+        """
+        return _FileLock(self.path + '.lock', thread_lock)
+
+    def load(self):
+        """
+        The dict in the file, or an empty dict if it is missing or unreadable.
+        """
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+        except (IOError, OSError, ValueError):
+            return dict()
+        return entries if isinstance(entries, dict) else dict()
+
+    def save(self, entries):
+        directory = os.path.dirname(self.path)
+        try:
+            _make_directory(directory)
+            # mkstemp creates the file readable by its owner only. Moving it in place means readers never
+            # see a partial file.
+            fd, temp_path = tempfile.mkstemp(dir=directory or None, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(entries, f)
+                os.replace(temp_path, self.path)
+            except Exception:
+                os.remove(temp_path)
+                raise
+        except (IOError, OSError) as e:
+            logger.warning('Could not write %s: %s', self.path, e)
+
+
+class _FileLock(object):
+    def __init__(self, path, thread_lock):
+        self._path = path
+        self._thread_lock = thread_lock
+        self._file = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if fcntl is not None:
+            try:
+                _make_directory(os.path.dirname(self._path))
+                self._file = open(self._path, 'a')
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            except (IOError, OSError) as e:
+                logger.warning('Could not lock %s: %s', self._path, e)
+                self._close()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._close()
+        self._thread_lock.release()
+
+    def _close(self):
+        if self._file is not None:
+            # Closing the file releases the lock
+            self._file.close()
+            self._file = None
+
+
+def _make_directory(directory):
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory, 0o700)
@@ -0,0 +1,108 @@
+import logging
+import threading
+import time
+
+logger = logging.getLogger('tableau.load_balancer')
+
+
+class Node(object):
+    def __init__(self, address):
+        self.address = address.rstrip('/')
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.ejected_until = 0
+
+    def is_healthy(self, now):
+        return self.ejected_until <= now
+
+    def __repr__(self):
+        return "<Node {} in_flight={} failures={}>".format(self.address, self.in_flight, self.failures)
+
+
+class LoadBalancer(object):
+    """
+    Spreads the requests of a Server over several gateway nodes of one Tableau Server cluster. The nodes
+    share sessions, so a token from signing in through one node works on all of them.
+
+    >>> server = TSC.Server(server_addresses=['https://node1.example.com', 'https://node2.example.com'],
+    >>>                     routing='least_in_flight')
+
+    `routing` is 'round_robin' or 'least_in_flight', which picks the node with the fewest requests still
+    running (a streamed response counts until it is closed). A node whose requests fail `max_failures`
+    times in a row, with a connection error, a time-out or a 502, 503 or 504, is left out for `cooldown`
+    seconds. After that, one more failure leaves it out again. If every node is left out, the one that
+    comes back first is used.
+    """
+
+    ROUTING = ('round_robin', 'least_in_flight')
+    FAILURE_STATUS_CODES = frozenset((502, 503, 504))
+
+    def __init__(self, addresses, routing='round_robin', max_failures=3, cooldown=30):
+        if routing not in self.ROUTING:
+            raise ValueError("routing must be one of {0}".format(', '.join(self.ROUTING)))
+        if max_failures < 1:
+            raise ValueError("max_failures must be at least 1")
+        self.nodes = [Node(address) for address in addresses]
+        if not self.nodes:
+            raise ValueError("LoadBalancer needs at least one address.")
+        self.routing = routing
+        self.max_failures = max_failures
+        self.cooldown = cooldown
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @property
+    def addresses(self):
+        return [node.address for node in self.nodes]
+
+    def after_fork(self):
+        # The requests in flight belong to threads of the parent process, which the child does not have
+        self._lock = threading.Lock()
+        for node in self.nodes:
+            node.in_flight = 0
+
+    def acquire(self):
+        """
+        Picks the node for a request and counts it as in flight until `release`.
+        """
+        with self._lock:
+            now = time.time()
+            healthy = [node for node in self.nodes if node.is_healthy(now)]
+            if not healthy:
+                healthy = [min(self.nodes, key=lambda node: node.ejected_until)]
+            # Rotate the starting point so ties are spread over the nodes too
+            start = self._next % len(healthy)
+            self._next += 1
+            candidates = healthy[start:] + healthy[:start]
+            if self.routing == 'least_in_flight':
+                node = min(candidates, key=lambda candidate: candidate.in_flight)
+            else:
+                node = candidates[0]
+            node.in_flight += 1
+            node.requests += 1
+            return node
+
+    def release(self, node, failed):
+        with self._lock:
+            node.in_flight -= 1
+            if not failed:
+                node.failures = 0
+                return
+            node.failures += 1
+            if node.failures >= self.max_failures:
+                node.ejected_until = time.time() + self.cooldown
+                logger.warning('Leaving out {0} for {1} seconds after {2} failed requests'.format(
+                    node.address, self.cooldown, node.failures))
+
+    def is_failure(self, status_code):
+        return status_code in self.FAILURE_STATUS_CODES
+
+    def url_for(self, node, url, server_address):
+        """
+        `url`, built from `server_address`, sent to `node` instead.
+        """
+        server_address = server_address.rstrip('/')
+        if url.startswith(server_address):
+            return node.address + url[len(server_address):]
+        return url
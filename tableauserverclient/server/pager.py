@@ -1,4 +1,7 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
+import math
 
 from . import RequestOptions
 
@@ -9,10 +12,15 @@ class Pager(object):
     Supports all `RequestOptions` including starting on any page. Also used by models to load sub-models
     (users in a group, views in a workbook, etc) by passing a different endpoint.
 
-    Will loop over anything that returns (List[ModelItem], PaginationItem).
+    Will loop over anything that returns (List[ModelItem], PaginationItem). The items can also be a
+    stream, so `Pager(server.workbooks, stream=True)` decodes each page as it is read.
+
+    Passing `prefetch=N` requests the next N pages from a thread pool of `workers` threads (defaults to N)
+    while the current page is being consumed. Items are still yielded in order. With a concurrency
+    governor on the server, the governor limits how many of those requests run at once.
     """
 
-    def __init__(self, endpoint, request_opts=None, **kwargs):
+    def __init__(self, endpoint, request_opts=None, prefetch=0, workers=None, **kwargs):
 
         if hasattr(endpoint, 'get'):
             # The simpliest case is to take an Endpoint and call its get
@@ -26,6 +34,13 @@ class Pager(object):
             # Didn't get something we can page over
             raise ValueError("Pager needs a server endpoint to page through.")
 
+        if prefetch < 0:
+            raise ValueError("prefetch must be zero or a positive number of pages.")
+        if workers is not None and workers < 1:
+            raise ValueError("workers must be a positive number of threads.")
+        self._prefetch = prefetch
+        self._workers = workers or prefetch
+
         self._options = request_opts
 
         # If we have options we could be starting on any page, backfill the count
@@ -41,28 +56,82 @@ class Pager(object):
 
         if last_pagination_item.total_available is None:
             # This endpoint does not support pagination, drain the list and return
-            while current_item_list:
-                yield current_item_list.pop(0)
+            for item in current_item_list:
+                yield item
 
             return
 
-        # Get the rest on demand as a generator
-        while self._count < last_pagination_item.total_available:
-            if len(current_item_list) == 0:
-                current_item_list, last_pagination_item = self._load_next_page(last_pagination_item)
+        if self._prefetch:
+            for item in self._iter_prefetched(current_item_list, last_pagination_item):
+                yield item
+            return
 
-            try:
-                yield current_item_list.pop(0)
+        # Get the rest on demand as a generator. Pages may be lists or streams of items, so walk each one once
+        while True:
+            page_count = 0
+            for item in current_item_list:
+                if self._count >= last_pagination_item.total_available:
+                    return
+                yield item
                 self._count += 1
+                page_count += 1
 
-            except IndexError:
-                # The total count on Server changed while fetching exit gracefully
+            if page_count == 0 or self._count >= last_pagination_item.total_available:
+                # Either we are done or the total count on Server changed while fetching, exit gracefully
                 return
 
-    def _load_next_page(self, last_pagination_item):
+            current_item_list, last_pagination_item = self._load_next_page(last_pagination_item)
+
+    def _iter_prefetched(self, current_item_list, last_pagination_item):
+        page_size = last_pagination_item.page_size
         next_page = last_pagination_item.page_number + 1
-        opts = RequestOptions(pagenumber=next_page, pagesize=last_pagination_item.page_size)
+        last_page = self._last_page(last_pagination_item)
+        pending = deque()
+
+        executor = ThreadPoolExecutor(max_workers=self._workers)
+        try:
+            while True:
+                # Keep up to `prefetch` pages in flight while the current page is drained
+                while len(pending) < self._prefetch and next_page <= last_page:
+                    opts = self._page_options(next_page, page_size)
+                    pending.append(executor.submit(self._endpoint, opts))
+                    next_page += 1
+
+                page_count = 0
+                for item in current_item_list:
+                    if self._count >= last_pagination_item.total_available:
+                        return
+                    yield item
+                    self._count += 1
+                    page_count += 1
+
+                if page_count == 0 or not pending or self._count >= last_pagination_item.total_available:
+                    # An empty page means the total count on Server shrank while fetching
+                    return
+
+                current_item_list, last_pagination_item = pending.popleft().result()
+
+                # The total count on Server may have grown, keep fetching until the new last page
+                last_page = max(last_page, self._last_page(last_pagination_item))
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    @staticmethod
+    def _last_page(pagination_item):
+        if (pagination_item.page_size or 0) <= 0:
+            return pagination_item.page_number
+        return int(math.ceil(pagination_item.total_available / float(pagination_item.page_size)))
+
+    def _page_options(self, page_number, page_size):
+        opts = RequestOptions(pagenumber=page_number, pagesize=page_size)
         if self._options is not None:
             opts.sort, opts.filter = self._options.sort, self._options.filter
+        return opts
+
+    def _load_next_page(self, last_pagination_item):
+        next_page = last_pagination_item.page_number + 1
+        opts = self._page_options(next_page, last_pagination_item.page_size)
         current_item_list, last_pagination_item = self._endpoint(opts)
         return current_item_list, last_pagination_item
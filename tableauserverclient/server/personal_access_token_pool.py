@@ -0,0 +1,118 @@
+from contextlib import contextmanager
+import logging
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from .server_pool import _ServerPool
+
+logger = logging.getLogger('tableau.personal_access_token_pool')
+
+
+class PersonalAccessTokenPool(_ServerPool):
+    """
+    Signing in with a personal access token ends the sessions that token started before, so one token
+    can only be used by one worker at a time. The pool keeps a Server for each of several tokens and hands
+    each one to a single worker at a time, so work can run on as many workers as there are tokens.
+
+    >>> tokens = [TSC.PersonalAccessTokenAuth('worker-{}'.format(i), secret, site_id='Samples')
+    >>>           for i, secret in enumerate(secrets)]
+    >>> with TSC.PersonalAccessTokenPool('https://tableau.example.com', tokens) as pool:
+    >>>     results = pool.map(lambda server, workbook_id: server.workbooks.get_by_id(workbook_id), workbook_ids)
+
+    Each Server signs in the first time it is handed out and stays signed in until the pool is closed.
+    If its session ends anyway, the next request signs in again with the same token. Other arguments are
+    passed to every Server; the API version is only looked up once with `use_server_version`.
+    """
+
+    def __init__(self, server_address, tokens, use_server_version=False, **server_kwargs):
+        super(PersonalAccessTokenPool, self).__init__(server_address, use_server_version, **server_kwargs)
+        self._tokens = list(tokens)
+        if not self._tokens:
+            raise ValueError("PersonalAccessTokenPool needs at least one token.")
+        self._servers = [None] * len(self._tokens)
+        # Counts the calls to close, so a sign in that close ran during is not kept
+        self._closes = 0
+        # Indexes of the tokens not handed out, the most recently returned first so warm Servers are reused
+        self._idle = queue.LifoQueue()
+        for index in reversed(range(len(self._tokens))):
+            self._idle.put(index)
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def acquire(self, timeout=None):
+        """
+        Hands out a signed in Server that no other worker is using, waiting up to `timeout` seconds
+        (or for ever) for one to be released. Give it back with `release`.
+        """
+        try:
+            index = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError("No personal access token was released within {0} seconds.".format(timeout))
+
+        try:
+            with self._lock:
+                server, closes = self._servers[index], self._closes
+            if server is None:
+                server = self._new_server()
+                server._pool, server._pool_index = self, index
+                server.auth.sign_in(self._tokens[index])
+                logger.info('Signed in with personal access token %r', self._tokens[index].token_name)
+                with self._lock:
+                    closed = self._closes != closes
+                    if not closed:
+                        self._servers[index] = server
+                if closed:
+                    self._close_servers([server])
+                    raise RuntimeError("The pool was closed while signing in.")
+            return server
+        except Exception:
+            self._idle.put(index)
+            raise
+
+    def release(self, server):
+        """
+        Gives back a Server handed out by `acquire`. A Server handed out before the pool was closed is
+        already signed out, only its token is made available again.
+        """
+        if getattr(server, '_pool', None) is not self:
+            raise ValueError("This Server does not belong to the pool.")
+        self._idle.put(server._pool_index)
+
+    @contextmanager
+    def checkout(self, timeout=None):
+        """
+        `acquire` and `release` as a context manager.
+
+        >>> with pool.checkout() as server:
+        >>>     server.workbooks.refresh(workbook_id)
+        """
+        server = self.acquire(timeout)
+        try:
+            yield server
+        finally:
+            self.release(server)
+
+    def map(self, fn, items, concurrency=None):
+        """
+        Calls `fn(server, item)` for every item, running up to `concurrency` items at once (by default one
+        for each token). Returns a list of BulkResult in the order of `items`; a failing item records its
+        exception instead of stopping the rest.
+        """
+        def call(item):
+            with self.checkout() as server:
+                return fn(server, item)
+
+        return self._run(call, items, concurrency or len(self._tokens))
+
+    def close(self):
+        """
+        Signs out of every session and closes the connections.
+        """
+        with self._lock:
+            servers, self._servers = self._servers, [None] * len(self._tokens)
+            self._closes += 1
+        self._close_servers(server for server in servers if server is not None)
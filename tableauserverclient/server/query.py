@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 from .request_options import RequestOptions
 from .filter import Filter
 from .sort import Sort
@@ -8,26 +10,176 @@ def to_camel_case(word):
 
 
 class QuerySet:
+    """
+    Lazily pages through every item matching the filters, sorts and pagination set on it.
+
+    Pages are fetched from Server as they are needed and the most recently used
+    `page_cache_size` pages are kept, so large sites can be iterated without holding
+    every item in memory. Indexes and slices count from the first item of the requested page.
+    Server may return fewer items per page than asked for, pages are counted in the page size it used.
+    """
+
+    page_cache_size = 8
 
     def __init__(self, model):
         self.model = model
         self.request_options = RequestOptions()
-        self._result_cache = None
         self._pagination_item = None
+        self._total_available = None
+        # The page size Server used, which it may have capped
+        self._page_size = None
+        # Number of items of an endpoint that does not support pagination
+        self._unpaginated_count = None
+        self._page_cache = OrderedDict()
 
     def __iter__(self):
+        position = 0
+        while True:
+            page_number, index = divmod(self._offset() + position, self._effective_page_size())
+            page = self._fetch_page(page_number + 1)
+            if index >= len(page):
+                return
+            for item in page[index:]:
+                yield item
+            position += len(page) - index
+
+            if self._total_available is None:
+                # This endpoint does not support pagination, everything came back in one page
+                return
+            if self._offset() + position >= self._total_available:
+                return
+
+    def __len__(self):
+        # len() is usually followed by iteration, so fetch the first page rather than just the count
         self._fetch_all()
-        return iter(self._result_cache)
+        return self.count()
 
     def __getitem__(self, k):
-        return list(self)[k]
+        """
+        Index or slice into the results, counting from the first item of the requested page.
+        Only the pages covering the requested items are fetched from Server.
+        """
+        if isinstance(k, slice):
+            return self._get_slice(k)
+
+        if k < 0:
+            k += self.count()
+        if k < 0:
+            raise IndexError("QuerySet index out of range")
+        item = self._get_item(k)
+        if item is None:
+            raise IndexError("QuerySet index out of range")
+        return item
+
+    def count(self):
+        """
+        Number of items from the first requested item onwards. Answered from the total count on
+        Server, a single item page is requested if no page has been fetched yet.
+        """
+        if self._total_available is None and self._unpaginated_count is None:
+            opts = self._page_options(1, 1)
+            _, pagination_item = self.model.get(opts)
+            if pagination_item.total_available is None:
+                # This endpoint does not support pagination, we have to look at the items
+                self._fetch_page(self.request_options.pagenumber)
+            else:
+                self._total_available = pagination_item.total_available
+        if self._total_available is None:
+            return self._unpaginated_count
+        return max(self._total_available - self._offset(), 0)
+
+    def first(self):
+        """
+        First item from the requested page onwards, or None if there are no matches.
+        """
+        return self._get_item(0)
+
+    def exists(self):
+        return self.count() > 0
+
+    def _get_slice(self, k):
+        start, stop, step = k.start, k.stop, k.step
+        if (step or 1) < 0 or any(i is not None and i < 0 for i in (start, stop)):
+            # Negative bounds are relative to the end, so we need the total count first
+            start, stop, step = k.indices(self.count())
+        start, step = start or 0, step or 1
+
+        results = []
+        position = start
+        while self._in_range(position, stop, step):
+            item = self._get_item(position)
+            if item is None:
+                break
+            results.append(item)
+            position += step
+        return results
+
+    @staticmethod
+    def _in_range(position, stop, step):
+        if stop is None:
+            return True
+        return position < stop if step > 0 else position > stop
+
+    def _get_item(self, position):
+        """
+        Returns the item at `position`, or None if Server has nothing there.
+        """
+        position += self._offset()
+        if self._total_available is not None and position >= self._total_available:
+            return None
+        page_number, index = divmod(position, self._effective_page_size())
+        page = self._fetch_page(page_number + 1)
+        if index >= len(page):
+            return None
+        return page[index]
+
+    def _offset(self):
+        return (self.request_options.pagenumber - 1) * self._effective_page_size()
+
+    def _effective_page_size(self):
+        return self._page_size or self.request_options.pagesize
+
+    def _page_options(self, page_number, page_size):
+        opts = RequestOptions(pagenumber=page_number, pagesize=page_size)
+        opts.sort, opts.filter = self.request_options.sort, self.request_options.filter
+        opts._all_fields = self.request_options._all_fields
+        return opts
+
+    def _fetch_page(self, page_number):
+        """
+        Returns the items on `page_number`, from the page cache when possible.
+        """
+        if page_number in self._page_cache:
+            self._page_cache.move_to_end(page_number)
+            return self._page_cache[page_number]
+
+        items, pagination_item = self.model.get(self._page_options(page_number, self._effective_page_size()))
+        self._total_available = pagination_item.total_available
+        if self._total_available is None:
+            self._unpaginated_count = len(items)
+        elif (pagination_item.page_size or 0) > 0:
+            self._page_size = pagination_item.page_size
+        if page_number == self.request_options.pagenumber:
+            self._pagination_item = pagination_item
+
+        self._page_cache[page_number] = items
+        while len(self._page_cache) > self.page_cache_size:
+            self._page_cache.popitem(last=False)
+        return items
 
     def _fetch_all(self):
         """
-        Retrieve the data and store result and pagination item in cache
+        Retrieve the requested page and store its pagination item
         """
-        if self._result_cache is None:
-            self._result_cache, self._pagination_item = self.model.get(self.request_options)
+        if self._pagination_item is None:
+            self._fetch_page(self.request_options.pagenumber)
+
+    def _clear_cache(self):
+        self._pagination_item = None
+        self._total_available = None
+        self._page_size = None
+        self._unpaginated_count = None
+        self._page_cache.clear()
 
     @property
     def total_available(self):
@@ -48,12 +200,14 @@ class QuerySet:
         for kwarg_key, value in kwargs.items():
             field_name, operator = self._parse_shorthand_filter(kwarg_key)
             self.request_options.filter.add(Filter(field_name, operator, value))
+        self._clear_cache()
         return self
 
     def order_by(self, *args):
         for arg in args:
             field_name, direction = self._parse_shorthand_sort(arg)
             self.request_options.sort.add(Sort(field_name, direction))
+        self._clear_cache()
         return self
 
     def paginate(self, **kwargs):
@@ -61,6 +215,7 @@ class QuerySet:
             self.request_options.pagenumber = kwargs["page_number"]
         if "page_size" in kwargs:
             self.request_options.pagesize = kwargs["page_size"]
+        self._clear_cache()
         return self
 
     def _parse_shorthand_filter(self, key):
@@ -0,0 +1,87 @@
+import os
+import threading
+import time
+
+try:
+    from time import monotonic
+except ImportError:
+    monotonic = time.time
+
+
+class RateLimiter(object):
+    """
+    Token bucket allowing `rate` requests per second on average, and bursts of up to `burst` requests.
+    Requests over the limit wait their turn. It is thread safe, so one limiter can be shared by every
+    thread, endpoint and Server that should count against the same limit:
+
+    >>> server.rate_limiter = TSC.RateLimiter(20)               # every request made by this server
+    >>> server.views.render_rate_limiter = TSC.RateLimiter(1)   # view images, pdfs and csvs on top of that
+    >>> other_server.rate_limiter = TSC.RateLimiter.shared(other_server.server_address, 20)
+    """
+
+    _shared = dict()
+    _shared_lock = threading.Lock()
+
+    def __init__(self, rate, burst=None):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1, rate))
+        if self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = monotonic()
+        self.time_waited = 0.0
+
+    @classmethod
+    def shared(cls, key, rate, burst=None):
+        """
+        Returns the limiter registered under `key`, usually a server address, creating it on first use.
+        Servers pointing at the same host can use it to share one limit. Asking for a registered limiter
+        with another `rate` or `burst` raises ValueError rather than silently using the first one.
+        """
+        requested = cls(rate, burst)
+        with cls._shared_lock:
+            limiter = cls._shared.setdefault(key, requested)
+        if (limiter.rate, limiter.burst) != (requested.rate, requested.burst):
+            raise ValueError("The rate limiter for {0!r} is already registered with rate {1} and burst {2}.".format(
+                key, limiter.rate, limiter.burst))
+        return limiter
+
+    def after_fork(self):
+        # Another thread of the parent may have held the lock when it forked
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """
+        Takes `tokens` from the bucket, waiting until they are available. Returns the time waited.
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def reserve(self, tokens=1):
+        """
+        Takes `tokens` from the bucket without waiting and returns how long the caller must wait before
+        using them, e.g. to `await asyncio.sleep()` it.
+        """
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Take the tokens now, even if it leaves the bucket in debt, so that callers queue up in order
+            self._tokens -= tokens
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.time_waited += wait
+        return wait
+
+
+def _reset_shared_lock():
+    RateLimiter._shared_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_shared_lock)
@@ -0,0 +1,115 @@
+from collections import namedtuple
+from email.utils import parsedate_tz, mktime_tz
+import logging
+import random
+import threading
+import time
+
+import requests
+
+logger = logging.getLogger('tableau.retry')
+
+# Passed to RetryPolicy.on_retry before each retry. `elapsed` is the time spent on the request so far,
+# including earlier waits, and `delay` is how long it will wait now.
+RetryEvent = namedtuple('RetryEvent', ('method', 'url', 'attempt', 'status_code', 'error', 'delay', 'elapsed'))
+
+
+class RetryPolicy(object):
+    """
+    Decides which failed requests Server retries and how long it waits in between.
+
+    A request is retried when it fails with one of `status_codes` or a connection error, up to `total`
+    times. The wait doubles with every attempt, starting at `backoff_factor` seconds and capped at
+    `max_backoff`, and with `jitter` a random part of it is used so that many clients don't retry in step.
+    A `Retry-After` header from the server is used instead when present, also capped at `max_backoff`
+    so a server asking for a long wait cannot hold a worker for that long.
+
+    Only `methods` are retried. POST is left out by default as it may not be safe to send twice.
+
+    >>> def on_retry(event):
+    >>>     print('retry {0.attempt} of {0.method} {0.url} in {0.delay:.1f}s'.format(event))
+    >>> server = TSC.Server('https://tableau.example.com', retry_policy=TSC.RetryPolicy(total=5, on_retry=on_retry))
+
+    `retries` and `time_waited` add up over every request made with the policy. Use `RetryPolicy(total=0)`
+    to turn retrying off.
+    """
+
+    DEFAULT_STATUS_CODES = frozenset([429, 502, 503, 504])
+    DEFAULT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+    # Connection errors that sending the request again will not fix
+    PERMANENT_ERRORS = (requests.exceptions.SSLError, requests.exceptions.ProxyError)
+
+    def __init__(self, total=3, backoff_factor=0.5, max_backoff=30, jitter=True, status_codes=None,
+                 methods=None, respect_retry_after=True, on_retry=None):
+        if total < 0:
+            raise ValueError("total must not be negative")
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_codes = frozenset(status_codes) if status_codes is not None else self.DEFAULT_STATUS_CODES
+        self.methods = frozenset(m.upper() for m in methods) if methods is not None else self.DEFAULT_METHODS
+        self.respect_retry_after = respect_retry_after
+        self.on_retry = on_retry
+
+        self._lock = threading.Lock()
+        self.retries = 0
+        self.time_waited = 0.0
+
+    def after_fork(self):
+        # Another thread of the parent may have held the lock when it forked
+        self._lock = threading.Lock()
+
+    def is_retryable(self, method, attempt, status_code=None, error=None):
+        """
+        Whether a request that failed on `attempt` (counting from 1) with `status_code`, or with the
+        connection `error` when it is None, should be sent again. Certificate and proxy errors are not.
+        """
+        if attempt > self.total or method.upper() not in self.methods:
+            return False
+        if isinstance(error, self.PERMANENT_ERRORS):
+            return False
+        return status_code is None or status_code in self.status_codes
+
+    def backoff(self, attempt):
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value):
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        date = parsedate_tz(value)
+        if date is None:
+            return None
+        return max(0.0, mktime_tz(date) - time.time())
+
+    def get_delay(self, attempt, server_response=None):
+        if self.respect_retry_after and server_response is not None:
+            retry_after = self.parse_retry_after(server_response.headers.get('Retry-After'))
+            if retry_after is not None:
+                return min(self.max_backoff, retry_after)
+        return self.backoff(attempt)
+
+    def wait(self, event):
+        self.before_retry(event)
+        time.sleep(event.delay)
+
+    def before_retry(self, event):
+        """
+        Counts a retry and calls `on_retry`, without waiting. `wait` does this and then sleeps for
+        `event.delay`; an asyncio caller awaits the delay itself.
+        """
+        with self._lock:
+            self.retries += 1
+            self.time_waited += event.delay
+        logger.info('Retrying %s %s (attempt %d, status %s) in %.2fs', event.method, event.url, event.attempt,
+                    event.status_code, event.delay)
+        if self.on_retry is not None:
+            self.on_retry(event)
@@ -1,13 +1,23 @@
+from collections import namedtuple
+import copy
+import os
+import threading
 import xml.etree.ElementTree as ET
 
 from .exceptions import NotSignedInError
 from ..namespace import Namespace
-from .endpoint import Sites, Views, Users, Groups, Workbooks, Datasources, Projects, Auth, \
+from ..xml_helpers import ParsedResponse
+from .endpoint import Endpoint, Sites, Views, Users, Groups, Workbooks, Datasources, Projects, Auth, \
     Schedules, ServerInfo, Tasks, Subscriptions, Jobs, Metadata,\
     Databases, Tables, Flows, Webhooks, DataAccelerationReport, Favorites, DataAlerts
 from .endpoint.exceptions import EndpointUnavailableError, ServerInfoEndpointNotFoundError
+from .bulk import Bulk
+from .retry import RetryPolicy
+from .load_balancer import LoadBalancer
+from .transport import RequestsTransport
 
 import requests
+from requests.adapters import HTTPAdapter, DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
 
 try:
     from distutils2.version import NormalizedVersion as Version
@@ -23,21 +33,135 @@ _PRODUCT_TO_REST_VERSION = {
 }
 
 
+# Counts the forks of this process that it is a child of, so Servers notice when they are used in a child
+_forks = [0]
+
+
+def _count_fork():
+    _forks[0] += 1
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_count_fork)
+
+
+def _fork_id():
+    return _forks[0] if hasattr(os, 'register_at_fork') else os.getpid()
+
+
+class _SignedInSession(object):
+    # Who a Server is signed in as, shared with its clones. The ids and the token are replaced together
+    # so that a thread never sees the token of one sign in with the site of another.
+    def __init__(self):
+        self.ids = (None, None, None)
+        self.auth_request = None
+        # Held while a session that expired is replaced
+        self.reauthenticate_lock = threading.Lock()
+        self._lock = threading.Lock()
+        # The process the connections were opened in. Clones share them, so they are only reset once.
+        self.fork_id = _fork_id()
+
+    def replace(self, **changes):
+        with self._lock:
+            ids = dict(zip(('site_id', 'user_id', 'auth_token'), self.ids))
+            ids.update(changes)
+            self.ids = (ids['site_id'], ids['user_id'], ids['auth_token'])
+
+    def after_fork(self):
+        self.fork_id = _fork_id()
+        # Another thread of the parent may have held the locks when it forked
+        self.reauthenticate_lock = threading.Lock()
+        self._lock = threading.Lock()
+
+
+class ServerHandle(namedtuple('ServerHandle', ['server_address', 'version', 'namespace', 'site_id', 'user_id',
+                                               'auth_token', 'http_options'])):
+    """
+    What a signed in Server needs to make requests, in a form that can be pickled and sent to other processes.
+    `server()` makes a Server from it without signing in again.
+
+    >>> handle = server.handle()
+    >>> pool.map(partial(count_views, handle), workbook_ids)
+    >>> # in the worker: server = handle.server()
+    """
+    __slots__ = ()
+
+    def server(self, **kwargs):
+        """
+        A new Server signed in with this handle's session. Arguments are passed to `Server`.
+        """
+        server = Server(self.server_address, **kwargs)
+        server.version = self.version
+        server._namespace.seed(self.namespace)
+        server.add_http_options(self.http_options)
+        server._set_auth(self.site_id, self.user_id, self.auth_token)
+        return server
+
+
 class Server(object):
+    """
+    A Server can be shared by threads once it is configured and signed in. Options and hooks added later
+    are swapped in whole, so requests already running keep the ones they started with. Use `clone()`
+    for a Server with its own version, options and hooks that shares the session and connections.
+    """
+
     class PublishMode:
         Append = 'Append'
         Overwrite = 'Overwrite'
         CreateNew = 'CreateNew'
 
-    def __init__(self, server_address, use_server_version=False):
+    def __init__(self, server_address=None, use_server_version=False, pool_connections=DEFAULT_POOLSIZE,
+                 pool_maxsize=DEFAULT_POOLSIZE, pool_block=DEFAULT_POOLBLOCK, retry_policy=None,
+                 rate_limiter=None, concurrency_governor=None, transport=None,
+                 compression=True, server_info_cache=None, token_store=None, server_addresses=None,
+                 routing='round_robin', hedge_policy=None):
+        if server_address is None:
+            if not server_addresses:
+                raise ValueError("Server needs a server_address or server_addresses.")
+            server_address = server_addresses[0]
         self._server_address = server_address
-        self._auth_token = None
-        self._site_id = None
-        self._user_id = None
-        self._session = requests.Session()
+        # Optional LoadBalancer spreading requests over the gateway nodes of a cluster. URLs are built
+        # from server_address and sent to the node it picks.
+        self.load_balancer = LoadBalancer(server_addresses, routing) if server_addresses else None
+        self._signed_in = _SignedInSession()
+        # pool_maxsize is the number of connections kept open to the server. Set it to at least
+        # the number of threads sharing this Server, otherwise extra connections are closed after
+        # every request. pool_block makes threads wait for a free connection instead.
+        self._pool_options = dict(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                  pool_block=pool_block)
+        # Sends every request, requests.Session by default. The pool options only apply to the default,
+        # no Session is made when another transport is passed.
+        self.transport = transport if transport is not None else RequestsTransport(self._new_session())
+        self._owns_transport = transport is None
         self._http_options = dict()
+        self._before_request_hooks = []
+        self._after_request_hooks = []
+        # Transient failures (429, 502, 503, 504 and connection errors) of idempotent requests are retried
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        # Optional RateLimiter for every request made through this server
+        self.rate_limiter = rate_limiter
+        # Ask for gzip or deflate compressed responses, they are decompressed as they are read
+        self.compression = compression
+        # Optional ConcurrencyGovernor adapting how many requests are in flight at once
+        self.concurrency_governor = concurrency_governor
+        # Optional HedgePolicy duplicating slow GET requests
+        self.hedge_policy = hedge_policy
+        # Optional TokenStore sharing signed in sessions with other Servers and processes
+        self.token_store = token_store
 
         self.version = "2.3"
+        self._init_endpoints()
+        self.bulk = Bulk(self)
+        self._namespace = Namespace()
+        # Optional ServerInfoCache, saves use_server_version's round trips across sessions
+        self.server_info_cache = server_info_cache
+        # Whether the version came from the cache and has not been checked against the server yet
+        self._server_info_cached = False
+
+        if use_server_version:
+            self.use_server_version()
+
+    def _init_endpoints(self):
         self.auth = Auth(self)
         self.views = Views(self)
         self.users = Users(self)
@@ -59,50 +183,184 @@ class Server(object):
         self.webhooks = Webhooks(self)
         self.data_acceleration_report = DataAccelerationReport(self)
         self.data_alerts = DataAlerts(self)
-        self._namespace = Namespace()
 
-        if use_server_version:
-            self.use_server_version()
+    def clone(self):
+        """
+        A Server for another thread or task. It shares the signed in session, the connections, the namespace,
+        `bulk` and the retry, rate and concurrency limits with this one, but has its own endpoints, version,
+        http options and request hooks. Signing in or out on either one signs both in or out.
+        """
+        clone = copy.copy(self)
+        # Options and hooks are replaced rather than changed in place, so sharing the current ones is safe
+        clone._init_endpoints()
+        for name, endpoint in vars(self).items():
+            if isinstance(endpoint, Endpoint):
+                for attr, value in vars(endpoint).items():
+                    if attr.endswith('rate_limiter'):
+                        setattr(getattr(clone, name), attr, value)
+        return clone
+
+    def handle(self):
+        """
+        A picklable ServerHandle for using this Server's session from other processes. Transports,
+        hooks and limits are not included.
+        """
+        site_id, user_id, auth_token = self._signed_in.ids
+        return ServerHandle(self._server_address, self.version, self._namespace()['t'], site_id, user_id,
+                            auth_token, dict(self._http_options))
 
     def add_http_options(self, options_dict):
-        self._http_options.update(options_dict)
+        http_options = dict(self._http_options)
+        http_options.update(options_dict)
+        self._http_options = http_options
 
     def clear_http_options(self):
         self._http_options = dict()
 
+    def add_request_hook(self, before=None, after=None):
+        """
+        Registers callables run around every HTTP request. `before` receives a RequestEvent and `after`
+        a ResponseEvent with the status, bytes sent and received and the time taken. Retried requests
+        are reported once per attempt.
+        """
+        if before is not None:
+            self._before_request_hooks = self._before_request_hooks + [before]
+        if after is not None:
+            self._after_request_hooks = self._after_request_hooks + [after]
+
+    def clear_request_hooks(self):
+        self._before_request_hooks = []
+        self._after_request_hooks = []
+
+    @property
+    def request_hooks(self):
+        return self._before_request_hooks, self._after_request_hooks
+
+    def _new_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(**self._pool_options)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @property
+    def _site_id(self):
+        return self._signed_in.ids[0]
+
+    @_site_id.setter
+    def _site_id(self, value):
+        self._signed_in.replace(site_id=value)
+
+    @property
+    def _user_id(self):
+        return self._signed_in.ids[1]
+
+    @_user_id.setter
+    def _user_id(self, value):
+        self._signed_in.replace(user_id=value)
+
+    @property
+    def _auth_token(self):
+        return self._signed_in.ids[2]
+
+    @_auth_token.setter
+    def _auth_token(self, value):
+        self._signed_in.replace(auth_token=value)
+
+    @property
+    def _auth_request(self):
+        # The credentials of the last sign_in, to sign in again when the session expires
+        return self._signed_in.auth_request
+
+    @_auth_request.setter
+    def _auth_request(self, value):
+        self._signed_in.auth_request = value
+
+    @property
+    def transport(self):
+        if self._signed_in.fork_id != _fork_id():
+            self._after_fork()
+        return self._transport
+
+    @transport.setter
+    def transport(self, transport):
+        self._transport = transport
+
+    def _after_fork(self):
+        # This Server was inherited from a parent process. Its connections belong to the parent, so drop
+        # them and keep the signed in session.
+        self._signed_in.after_fork()
+        self._transport.after_fork()
+        self.bulk.after_fork()
+        self._namespace.after_fork()
+        self.retry_policy.after_fork()
+        # Threads of the parent may have held their locks when it forked
+        shared = [self.rate_limiter, self.concurrency_governor, self.load_balancer, self.hedge_policy,
+                  self.token_store, self.server_info_cache]
+        for endpoint in vars(self).values():
+            if isinstance(endpoint, Endpoint):
+                shared.extend(value for attr, value in vars(endpoint).items() if attr.endswith('rate_limiter'))
+        for item in shared:
+            if item is not None:
+                item.after_fork()
+
     def _clear_auth(self):
-        self._site_id = None
-        self._user_id = None
-        self._auth_token = None
-        self._session = requests.Session()
+        self._signed_in.ids = (None, None, None)
+        self._signed_in.auth_request = None
+        # Keep the session, and its open connections, for the next sign in. Only the cookies
+        # belong to the signed out user.
+        self.transport.clear_cookies()
 
     def _set_auth(self, site_id, user_id, auth_token):
-        self._site_id = site_id
-        self._user_id = user_id
-        self._auth_token = auth_token
+        self._signed_in.ids = (site_id, user_id, auth_token)
 
     def _get_legacy_version(self):
-        response = self._session.get(self.server_address + "/auth?format=xml")
+        response = self.transport.get(self.server_address + "/auth?format=xml")
         info_xml = ET.fromstring(response.content)
         prod_version = info_xml.find('.//product_version').text
         version = _PRODUCT_TO_REST_VERSION.get(prod_version, '2.1')  # 2.1
         return version
 
     def _determine_highest_version(self):
+        # Ask the 2.4 serverInfo endpoint without changing self.version, which other threads may be using
         try:
-            old_version = self.version
-            self.version = "2.4"
-            version = self.server_info.get().rest_api_version
+            version = self.server_info._get("{0}/api/2.4/serverInfo".format(self._server_address)).rest_api_version
         except ServerInfoEndpointNotFoundError:
             version = self._get_legacy_version()
 
-        finally:
-            self.version = old_version
-
         return version
 
     def use_server_version(self):
+        cache = self.server_info_cache
+        if cache is not None:
+            cached = cache.get(self.server_address)
+            if cached is not None:
+                self.version = cached['version']
+                self._namespace.seed(cached['namespace'], on_mismatch=self._invalidate_server_info)
+                self._server_info_cached = True
+                return
+
         self.version = self._determine_highest_version()
+        self._server_info_cached = False
+        if cache is not None:
+            cache.set(self.server_address, self.version, self._namespace()['t'])
+
+    def _invalidate_server_info(self):
+        if self.server_info_cache is not None:
+            self.server_info_cache.invalidate(self.server_address)
+
+    def _verify_server_info(self):
+        # A 404 that is not a REST API error may mean the cached version does not exist on this server,
+        # but other calls (e.g. a missing metadata endpoint) get those too. Ask serverInfo in that version.
+        if self.server_info_cache is None or not self._server_info_cached:
+            return
+        self._server_info_cached = False
+        try:
+            response = self.transport.get(self.server_info.baseurl, **self._http_options)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            return
+        if response.status_code == 404 and not ParsedResponse(response.content).is_xml():
+            self._invalidate_server_info()
 
     def use_highest_version(self):
         self.use_server_version()
@@ -150,13 +408,35 @@ class Server(object):
     def server_address(self):
         return self._server_address
 
+    @property
+    def accept_encoding(self):
+        return 'gzip, deflate' if self.compression else 'identity'
+
     @property
     def http_options(self):
         return self._http_options
 
     @property
     def session(self):
-        return self._session
+        """
+        The requests.Session of the transport. Transports built on other clients have none.
+        """
+        try:
+            return self.transport.session
+        except AttributeError:
+            raise AttributeError("The {0} transport does not use a requests Session.".format(
+                type(self.transport).__name__))
 
     def is_signed_in(self):
         return self._auth_token is not None
+
+    def close(self):
+        """
+        Stops the threads of `bulk` and of the hedge policy and closes the connections, unless the
+        transport was passed in. Clones share them, so only close a Server once its clones are done.
+        """
+        self.bulk.close()
+        if self.hedge_policy is not None:
+            self.hedge_policy.close()
+        if self._owns_transport:
+            self.transport.close()
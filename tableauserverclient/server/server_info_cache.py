@@ -0,0 +1,65 @@
+import logging
+import os
+import threading
+import time
+
+from .json_file import JsonFile
+
+logger = logging.getLogger('tableau.server_info_cache')
+
+
+class ServerInfoCache(object):
+    """
+    Keeps the REST API version negotiated by `use_server_version` and the namespace of the responses
+    in a JSON file, per server address, so that short-lived scripts can skip the round trips to find
+    them. Endpoint availability follows from the version, so caching it covers that too.
+
+    >>> cache = TSC.ServerInfoCache(ttl=3600)
+    >>> server = TSC.Server('https://tableau.example.com', use_server_version=True, server_info_cache=cache)
+
+    Entries older than `ttl` seconds are ignored. An entry is also dropped when the server shows it
+    is wrong: a response in another namespace, or a 404 that is not a REST API error from the serverInfo
+    call of the cached version, which is what an unsupported version gets. Updates are serialized between
+    processes with a lock file (on Windows only between the threads of a process).
+    """
+
+    def __init__(self, path=None, ttl=24 * 60 * 60):
+        if path is None:
+            path = os.path.join(os.path.expanduser('~'), '.cache', 'tableauserverclient', 'server_info.json')
+        self._file = JsonFile(os.path.expanduser(path))
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    def after_fork(self):
+        # Another thread of the parent may have held the lock when it forked
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        return self._file.path
+
+    @staticmethod
+    def _key(server_address):
+        return server_address.rstrip('/').lower()
+
+    def get(self, server_address):
+        """
+        Returns the cached entry, a dict with `version` and `namespace`, or None if there is no fresh entry.
+        """
+        entry = self._file.load().get(self._key(server_address))
+        if not isinstance(entry, dict) or time.time() - entry.get('updated_at', 0) > self.ttl:
+            return None
+        return entry
+
+    def set(self, server_address, version, namespace):
+        with self._file.lock(self._lock):
+            entries = self._file.load()
+            entries[self._key(server_address)] = dict(version=version, namespace=namespace, updated_at=time.time())
+            self._file.save(entries)
+
+    def invalidate(self, server_address):
+        with self._file.lock(self._lock):
+            entries = self._file.load()
+            if entries.pop(self._key(server_address), None) is not None:
+                logger.info('Dropped the cached server info for %s', server_address)
+                self._file.save(entries)
@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+
+from .bulk import run_pooled
+from .server import Server
+
+logger = logging.getLogger('tableau.server_pool')
+
+
+class _ServerPool(object):
+    """
+    Base of the pools of signed in Servers (SitePool, PersonalAccessTokenPool). Makes their Servers,
+    looking the API version up only once with `use_server_version`, runs work on them and signs them
+    out on `close`. Other arguments are passed to every Server.
+    """
+
+    def __init__(self, server_address, use_server_version=False, **server_kwargs):
+        self.server_address = server_address
+        self._use_server_version = use_server_version
+        self._server_kwargs = server_kwargs
+        self._version = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _new_server(self):
+        server = Server(self.server_address, **self._server_kwargs)
+        with self._lock:
+            version = self._version
+        if version is None and self._use_server_version:
+            server.use_server_version()
+            with self._lock:
+                self._version = server.version
+        elif version is not None:
+            server.version = version
+        return server
+
+    def _run(self, call, items, concurrency):
+        # Each call runs on a thread of its own pool, the Servers' `bulk` pools are left to the callers
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            return run_pooled(executor, call, items, type(self).__name__)
+        finally:
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def _close_servers(servers):
+        for server in servers:
+            try:
+                server.auth.sign_out()
+            except Exception as e:
+                logger.warning('Could not sign out of {0}: {1}'.format(server.server_address, e))
+            server.close()
+
+    def close(self):
+        raise NotImplementedError()
@@ -0,0 +1,90 @@
+import copy
+import logging
+import threading
+
+from .pager import Pager
+from .server_pool import _ServerPool
+
+logger = logging.getLogger('tableau.site_pool')
+
+
+def _content_url(site):
+    return getattr(site, 'content_url', site) or ''
+
+
+class SitePool(_ServerPool):
+    """
+    Signed in Servers for many sites of one Tableau Server, so work can run on several sites at once
+    instead of switching the site of a single Server. Each site gets its own Server, signed in the first
+    time it is used and kept, with its connections, until the pool is closed.
+
+    >>> with TSC.SitePool('https://tableau.example.com', tableau_auth) as pool:
+    >>>     results = pool.map(lambda server, site: list(TSC.Pager(server.workbooks)), concurrency=8)
+    >>>     workbooks = {r.item.content_url: r.result for r in results if r.ok}
+
+    Sites are given as content URLs ('' is the default site) or SiteItems. `auth_req` is copied for each
+    site with its `site_id` set to the site's content URL. Other arguments are passed to every Server;
+    the API version is only looked up once with `use_server_version`.
+    """
+
+    def __init__(self, server_address, auth_req, use_server_version=False, concurrency=8, **server_kwargs):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        super(SitePool, self).__init__(server_address, use_server_version, **server_kwargs)
+        self.concurrency = concurrency
+        self._auth_req = auth_req
+        self._servers = dict()
+        self._site_locks = dict()
+
+    def server(self, site):
+        """
+        The Server signed in to `site`, signing in if this is the first time the site is used.
+        """
+        content_url = _content_url(site)
+        with self._lock:
+            server = self._servers.get(content_url)
+            if server is not None:
+                return server
+            site_lock = self._site_locks.setdefault(content_url, threading.Lock())
+
+        # Sign in to different sites at the same time, but only once to each site
+        with site_lock:
+            with self._lock:
+                server = self._servers.get(content_url)
+            if server is None:
+                server = self._new_server()
+                auth_req = copy.copy(self._auth_req)
+                auth_req.site_id = content_url
+                server.auth.sign_in(auth_req)
+                logger.info('Signed into site {0!r}'.format(content_url))
+                with self._lock:
+                    self._servers[content_url] = server
+        return server
+
+    def sites(self):
+        """
+        All the sites on the server, as SiteItems. Listing sites needs a server administrator.
+        """
+        return list(Pager(self.server(self._auth_req.site_id).sites))
+
+    def map(self, fn, sites=None, concurrency=None):
+        """
+        Calls `fn(server, site)` for every site, with the Server signed in to that site, running up to
+        `concurrency` sites at once. `sites` defaults to every site on the server. Returns a list of
+        BulkResult in the order of `sites`; a failing site records its exception instead of stopping the rest.
+        """
+        if sites is None:
+            sites = self.sites()
+
+        def call(site):
+            return fn(self.server(site), site)
+
+        return self._run(call, sites, concurrency or self.concurrency)
+
+    def close(self):
+        """
+        Signs out of every site and closes the connections.
+        """
+        with self._lock:
+            servers, self._servers = list(self._servers.values()), dict()
+        self._close_servers(servers)
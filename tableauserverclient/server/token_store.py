@@ -0,0 +1,111 @@
+import hashlib
+import os
+import threading
+import time
+
+from .json_file import JsonFile
+
+
+def token_key(server_address, auth_req):
+    """
+    The key a sign in is stored under: a hash of the server address, the site, the credentials and
+    the user impersonated, so no credentials end up in the store.
+    """
+    parts = [server_address.rstrip('/').lower(), auth_req.site_id or '', auth_req.user_id_to_impersonate or '']
+    parts.extend('{0}={1}'.format(name, value) for name, value in sorted(auth_req.credentials.items()))
+    return hashlib.sha256(u'\n'.join(parts).encode('utf-8')).hexdigest()
+
+
+class TokenStore(object):
+    """
+    Shares the sessions of `sign_in` between Server objects, so the same user signs in to a site only
+    once. This base class keeps them in memory, for the Servers of one process; `FileTokenStore` shares
+    them between processes and other backends can override `lock`, `_load` and `_save`.
+
+    >>> store = TSC.TokenStore()
+    >>> server = TSC.Server('https://tableau.example.com', token_store=store)
+
+    Sessions older than `ttl` seconds are not reused. Tableau Server ends idle sessions after 240 minutes
+    by default, and a session that has already ended is replaced the first time a request gets a 401.
+
+    With a store, `sign_out()` leaves the shared session running for the other Servers and
+    `sign_out(force=True)` ends it for all of them. `switch_site` signs in to the other site, under that
+    site's own entry, rather than moving the shared session.
+    """
+
+    def __init__(self, ttl=2 * 60 * 60):
+        self.ttl = ttl
+        self._lock = threading.RLock()
+        self._entries = dict()
+
+    def lock(self):
+        """
+        Held while signing in, so that other Servers wait and reuse the new session instead of signing in too.
+        `get`, `set` and `invalidate` are called while holding it.
+        """
+        return self._lock
+
+    def after_fork(self):
+        # Another thread of the parent may have been signing in when it forked
+        self._lock = threading.RLock()
+
+    def _load(self):
+        return self._entries
+
+    def _save(self, entries):
+        self._entries = entries
+
+    def get(self, key):
+        """
+        Returns the stored session, a dict with `site_id`, `user_id` and `auth_token`, or None if there is no fresh one.
+        """
+        entry = self._load().get(key)
+        if not isinstance(entry, dict) or time.time() - entry.get('updated_at', 0) > self.ttl:
+            return None
+        return entry
+
+    def set(self, key, site_id, user_id, auth_token):
+        entries = self._load()
+        entries[key] = dict(site_id=site_id, user_id=user_id, auth_token=auth_token, updated_at=time.time())
+        self._save(entries)
+
+    def invalidate(self, key, auth_token=None):
+        """
+        Drops the stored session. With `auth_token` it is only dropped if it is still that one,
+        so a session another process has just replaced is kept.
+        """
+        entries = self._load()
+        entry = entries.get(key)
+        if entry is None or (auth_token is not None and entry.get('auth_token') != auth_token):
+            return
+        del entries[key]
+        self._save(entries)
+
+
+class FileTokenStore(TokenStore):
+    """
+    A TokenStore in a JSON file, shared by every process of the same OS user. The file is only readable by
+    its owner, and sign ins are serialized between processes with a lock file (on Windows only between
+    the threads of a process).
+
+    >>> store = TSC.FileTokenStore('~/.cache/tableauserverclient/tokens.json')
+    """
+
+    def __init__(self, path=None, ttl=2 * 60 * 60):
+        super(FileTokenStore, self).__init__(ttl)
+        if path is None:
+            path = os.path.join(os.path.expanduser('~'), '.cache', 'tableauserverclient', 'tokens.json')
+        self._file = JsonFile(os.path.expanduser(path))
+
+    @property
+    def path(self):
+        return self._file.path
+
+    def lock(self):
+        return self._file.lock(self._lock)
+
+    def _load(self):
+        return self._file.load()
+
+    def _save(self, entries):
+        self._file.save(entries)
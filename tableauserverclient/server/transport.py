@@ -0,0 +1,298 @@
+import io
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+import urllib3
+
+try:
+    from urllib.parse import urlencode
+except ImportError:
+    from urllib import urlencode
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class Transport(object):
+    """
+    Sends the HTTP requests of a Server. Endpoints call `get`, `post`, `put` and `delete` with the
+    same arguments as `requests` (`params`, `headers`, `data`, `stream` and the server's http_options),
+    and use the response like a `requests.Response`: `status_code`, `headers`, `content`, `encoding`,
+    `iter_content`, `raw` and `close`. Failures to connect or time-outs are raised as
+    `requests.exceptions.ConnectionError` and `requests.exceptions.Timeout`.
+
+    >>> server = TSC.Server('https://tableau.example.com', transport=TSC.Urllib3Transport(maxsize=32))
+    """
+
+    def request(self, method, url, **kwargs):
+        raise NotImplementedError
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request('DELETE', url, **kwargs)
+
+    def clear_cookies(self):
+        pass
+
+    def after_fork(self):
+        """
+        Called in a child process before its first request, to drop the connections opened by the parent.
+        """
+        pass
+
+    def close(self):
+        pass
+
+
+class RequestsTransport(Transport):
+    """
+    The default transport, a `requests.Session`.
+    """
+
+    def __init__(self, session=None):
+        self.session = session if session is not None else requests.Session()
+
+    def request(self, method, url, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def clear_cookies(self):
+        self.session.cookies.clear()
+
+    def after_fork(self):
+        # Closing a socket in the child leaves the parent's copy of it open, so this does not affect the parent
+        for adapter in self.session.adapters.values():
+            adapter.poolmanager.clear()
+            for proxy_manager in getattr(adapter, 'proxy_manager', {}).values():
+                proxy_manager.clear()
+
+    def close(self):
+        self.session.close()
+
+
+class TransportResponse(object):
+    """
+    The parts of `requests.Response` the endpoints use, for transports built on other clients.
+    `raw` is a file-like object of the decoded body, read as it arrives.
+    """
+
+    def __init__(self, status_code, headers, raw, url=None, on_close=None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.encoding = get_encoding_from_headers(self.headers)
+        self.raw = raw
+        self.url = url
+        self._content = None
+        self._on_close = on_close
+
+    @property
+    def content(self):
+        if self._content is None:
+            self._content = self.raw.read()
+            self.close()
+        return self._content
+
+    def iter_content(self, chunk_size=1):
+        if self._content is not None:
+            for i in range(0, len(self._content), chunk_size):
+                yield self._content[i:i + chunk_size]
+            return
+        while True:
+            chunk = self.raw.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        self.close()
+
+    def close(self):
+        if self._on_close is not None:
+            on_close, self._on_close = self._on_close, None
+            on_close()
+
+
+def _encode_body(data):
+    if isinstance(data, str):
+        return data.encode('utf-8')
+    return data
+
+
+def _with_params(url, params):
+    if not params:
+        return url
+    return '{0}{1}{2}'.format(url, '&' if '?' in url else '?', urlencode(params, doseq=True))
+
+
+def _check_options(transport, options, supported):
+    unsupported = [name for name in options if name not in supported]
+    if unsupported:
+        error = "{0} does not support the {1} http options, configure the transport instead".format(
+            type(transport).__name__, ', '.join(sorted(unsupported)))
+        raise ValueError(error)
+
+
+class Urllib3Transport(Transport):
+    """
+    A lean transport on a `urllib3.PoolManager`. `maxsize` is the number of connections kept open per
+    host, and other arguments (`cert_reqs`, `ca_certs`, `timeout`, ...) are passed to the PoolManager.
+    Only the `timeout` and `allow_redirects` http options are supported per request.
+    """
+
+    def __init__(self, num_pools=10, maxsize=10, block=False, **pool_kwargs):
+        self.pool = urllib3.PoolManager(num_pools=num_pools, maxsize=maxsize, block=block, **pool_kwargs)
+
+    def after_fork(self):
+        self.pool.clear()
+
+    def request(self, method, url, params=None, headers=None, data=None, stream=False, **options):
+        _check_options(self, options, ('timeout', 'allow_redirects'))
+        # Retrying is left to the Server's RetryPolicy, urllib3 only follows redirects
+        redirect = options.get('allow_redirects', True)
+        retries = urllib3.Retry(total=None, connect=0, read=0, status=0, redirect=10 if redirect else 0,
+                                raise_on_redirect=False)
+        kwargs = dict(headers=headers, body=_encode_body(data), retries=retries, redirect=redirect,
+                      preload_content=False, decode_content=True)
+        if options.get('timeout') is not None:
+            kwargs['timeout'] = options['timeout']
+        try:
+            response = self.pool.request(method, _with_params(url, params), **kwargs)
+        except (urllib3.exceptions.TimeoutError, urllib3.exceptions.MaxRetryError) as e:
+            reason = getattr(e, 'reason', e)
+            # NewConnectionError is a TimeoutError subclass in urllib3, but a refused connection is not a time-out
+            if isinstance(reason, urllib3.exceptions.TimeoutError) and \
+                    not isinstance(reason, urllib3.exceptions.NewConnectionError):
+                raise requests.exceptions.Timeout(e)
+            raise requests.exceptions.ConnectionError(e)
+        except urllib3.exceptions.HTTPError as e:
+            raise requests.exceptions.ConnectionError(e)
+
+        transport_response = TransportResponse(response.status, response.headers, response, url=url,
+                                               on_close=lambda: _release(response))
+        if not stream:
+            # Read the whole body now, as requests does
+            transport_response.content
+        return transport_response
+
+
+def _release(response):
+    # Finish reading the body first so the connection can be reused
+    response.drain_conn()
+    response.release_conn()
+
+
+class _IteratorReader(io.RawIOBase):
+    # File-like reads over an iterator of byte chunks
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b''
+        self.decode_content = True
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+
+class HttpxTransport(Transport):
+    """
+    A transport on an `httpx.Client`, which can multiplex requests over HTTP/2 connections (needs
+    `pip install httpx[http2]`). Other arguments (`verify`, `limits`, `timeout`, ...) are passed to
+    the Client. Only the `timeout` and `allow_redirects` http options are supported per request.
+    """
+
+    def __init__(self, http2=True, **client_kwargs):
+        if httpx is None:
+            raise ImportError("HttpxTransport needs httpx, install it with: pip install httpx[http2]")
+        self._client_kwargs = dict(client_kwargs, http2=http2)
+        self.client = httpx.Client(**self._client_kwargs)
+
+    def request(self, method, url, params=None, headers=None, data=None, stream=False, **options):
+        _check_options(self, options, ('timeout', 'allow_redirects'))
+        kwargs = dict()
+        if options.get('timeout') is not None:
+            kwargs['timeout'] = options['timeout']
+        request = self.client.build_request(method, url, params=params, headers=headers,
+                                            content=_encode_body(data), **kwargs)
+        try:
+            response = self.client.send(request, stream=True, follow_redirects=options.get('allow_redirects', True))
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e)
+
+        transport_response = TransportResponse(response.status_code, response.headers,
+                                               _IteratorReader(response.iter_bytes()), url=url, on_close=response.close)
+        if not stream:
+            # Read the whole body now, as requests does
+            transport_response.content
+        return transport_response
+
+    def clear_cookies(self):
+        self.client.cookies.clear()
+
+    def after_fork(self):
+        # Start a new client rather than closing the parent's connections, closing an HTTP/2 connection
+        # can tell the server it is going away
+        cookies = self.client.cookies
+        self.client = httpx.Client(**self._client_kwargs)
+        self.client.cookies = cookies
+
+    def close(self):
+        self.client.close()
+
+
+class AsyncHttpxTransport(object):
+    """
+    Sends the requests of an AsyncServer on an `httpx.AsyncClient`, so they are awaited on the event loop
+    rather than holding a thread each. `request` is a coroutine with the arguments of `Transport.request`,
+    except `stream`: the whole body is read before it returns. Other arguments (`verify`, `limits`,
+    `timeout`, ...) are passed to the AsyncClient. Only the `timeout` and `allow_redirects` http options
+    are supported per request.
+    """
+
+    def __init__(self, http2=True, **client_kwargs):
+        if httpx is None:
+            raise ImportError("AsyncHttpxTransport needs httpx, install it with: pip install httpx[http2]")
+        self.client = httpx.AsyncClient(http2=http2, **client_kwargs)
+
+    async def request(self, method, url, params=None, headers=None, data=None, **options):
+        _check_options(self, options, ('timeout', 'allow_redirects'))
+        kwargs = dict()
+        if options.get('timeout') is not None:
+            kwargs['timeout'] = options['timeout']
+        request = self.client.build_request(method, url, params=params, headers=headers,
+                                            content=_encode_body(data), **kwargs)
+        try:
+            response = await self.client.send(request, follow_redirects=options.get('allow_redirects', True))
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e)
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e)
+        transport_response = TransportResponse(response.status_code, response.headers, io.BytesIO(response.content),
+                                               url=url)
+        transport_response.content
+        return transport_response
+
+    def clear_cookies(self):
+        self.client.cookies.clear()
+
+    async def close(self):
+        await self.client.aclose()
@@ -0,0 +1,296 @@
+from collections import deque
+import re
+import threading
+import xml.etree.ElementTree as ET
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+NAMESPACE_RE = re.compile(r'\{(.*?)\}')
+
+
+class ElementTreeBackend(object):
+    """
+    Parses responses with the standard library's `xml.etree.ElementTree`.
+    """
+    name = 'etree'
+
+    def fromstring(self, content):
+        return ET.fromstring(content)
+
+
+class LxmlBackend(object):
+    """
+    Parses responses with lxml, which is considerably faster on large responses. Parse errors are
+    raised as `ElementTree.ParseError` so callers do not need to know which backend is in use.
+    """
+    name = 'lxml'
+
+    def __init__(self):
+        # lxml parsers must not be shared between threads
+        self._local = threading.local()
+
+    def _parser(self):
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = lxml_etree.XMLParser(resolve_entities=False, no_network=True,
+                                          remove_comments=True, remove_pis=True)
+            self._local.parser = parser
+        return parser
+
+    def fromstring(self, content):
+        if not isinstance(content, bytes):
+            # lxml refuses unicode strings that carry an encoding declaration
+            content = content.encode('utf-8')
+        try:
+            return lxml_etree.fromstring(content, self._parser())
+        except lxml_etree.XMLSyntaxError as e:
+            raise ET.ParseError(str(e))
+
+
+_backend = LxmlBackend() if lxml_etree is not None else ElementTreeBackend()
+
+# Compiled XPath expressions for lxml, per thread since they must not be shared between threads
+_compiled_paths = threading.local()
+
+
+def get_xml_backend():
+    """
+    Name of the backend used to parse responses, 'lxml' or 'etree'.
+    """
+    return _backend.name
+
+
+def set_xml_backend(name):
+    """
+    Choose the backend used to parse responses. 'lxml' is used by default when it is installed.
+    """
+    global _backend
+    if name == LxmlBackend.name:
+        if lxml_etree is None:
+            raise ValueError("The lxml backend needs lxml to be installed.")
+        _backend = LxmlBackend()
+    elif name == ElementTreeBackend.name:
+        _backend = ElementTreeBackend()
+    else:
+        raise ValueError("Unknown XML backend `{}`.".format(name))
+
+
+def iselement(element):
+    return ET.iselement(element)
+
+
+def _is_lxml_element(element):
+    return lxml_etree is not None and isinstance(element, lxml_etree._Element)
+
+
+def _compiled_path(path, namespaces):
+    cache = getattr(_compiled_paths, 'cache', None)
+    if cache is None:
+        cache = _compiled_paths.cache = dict()
+    key = (path, tuple(sorted(namespaces.items())))
+    xpath = cache.get(key)
+    if xpath is None:
+        xpath = cache[key] = lxml_etree.XPath(path, namespaces=namespaces)
+    return xpath
+
+
+def findall(element, path, namespaces):
+    """
+    `element.findall(path, namespaces)`, evaluated with a precompiled XPath expression for lxml elements.
+    """
+    if _is_lxml_element(element):
+        return _compiled_path(path, namespaces)(element)
+    return element.findall(path, namespaces)
+
+
+def find(element, path, namespaces):
+    """
+    `element.find(path, namespaces)`, evaluated with a precompiled XPath expression for lxml elements.
+    """
+    if _is_lxml_element(element):
+        matches = _compiled_path(path, namespaces)(element)
+        return matches[0] if matches else None
+    return element.find(path, namespaces)
+
+
+class _QualifiedNames(dict):
+    def __init__(self, uri):
+        super(_QualifiedNames, self).__init__()
+        self._uri = uri
+
+    def __missing__(self, tag):
+        qualified = self[tag] = '{{{0}}}{1}'.format(self._uri, tag)
+        return qualified
+
+
+_qualified_names = dict()
+
+
+def qualified_names(namespaces):
+    """
+    Shared mapping of tag names to their qualified '{namespace}tag' names in the 't' namespace,
+    built as tags are looked up so each name is only formatted once.
+    """
+    uri = namespaces['t']
+    names = _qualified_names.get(uri)
+    if names is None:
+        names = _qualified_names.setdefault(uri, _QualifiedNames(uri))
+    return names
+
+
+def find_child(element, tag, namespaces):
+    """
+    The first direct child of `element` named `tag`. Unlike `.//t:tag` this does not search the
+    whole subtree, so it is faster and cannot match an element nested further down.
+    """
+    qualified = qualified_names(namespaces)[tag]
+    if _is_lxml_element(element):
+        # lxml's find() goes through its Python path engine, iterchildren() stays in C
+        return next(element.iterchildren(qualified), None)
+    return element.find(qualified)
+
+
+class ParsedResponse(object):
+    """
+    The body of a server response, parsed into an element tree the first time it is needed.
+    """
+
+    def __init__(self, content):
+        self.content = content
+        self._root = None
+
+    @property
+    def root(self):
+        if self._root is None:
+            self._root = _backend.fromstring(self.content)
+        return self._root
+
+    def is_xml(self):
+        return self.content.startswith(b'<?xml') if isinstance(self.content, bytes) \
+            else self.content.startswith('<?xml')
+
+
+def parse_response(content):
+    """
+    Returns `content` if it is already a `ParsedResponse`, otherwise a new one for the body.
+    """
+    if isinstance(content, ParsedResponse):
+        return content
+    return ParsedResponse(content)
+
+
+def fromstring(content):
+    """
+    Drop in replacement for `ElementTree.fromstring` that accepts a response body,
+    a `ParsedResponse` or an already parsed element. Pass the response's `parsed_response`
+    so a body read by several parsers is only parsed once.
+    """
+    if iselement(content):
+        return content
+    return parse_response(content).root
+
+
+class _CountingReader(object):
+    def __init__(self, source):
+        self._source = source
+        self.count = 0
+
+    def read(self, size=-1):
+        data = self._source.read(size)
+        self.count += len(data)
+        return data
+
+
+class StreamingDecoder(object):
+    """
+    Decodes the items of a list response (e.g. the workbooks in `<workbooks>`) while the body is read,
+    using `ElementTree.iterparse`. Each item's elements are discarded as soon as its model has been built,
+    so memory use stays flat no matter how large the page is.
+
+    `source` is a file-like object, `model` is the model class whose `from_response` builds the items.
+    If a `Namespace` is passed it is told about the namespace of the response.
+    """
+
+    def __init__(self, source, model, namespace=None, on_close=None):
+        self._source = _CountingReader(source)
+        self._events = ET.iterparse(self._source, events=('start', 'end'))
+        self._model = model
+        self._namespace = namespace
+        self._on_close = on_close
+        self._ns = None
+        self._pagination_item = None
+        self._pending = deque()
+        self._items = self._decode()
+        self._done = False
+
+    @property
+    def bytes_read(self):
+        """Number of (decompressed) bytes of the body parsed so far."""
+        return self._source.count
+
+    @property
+    def pagination_item(self):
+        from .models import PaginationItem
+
+        # Pagination comes before the items in responses, but buffer any items we pass just in case
+        while self._pagination_item is None and not self._done:
+            try:
+                self._pending.append(next(self._items))
+            except StopIteration:
+                self._done = True
+        return self._pagination_item or PaginationItem()
+
+    def __iter__(self):
+        while self._pending:
+            yield self._pending.popleft()
+        for item in self._items:
+            yield item
+        self._done = True
+
+    def close(self):
+        self._items.close()
+
+    def _decode(self):
+        from .models import PaginationItem
+
+        depth = 0
+        container = None
+        try:
+            for event, element in self._events:
+                if event == 'start':
+                    depth += 1
+                    if depth == 1:
+                        self._detect_namespace(element.tag)
+                    elif depth == 2:
+                        container = element
+                    continue
+
+                if depth == 2 and element.tag == '{{{0}}}pagination'.format(self._ns['t']):
+                    self._pagination_item = PaginationItem.from_response(self._wrap(element), self._ns)
+                elif depth == 3:
+                    for item in self._model.from_response(self._wrap(element), self._ns):
+                        yield item
+                    # Drop the decoded item from the tree so it can be freed
+                    container.clear()
+                depth -= 1
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+
+    def _detect_namespace(self, tag):
+        if self._namespace is not None:
+            self._namespace.detect_tag(tag)
+            self._ns = self._namespace()
+            return
+        matches = NAMESPACE_RE.match(tag)
+        self._ns = {'t': matches.group(1) if matches else ''}
+
+    @staticmethod
+    def _wrap(element):
+        # Model parsers search below the element they are given, so hand them a parent holding just this one
+        wrapper = ET.Element('tsResponse')
+        wrapper.append(element)
+        return wrapper
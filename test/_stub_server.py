@@ -0,0 +1,102 @@
+import json
+import socket
+import threading
+import time
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import urlparse, parse_qs
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import urlparse, parse_qs
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class StubServer(object):
+    """
+    A local keep-alive HTTP server for tests and benchmarks that need real sockets. `routes` maps a
+    path to (status, headers, body) or to a callable taking the handler and returning that. Any other
+    path gets the `default` route, or has the request echoed back as JSON without one. `connections`
+    counts the TCP connections accepted.
+    """
+
+    def __init__(self, routes=None, default=None):
+        self.routes = dict(routes or {})
+        self.default = default
+        self.requests = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._httpd = _ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = threading.Thread(target=self._httpd.serve_forever)
+        self._thread.daemon = True
+
+    @property
+    def address(self):
+        return 'http://127.0.0.1:{}'.format(self._httpd.server_address[1])
+
+    def url(self, path):
+        return self.address + path
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                BaseHTTPRequestHandler.setup(self)
+                # Headers and body are written separately, don't let Nagle hold the body back
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                with stub._lock:
+                    stub.connections += 1
+
+            def _handle(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                self.body = self.rfile.read(length) if length else b''
+                parsed = urlparse(self.path)
+                with stub._lock:
+                    stub.requests.append((self.command, self.path, dict(self.headers), self.body))
+
+                route = stub.routes.get(parsed.path, stub.default)
+                if callable(route):
+                    route = route(self)
+                if route is None:
+                    echo = dict(method=self.command, path=parsed.path, query=parse_qs(parsed.query),
+                                headers=dict((k.lower(), v) for k, v in self.headers.items()),
+                                body=self.body.decode('utf-8'))
+                    route = (200, {'Content-Type': 'application/json'}, json.dumps(echo).encode('utf-8'))
+                status, headers, body = route
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if self.command != 'HEAD':
+                    self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+def slow(seconds, route):
+    def handler(request):
+        time.sleep(seconds)
+        return route
+    return handler
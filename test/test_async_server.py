@@ -0,0 +1,250 @@
+import asyncio
+import time
+import unittest
+import requests_mock
+import tableauserverclient as TSC
+from tableauserverclient.server.transport import httpx
+
+from ._stub_server import StubServer, slow
+from ._utils import read_xml_asset
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+GET_XML = 'workbook_get.xml'
+GET_XML_PAGE1 = 'workbook_get_page_1.xml'
+GET_XML_PAGE2 = 'workbook_get_page_2.xml'
+GET_XML_PAGE3 = 'workbook_get_page_3.xml'
+POPULATE_CONNECTIONS_XML = 'workbook_populate_connections.xml'
+SIGN_IN_XML = 'auth_sign_in.xml'
+SITE_ID = '6b7179ba-b82b-4f0f-91ed-812074ac5da6'
+
+
+class ThreadedAsyncServerTests(unittest.TestCase):
+    def setUp(self):
+        self.server = TSC.ThreadedAsyncServer('http://test')
+
+        # Fake sign in
+        self.server.server._site_id = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+        self.server.server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+        self.baseurl = self.server.workbooks.baseurl
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+        self.server.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_requires_address_or_server(self):
+        self.assertRaises(ValueError, TSC.ThreadedAsyncServer)
+
+    def test_close_closes_server(self):
+        with mock.patch.object(self.server.server, 'close') as close:
+            self.server.close()
+        close.assert_called_once_with()
+
+    def test_reads_through_to_server(self):
+        self.assertEqual('dad65087-b08b-4603-af4e-2887b8aafc67', self.server.site_id)
+        self.assertEqual(self.server.server.workbooks.baseurl, self.server.workbooks.baseurl)
+
+    def test_get(self):
+        response_xml = read_xml_asset(GET_XML)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=response_xml)
+            all_workbooks, pagination_item = self.run_async(self.server.workbooks.get())
+
+        self.assertEqual(2, pagination_item.total_available)
+        self.assertEqual(['Superstore', 'SafariSample'], [wb.name for wb in all_workbooks])
+
+    def test_concurrent_gets(self):
+        response_xml = read_xml_asset(GET_XML)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=response_xml)
+
+            async def get_many():
+                return await asyncio.gather(*[self.server.workbooks.get() for _ in range(50)])
+
+            results = self.run_async(get_many())
+
+        self.assertEqual(50, len(results))
+        self.assertTrue(all(len(workbooks) == 2 for workbooks, _ in results))
+
+    def test_populate_connections_fetches_eagerly(self):
+        response_xml = read_xml_asset(POPULATE_CONNECTIONS_XML)
+        single_workbook = TSC.WorkbookItem('test')
+        single_workbook._id = '1f951daf-4061-451a-9df1-69a8062664f2'
+        with requests_mock.mock() as m:
+            m.get(self.baseurl + '/1f951daf-4061-451a-9df1-69a8062664f2/connections', text=response_xml)
+            self.run_async(self.server.workbooks.populate_connections(single_workbook))
+            self.assertEqual(1, m.call_count)
+
+        # Reading the property again must not go back to the server
+        self.assertEqual('37ca6ced-58d7-4dcf-99dc-f0a85223cbef', single_workbook.connections[0].id)
+        self.assertEqual('World Indicators', single_workbook.connections[0].datasource_name)
+
+    def test_error_is_raised_on_await(self):
+        response_xml = read_xml_asset('auth_sign_in_error.xml')
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, status_code=401, text=response_xml)
+            with self.assertRaises(TSC.ServerResponseError):
+                self.run_async(self.server.workbooks.get())
+
+    def test_async_pager(self):
+        page_1, page_2, page_3 = (read_xml_asset(GET_XML_PAGE1), read_xml_asset(GET_XML_PAGE2),
+                                  read_xml_asset(GET_XML_PAGE3))
+
+        async def collect(pager):
+            workbooks = []
+            async for workbook in pager:
+                workbooks.append(workbook)
+            return workbooks
+
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=page_1)
+            m.get(self.baseurl + "?pageNumber=1&pageSize=1", text=page_1)
+            m.get(self.baseurl + "?pageNumber=2&pageSize=1", text=page_2)
+            m.get(self.baseurl + "?pageNumber=3&pageSize=1", text=page_3)
+
+            workbooks = self.run_async(collect(TSC.AsyncPager(self.server.workbooks)))
+            self.assertEqual(['Page1Workbook', 'Page2Workbook', 'Page3Workbook'], [wb.name for wb in workbooks])
+
+            opts = TSC.RequestOptions(pagenumber=2, pagesize=1)
+            workbooks = self.run_async(collect(TSC.AsyncPager(self.server.workbooks, opts)))
+            self.assertEqual(['Page2Workbook', 'Page3Workbook'], [wb.name for wb in workbooks])
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class AsyncServerTests(unittest.TestCase):
+    def setUp(self):
+        self.responses = dict()
+        self.requests = []
+        self.server = TSC.AsyncServer('http://test', transport=TSC.AsyncHttpxTransport(
+            transport=httpx.MockTransport(self.respond)))
+        self.server.server.retry_policy = TSC.RetryPolicy(backoff_factor=0)
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.run_async(self.server.close())
+        self.loop.close()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def respond(self, request):
+        self.requests.append(request)
+        key = (request.method, request.url.path, request.url.query.decode('ascii'))
+        responses = self.responses[key]
+        status_code, name = responses.pop(0) if len(responses) > 1 else responses[0]
+        return httpx.Response(status_code, content=read_xml_asset(name).encode('utf-8'))
+
+    def sign_in(self):
+        self.responses[('POST', '/api/2.3/auth/signin', '')] = [(200, SIGN_IN_XML)]
+        self.run_async(self.server.auth.sign_in(TSC.TableauAuth('username', 'password')))
+
+    def test_sign_in_and_out(self):
+        self.sign_in()
+        self.assertEqual(SITE_ID, self.server.site_id)
+        self.assertEqual('1a96d216-e9b8-497b-a82a-0b899a965e01', self.server.user_id)
+
+        self.responses[('POST', '/api/2.3/auth/signout', '')] = [(204, SIGN_IN_XML)]
+        self.run_async(self.server.auth.sign_out())
+        self.assertFalse(self.server.is_signed_in())
+
+    def test_get(self):
+        self.sign_in()
+        self.responses[('GET', '/api/2.3/sites/{0}/workbooks'.format(SITE_ID), '')] = [(200, GET_XML)]
+        all_workbooks, pagination_item = self.run_async(self.server.workbooks.get())
+
+        self.assertEqual(2, pagination_item.total_available)
+        self.assertEqual(['Superstore', 'SafariSample'], [wb.name for wb in all_workbooks])
+        self.assertEqual(self.server.auth_token, self.requests[-1].headers['x-tableau-auth'])
+
+    def test_get_by_id(self):
+        self.sign_in()
+        url = '/api/2.3/sites/{0}/workbooks/3cc6cd06-89ce-4fdc-b935-5294135d6d42'.format(SITE_ID)
+        self.responses[('GET', url, '')] = [(200, 'workbook_get_by_id.xml')]
+        workbook = self.run_async(self.server.workbooks.get_by_id('3cc6cd06-89ce-4fdc-b935-5294135d6d42'))
+        self.assertEqual('SafariSample', workbook.name)
+
+        self.assertRaises(AttributeError, self.run_async, self.server.groups.get_by_id('1'))
+
+    def test_async_pager(self):
+        self.sign_in()
+        url = '/api/2.3/sites/{0}/workbooks'.format(SITE_ID)
+        self.responses[('GET', url, 'pageNumber=1&pageSize=100')] = [(200, GET_XML_PAGE1)]
+        self.responses[('GET', url, 'pageNumber=2&pageSize=1')] = [(200, GET_XML_PAGE2)]
+        self.responses[('GET', url, 'pageNumber=3&pageSize=1')] = [(200, GET_XML_PAGE3)]
+
+        async def collect(pager):
+            return [workbook.name async for workbook in pager]
+
+        workbooks = self.run_async(collect(TSC.AsyncPager(self.server.workbooks)))
+        self.assertEqual(['Page1Workbook', 'Page2Workbook', 'Page3Workbook'], workbooks)
+
+    def test_retries(self):
+        self.sign_in()
+        url = '/api/2.3/sites/{0}/workbooks'.format(SITE_ID)
+        self.responses[('GET', url, '')] = [(503, 'auth_sign_in_error.xml'), (200, GET_XML)]
+        all_workbooks, _ = self.run_async(self.server.workbooks.get())
+
+        self.assertEqual(2, len(all_workbooks))
+        self.assertEqual(1, self.server.retry_policy.retries)
+
+    def test_signs_in_again_when_session_expires(self):
+        self.sign_in()
+        self.server.server._auth_token = 'expired'
+        url = '/api/2.3/sites/{0}/workbooks'.format(SITE_ID)
+        self.responses[('GET', url, '')] = [(401, 'auth_sign_in_error.xml'), (200, GET_XML)]
+        all_workbooks, _ = self.run_async(self.server.workbooks.get())
+
+        self.assertEqual(2, len(all_workbooks))
+        tokens = [request.headers['x-tableau-auth'] for request in self.requests[-3::2]]
+        self.assertEqual(['expired', self.server.auth_token], tokens)
+
+    def test_error_is_raised_on_await(self):
+        self.sign_in()
+        self.responses[('GET', '/api/2.3/sites/{0}/workbooks'.format(SITE_ID), '')] = [(403, 'auth_sign_in_error.xml')]
+        with self.assertRaises(TSC.ServerResponseError):
+            self.run_async(self.server.workbooks.get())
+
+    def test_request_hooks(self):
+        self.sign_in()
+        events = []
+        self.server.server.add_request_hook(after=events.append)
+        self.responses[('GET', '/api/2.3/sites/{0}/workbooks'.format(SITE_ID), '')] = [(200, GET_XML)]
+        self.run_async(self.server.workbooks.get())
+
+        self.assertEqual([('GET', 200)], [(event.method, event.status_code) for event in events])
+        self.assertEqual('/api/{version}/sites/{id}/workbooks', events[0].url_template)
+
+    def test_endpoints_without_async_version(self):
+        with self.assertRaises(AttributeError):
+            self.server.schedules
+
+    def test_requests_share_one_thread(self):
+        # The requests wait on the event loop together, not on one thread each
+        url = '/api/2.3/sites/{0}/workbooks'.format(SITE_ID)
+        route = (200, {'Content-Type': 'application/xml'}, read_xml_asset(GET_XML).encode('utf-8'))
+        with StubServer({url: slow(0.3, route)}) as stub:
+            server = TSC.AsyncServer(stub.address)
+            server.server._site_id = SITE_ID
+            server.server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+            async def get_many():
+                try:
+                    return await asyncio.gather(*[server.workbooks.get() for _ in range(20)])
+                finally:
+                    await server.close()
+
+            started = time.time()
+            results = self.run_async(get_many())
+            elapsed = time.time() - started
+
+        self.assertEqual(20, len(results))
+        # One at a time they would take 6s
+        self.assertLess(elapsed, 3.0)
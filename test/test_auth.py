@@ -91,6 +91,21 @@ class AuthTests(unittest.TestCase):
         self.assertIsNone(self.server._site_id)
         self.assertIsNone(self.server._user_id)
 
+    def test_sign_out_keeps_session(self):
+        with open(SIGN_IN_XML, 'rb') as f:
+            response_xml = f.read().decode('utf-8')
+        session = self.server.session
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/signin', text=response_xml)
+            m.post(self.baseurl + '/signout', text='')
+            tableau_auth = TSC.TableauAuth('testuser', 'password')
+            self.server.auth.sign_in(tableau_auth)
+            session.cookies.set('workgroup_session_id', 'abc123')
+            self.server.auth.sign_out()
+
+        self.assertIs(session, self.server.session)
+        self.assertNotIn('workgroup_session_id', session.cookies)
+
     def test_switch_site(self):
         self.server.version = '2.6'
         baseurl = self.server.auth.baseurl
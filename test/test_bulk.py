@@ -0,0 +1,104 @@
+import threading
+import time
+import unittest
+import requests_mock
+import tableauserverclient as TSC
+
+from ._utils import read_xml_asset
+
+POPULATE_CONNECTIONS_XML = 'workbook_populate_connections.xml'
+POPULATE_VIEWS_XML = 'workbook_populate_views.xml'
+
+
+class BulkTests(unittest.TestCase):
+    def setUp(self):
+        self.server = TSC.Server('http://test')
+
+        # Fake sign in
+        self.server._site_id = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+        self.server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+        self.baseurl = self.server.workbooks.baseurl
+
+    def tearDown(self):
+        self.server.bulk.close()
+
+    def _workbooks(self, count):
+        workbooks = []
+        for i in range(count):
+            workbook = TSC.WorkbookItem('test')
+            workbook._id = 'workbook-{}'.format(i)
+            workbooks.append(workbook)
+        return workbooks
+
+    def test_populate_connections(self):
+        response_xml = read_xml_asset(POPULATE_CONNECTIONS_XML)
+        workbooks = self._workbooks(20)
+        with requests_mock.mock() as m:
+            for workbook in workbooks:
+                m.get('{}/{}/connections'.format(self.baseurl, workbook.id), text=response_xml)
+            results = self.server.bulk.run(self.server.workbooks.populate_connections, workbooks)
+            self.assertEqual(20, m.call_count)
+
+        self.assertEqual(workbooks, [r.item for r in results])
+        self.assertTrue(all(r.ok for r in results))
+        # Content is fetched during the run and kept on the item
+        self.assertEqual('37ca6ced-58d7-4dcf-99dc-f0a85223cbef', results[0].result[0].id)
+        self.assertEqual('37ca6ced-58d7-4dcf-99dc-f0a85223cbef', workbooks[-1].connections[0].id)
+
+    def test_populate_csv_can_be_read_twice(self):
+        self.server.version = '2.7'
+        views = []
+        with requests_mock.mock() as m:
+            for i in range(3):
+                view = TSC.ViewItem()
+                view._id = 'view-{}'.format(i)
+                views.append(view)
+                m.get('{}/views/{}/data'.format(self.server.views.siteurl, view.id), content=b'a,b\n1,2\n')
+            results = self.server.bulk.run(self.server.views.populate_csv, views)
+
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(b'a,b\n1,2\n', b''.join(results[0].result))
+        self.assertEqual(b'a,b\n1,2\n', b''.join(views[0].csv))
+        self.assertEqual(b'a,b\n1,2\n', b''.join(views[0].csv))
+
+    def test_errors_are_collected_per_item(self):
+        response_xml = read_xml_asset(POPULATE_VIEWS_XML)
+        error_xml = read_xml_asset('auth_sign_in_error.xml')
+        workbooks = self._workbooks(3)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl + '/workbook-0/views', text=response_xml)
+            m.get(self.baseurl + '/workbook-1/views', text=error_xml, status_code=401)
+            m.get(self.baseurl + '/workbook-2/views', text=response_xml)
+            results = self.server.bulk.run(self.server.workbooks.populate_views, workbooks)
+
+        self.assertEqual([True, False, True], [r.ok for r in results])
+        self.assertIsInstance(results[1].error, TSC.ServerResponseError)
+        self.assertIsNone(results[1].result)
+        self.assertEqual(3, len(workbooks[2].views))
+
+    def test_forwards_arguments(self):
+        results = self.server.bulk.run(lambda item, step, scale=1: (item + step) * scale, [1, 2, 3], 1, scale=10)
+        self.assertEqual([20, 30, 40], [r.result for r in results])
+
+    def test_concurrency_is_bounded(self):
+        self.server.bulk.max_workers = 3
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def operation(item):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.01)
+            with lock:
+                running[0] -= 1
+
+        self.server.bulk.run(operation, range(20))
+        self.assertGreater(peak[0], 1)
+        self.assertLessEqual(peak[0], 3)
+
+    def test_invalid_max_workers(self):
+        with self.assertRaises(ValueError):
+            self.server.bulk.max_workers = 0
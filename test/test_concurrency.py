@@ -0,0 +1,135 @@
+import threading
+import time
+import unittest
+import requests_mock
+import tableauserverclient as TSC
+
+from tableauserverclient.server.endpoint.exceptions import InternalServerError
+
+from ._utils import read_xml_asset
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+
+class ConcurrencyGovernorTests(unittest.TestCase):
+    def setUp(self):
+        self.now = [100.0]
+        patcher = mock.patch('tableauserverclient.server.concurrency.monotonic', lambda: self.now[0])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def request(self, governor, latency=0.1, overloaded=False):
+        started = governor.acquire()
+        self.now[0] += latency
+        governor.release(started, overloaded)
+
+    def test_additive_increase(self):
+        governor = TSC.ConcurrencyGovernor(initial=4, max_limit=6)
+        # About one more per window of `limit` requests
+        for _ in range(5):
+            self.request(governor)
+        self.assertEqual(5, governor.limit)
+        for _ in range(100):
+            self.request(governor)
+        self.assertEqual(6, governor.limit)
+        self.assertAlmostEqual(0.1, governor.latency())
+
+    def test_backs_off_when_overloaded(self):
+        governor = TSC.ConcurrencyGovernor(initial=16)
+        self.request(governor, overloaded=True)
+        self.assertEqual(8, governor.limit)
+        self.request(governor, overloaded=True)
+        self.assertEqual(4, governor.limit)
+        for _ in range(10):
+            self.request(governor, overloaded=True)
+        self.assertEqual(1, governor.limit)
+
+    def test_backs_off_on_latency_spike(self):
+        governor = TSC.ConcurrencyGovernor(initial=8)
+        self.request(governor, latency=0.1)
+        self.request(governor, latency=1.0)
+        self.assertEqual(4, governor.limit)
+
+    def test_latency_per_endpoint(self):
+        governor = TSC.ConcurrencyGovernor(initial=8)
+        for key, latency in (('/lookup', 0.1), ('/download', 2.0), ('/lookup', 0.1), ('/download', 2.0)):
+            started = governor.acquire()
+            self.now[0] += latency
+            governor.release(started, key=key)
+        # Slow downloads next to quick lookups are not a spike
+        self.assertEqual(8, governor.limit)
+        self.assertAlmostEqual(0.1, governor.latency('/lookup'))
+        self.assertAlmostEqual(2.0, governor.latency('/download'))
+
+    def test_backs_off_once_per_round_trip(self):
+        governor = TSC.ConcurrencyGovernor(initial=8)
+        started = [governor.acquire() for _ in range(8)]
+        self.now[0] += 0.1
+        for start in started:
+            governor.release(start, overloaded=True)
+        self.assertEqual(4, governor.limit)
+        self.assertEqual(0, governor.in_flight)
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, TSC.ConcurrencyGovernor, initial=0)
+        self.assertRaises(ValueError, TSC.ConcurrencyGovernor, initial=64, max_limit=32)
+        self.assertRaises(ValueError, TSC.ConcurrencyGovernor, backoff=1)
+
+
+class ConcurrencyGovernorThreadTests(unittest.TestCase):
+    def test_limits_in_flight(self):
+        governor = TSC.ConcurrencyGovernor(initial=3, max_limit=3)
+        lock = threading.Lock()
+        peak = [0]
+
+        def request():
+            started = governor.acquire()
+            with lock:
+                peak[0] = max(peak[0], governor.in_flight)
+            time.sleep(0.01)
+            governor.release(started)
+
+        threads = [threading.Thread(target=request) for _ in range(12)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(3, peak[0])
+        self.assertEqual(0, governor.in_flight)
+
+
+class ServerConcurrencyTests(unittest.TestCase):
+    def setUp(self):
+        self.governor = TSC.ConcurrencyGovernor(initial=8)
+        self.server = TSC.Server('http://test', retry_policy=TSC.RetryPolicy(total=0),
+                                 concurrency_governor=self.governor)
+
+        # Fake sign in
+        self.server._site_id = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+        self.server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+        self.baseurl = self.server.workbooks.baseurl
+
+    def tearDown(self):
+        self.server.bulk.close()
+
+    def test_requests_go_through_governor(self):
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=read_xml_asset('workbook_get.xml'))
+            self.server.workbooks.get()
+        self.assertEqual(0, self.governor.in_flight)
+        self.assertIsNotNone(self.governor.latency('/api/{version}/sites/{id}/workbooks'))
+
+    def test_server_errors_back_off(self):
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, status_code=503, text='')
+            self.assertRaises(InternalServerError, self.server.workbooks.get)
+        self.assertEqual(4, self.governor.limit)
+        self.assertEqual(0, self.governor.in_flight)
+
+    def test_bulk_uses_governor_headroom(self):
+        self.server.bulk.run(lambda item: item, [1])
+        self.assertEqual(self.governor.max_limit, self.server.bulk._executor_workers)
@@ -0,0 +1,140 @@
+import json
+import os
+import pickle
+import signal
+import threading
+import time
+import unittest
+import tableauserverclient as TSC
+
+from tableauserverclient.namespace import OLD_NAMESPACE
+
+from ._stub_server import StubServer, slow
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+SITE_ID = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+TOKEN = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+
+class ServerHandleTests(unittest.TestCase):
+    def setUp(self):
+        self.server = TSC.Server('http://test')
+        self.server.version = '3.4'
+        self.server.add_http_options({'verify': False})
+        self.server._set_auth(SITE_ID, 'user-id', TOKEN)
+
+    def test_pickle_round_trip(self):
+        handle = pickle.loads(pickle.dumps(self.server.handle()))
+        self.assertEqual(self.server.handle(), handle)
+
+        server = handle.server()
+        self.assertEqual('3.4', server.version)
+        self.assertEqual(TOKEN, server.auth_token)
+        self.assertEqual(SITE_ID, server.site_id)
+        self.assertEqual('user-id', server.user_id)
+        self.assertEqual({'verify': False}, server.http_options)
+
+    def test_namespace(self):
+        self.server._namespace.seed(OLD_NAMESPACE)
+        self.assertEqual(OLD_NAMESPACE, self.server.handle().server().namespace['t'])
+
+    def test_server_arguments(self):
+        transport = TSC.Urllib3Transport()
+        server = self.server.handle().server(transport=transport)
+        self.assertIs(transport, server.transport)
+
+
+class ForkTests(unittest.TestCase):
+    def setUp(self):
+        self.stub = StubServer({'/slow': slow(1, (200, {}, b''))}).__enter__()
+
+    def tearDown(self):
+        self.stub.__exit__(None, None, None)
+
+    def signed_in_server(self, **kwargs):
+        server = TSC.Server(self.stub.address, **kwargs)
+        server._set_auth(SITE_ID, 'user-id', TOKEN)
+        return server
+
+    def test_after_fork_resets_shared_state_once(self):
+        server = self.signed_in_server()
+        clone = server.clone()
+        server.bulk._get_executor()
+        with mock.patch.object(server.transport, 'after_fork') as after_fork, \
+                mock.patch('tableauserverclient.server.server._forks', [100]):
+            server.transport
+            clone.transport
+            server.transport
+        self.assertEqual(1, after_fork.call_count)
+        self.assertIsNone(server.bulk._executor)
+        self.assertEqual(TOKEN, clone.auth_token)
+
+    def test_after_fork_drops_connections(self):
+        server = self.signed_in_server()
+        server.transport.get(self.stub.url('/echo'))
+        self.assertEqual(1, self.stub.connections)
+        server.transport.after_fork()
+        server.transport.get(self.stub.url('/echo'))
+        self.assertEqual(2, self.stub.connections)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'needs os.fork')
+    def test_child_opens_its_own_connections(self):
+        for transport in (None, TSC.Urllib3Transport()):
+            server = self.signed_in_server(transport=transport)
+            server.transport.get(self.stub.url('/parent'))
+            connections = self.stub.connections
+
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                status = 1
+                try:
+                    response = server.transport.get(self.stub.url('/child'), headers={'x-tableau-auth': TOKEN})
+                    os.write(write_fd, response.content)
+                    status = 0
+                finally:
+                    os._exit(status)
+
+            os.close(write_fd)
+            with os.fdopen(read_fd) as f:
+                child_headers = json.loads(f.read())['headers']
+            _, status = os.waitpid(pid, 0)
+            self.assertEqual(0, status)
+            self.assertEqual(TOKEN, child_headers['x-tableau-auth'])
+            self.assertEqual(connections + 1, self.stub.connections)
+
+            # The parent's connection is still usable
+            self.assertEqual(200, server.transport.get(self.stub.url('/parent')).status_code)
+            self.assertEqual(connections + 1, self.stub.connections)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'needs os.fork')
+    def test_child_does_not_wait_for_parent_requests(self):
+        server = self.signed_in_server(concurrency_governor=TSC.ConcurrencyGovernor(1, 1, 1),
+                                       rate_limiter=TSC.RateLimiter(1000))
+        server.views.render_rate_limiter = TSC.RateLimiter(1000)
+        in_flight = threading.Thread(target=server.views.get_request, args=(self.stub.url('/slow'),))
+        in_flight.start()
+        while not self.stub.requests:
+            time.sleep(0.01)
+        self.assertEqual(1, server.concurrency_governor.in_flight)
+
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                # Without resetting the governor the child waits for a slot that is never freed
+                signal.alarm(5)
+                server.views.get_request(self.stub.url('/child'))
+                status = 0 if server.concurrency_governor.in_flight == 0 else 3
+            finally:
+                os._exit(status)
+
+        _, status = os.waitpid(pid, 0)
+        in_flight.join()
+        self.assertEqual(0, status)
+        self.assertEqual(0, server.concurrency_governor.in_flight)
+        self.assertEqual(['/slow', '/child'], [path for _, path, _, _ in self.stub.requests])
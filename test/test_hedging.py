@@ -0,0 +1,214 @@
+import threading
+import time
+import unittest
+import tableauserverclient as TSC
+
+from ._stub_server import StubServer
+from ._utils import read_xml_asset
+
+GET_XML = 'workbook_get.xml'
+SITE_ID = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+
+
+class FakeResponse(object):
+    def __init__(self, name):
+        self.name = name
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class CountingRateLimiter(TSC.RateLimiter):
+    acquired = 0
+
+    def acquire(self, tokens=1):
+        self.acquired += tokens
+        return super(CountingRateLimiter, self).acquire(tokens)
+
+
+def respond(name, delay=0, error=None):
+    response = FakeResponse(name)
+
+    def request():
+        time.sleep(delay)
+        if error is not None:
+            raise error
+        return response
+    request.response = response
+    return request
+
+
+class HedgePolicyTests(unittest.TestCase):
+    def setUp(self):
+        self.policy = TSC.HedgePolicy(percentile=50, min_samples=4, min_delay=0.01, budget=0.5)
+
+    def warm_up(self, latency=0.01, count=4):
+        for _ in range(count):
+            self.policy.observe(latency)
+            self.policy.requests += 1
+
+    def test_delay_from_percentile(self):
+        self.assertIsNone(self.policy.get_delay())
+        for latency in (0.1, 0.2, 0.3, 0.4):
+            self.policy.observe(latency)
+        self.assertEqual(0.2, self.policy.get_delay())
+        self.policy.percentile = 99
+        self.assertEqual(0.4, self.policy.get_delay())
+
+    def test_delay_per_endpoint(self):
+        for latency in (0.1, 0.2, 0.3, 0.4):
+            self.policy.observe(latency, '/api/{version}/sites/{id}/workbooks')
+            self.policy.observe(latency * 10, '/api/{version}/sites/{id}/workbooks/{id}/content')
+        self.assertEqual(0.2, self.policy.get_delay('/api/{version}/sites/{id}/workbooks'))
+        self.assertEqual(2.0, self.policy.get_delay('/api/{version}/sites/{id}/workbooks/{id}/content'))
+        self.assertIsNone(self.policy.get_delay('/api/{version}/sites/{id}/views'))
+
+    def test_min_delay(self):
+        self.warm_up(latency=0.001)
+        self.assertEqual(0.01, self.policy.get_delay())
+
+    def test_no_duplicate_until_warmed_up(self):
+        duplicate = respond('duplicate')
+        self.assertEqual('request', self.policy.send(respond('request', delay=0.05), duplicate).name)
+        self.assertEqual(0, self.policy.hedges)
+
+    def test_fast_response_is_not_duplicated(self):
+        self.warm_up(latency=0.2)
+        self.assertEqual('request', self.policy.send(respond('request'), respond('duplicate')).name)
+        self.assertEqual(0, self.policy.hedges)
+
+    def test_slow_response_is_duplicated(self):
+        self.warm_up()
+        request = respond('request', delay=0.2)
+        self.assertEqual('duplicate', self.policy.send(request, respond('duplicate')).name)
+        self.assertEqual((5, 1, 1), (self.policy.requests, self.policy.hedges, self.policy.wins))
+        self.assertEqual(0.2, self.policy.hedge_rate)
+
+        # The slower response is closed once it arrives
+        self.policy.close()
+        self.assertTrue(request.response.closed)
+
+    def test_budget(self):
+        self.policy.budget = 0.1
+        self.warm_up()
+        self.assertEqual('request', self.policy.send(respond('request', delay=0.05), respond('duplicate')).name)
+        self.assertEqual(0, self.policy.hedges)
+
+    def test_duplicate_used_when_request_fails(self):
+        self.warm_up()
+        request = respond('request', delay=0.05, error=ValueError('request'))
+        self.assertEqual('duplicate', self.policy.send(request, respond('duplicate', delay=0.1)).name)
+
+    def test_error_of_request_when_both_fail(self):
+        self.warm_up()
+        request = respond('request', delay=0.05, error=ValueError('request'))
+        duplicate = respond('duplicate', error=KeyError('duplicate'))
+        self.assertRaises(ValueError, self.policy.send, request, duplicate)
+
+    def test_more_callers_than_workers(self):
+        # Requests beyond the pool's threads neither queue for one nor get duplicated for having queued
+        policy = TSC.HedgePolicy(initial_delay=0.15, budget=1, max_workers=4)
+        running = []
+        peak = []
+        lock = threading.Lock()
+
+        def request():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.1)
+            with lock:
+                running.pop()
+            return FakeResponse('request')
+
+        def call():
+            policy.send(request, respond('duplicate'))
+
+        started = time.time()
+        threads = [threading.Thread(target=call) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.time() - started
+        policy.close()
+
+        self.assertEqual(0, policy.hedges)
+        self.assertGreater(max(peak), 4)
+        self.assertLess(elapsed, 0.3)
+
+    def test_arguments(self):
+        self.assertRaises(ValueError, TSC.HedgePolicy, percentile=100)
+        self.assertRaises(ValueError, TSC.HedgePolicy, budget=2)
+        self.assertTrue(TSC.HedgePolicy().applies('GET'))
+        self.assertFalse(TSC.HedgePolicy().applies('POST'))
+
+
+class ServerHedgingTests(unittest.TestCase):
+    def setUp(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+        body = read_xml_asset(GET_XML).encode('utf-8')
+
+        def workbooks(handler):
+            with self.lock:
+                self.calls += 1
+                calls = self.calls
+            # Every fifth request is slow
+            if calls % 5 == 0:
+                time.sleep(0.5)
+            return 200, {'Content-Type': 'application/xml'}, body
+
+        self.stub = StubServer({'/api/2.3/sites/{0}/workbooks'.format(SITE_ID): workbooks}).__enter__()
+        self.policy = TSC.HedgePolicy(percentile=90, min_samples=4, budget=0.5)
+        self.server = TSC.Server(self.stub.address, hedge_policy=self.policy)
+        self.server._site_id = SITE_ID
+        self.server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+        self.events = []
+        self.collector = TSC.MetricsCollector()
+        self.server.add_request_hook(before=self.events.append, after=self.collector)
+
+    def tearDown(self):
+        self.policy.close()
+        self.stub.__exit__(None, None, None)
+
+    def test_slow_get_is_hedged(self):
+        for _ in range(4):
+            self.server.workbooks.get()
+        started = time.time()
+        all_workbooks, _ = self.server.workbooks.get()
+        self.assertLess(time.time() - started, 0.4)
+        self.assertEqual(2, len(all_workbooks))
+
+        self.assertEqual((5, 1, 1), (self.policy.requests, self.policy.hedges, self.policy.wins))
+        self.assertEqual([False] * 5 + [True], [event.hedge for event in self.events])
+        self.policy.close()
+        self.assertEqual(1, self.collector.snapshot()[0]['hedged_requests'])
+        self.assertIn('tableau_hedged_requests_total{method="GET",endpoint="/api/{version}/sites/{id}/workbooks"} 1',
+                      self.collector.to_prometheus())
+
+    def test_duplicate_counts_against_rate_limits(self):
+        self.server.rate_limiter = CountingRateLimiter(1000)
+        self.server.workbooks.rate_limiter = CountingRateLimiter(1000)
+        for _ in range(5):
+            self.server.workbooks.get()
+        self.assertEqual(1, self.policy.hedges)
+        self.assertEqual(6, self.server.rate_limiter.acquired)
+        self.assertEqual(6, self.server.workbooks.rate_limiter.acquired)
+
+    def test_close_stops_threads(self):
+        for _ in range(5):
+            self.server.workbooks.get()
+        self.server.bulk._get_executor()
+        self.server.close()
+        self.assertIsNone(self.policy._executor)
+        self.assertIsNone(self.server.bulk._executor)
+
+    def test_streamed_get_is_not_hedged(self):
+        for _ in range(4):
+            self.server.workbooks.get()
+        items, _ = self.server.workbooks.get(stream=True)
+        self.assertEqual(2, len(list(items)))
+        self.assertEqual(4, self.policy.requests)
+        self.assertEqual(0, self.policy.hedges)
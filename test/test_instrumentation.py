@@ -0,0 +1,122 @@
+import json
+import unittest
+import requests
+import requests_mock
+import tableauserverclient as TSC
+
+from tableauserverclient.server.instrumentation import url_template, ResponseEvent
+
+from ._utils import read_xml_asset
+
+GET_XML = 'workbook_get.xml'
+SIGN_IN_XML = 'auth_sign_in.xml'
+
+
+class UrlTemplateTests(unittest.TestCase):
+    def test_strips_ids(self):
+        self.assertEqual('/api/{version}/sites/{id}/workbooks/{id}/connections',
+                         url_template('http://test/api/3.4/sites/dad65087-b08b-4603-af4e-2887b8aafc67/workbooks/'
+                                      '1F951DAF-4061-451a-9df1-69a8062664f2/connections?pageSize=100'))
+        self.assertEqual('/api/{version}/sites/{id}/schedules/{id}',
+                         url_template('https://test:8443/api/2.3/sites/abc12345-0000-0000-0000-000000000000/'
+                                      'schedules/42'))
+
+    def test_strips_site_names(self):
+        self.assertEqual('/api/{version}/sites/{name}', url_template('http://test/api/3.4/sites/Sales%20EMEA?key=name'))
+        self.assertEqual('/api/{version}/sites/{contentUrl}',
+                         url_template('http://test/api/3.4/sites/finance?key=contentUrl'))
+        self.assertEqual('/api/{version}/sites/{id}/users',
+                         url_template('http://test/api/3.4/sites/finance/users?pageSize=100'))
+
+    def test_keeps_names(self):
+        self.assertEqual('/api/{version}/auth/signin', url_template('http://test/api/2.3/auth/signin'))
+        self.assertEqual('/auth', url_template('http://test/auth?format=xml'))
+
+
+class RequestHookTests(unittest.TestCase):
+    def setUp(self):
+        self.server = TSC.Server('http://test', retry_policy=TSC.RetryPolicy(total=0))
+
+        # Fake sign in
+        self.server._site_id = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+        self.server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+        self.baseurl = self.server.workbooks.baseurl
+        self.before, self.after = [], []
+        self.server.add_request_hook(before=self.before.append, after=self.after.append)
+
+    def test_hooks(self):
+        response_xml = read_xml_asset(GET_XML)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=response_xml)
+            self.server.workbooks.get()
+
+        self.assertEqual(1, len(self.before))
+        self.assertEqual('GET', self.before[0].method)
+        self.assertEqual('/api/{version}/sites/{id}/workbooks', self.before[0].url_template)
+        event = self.after[0]
+        self.assertEqual(200, event.status_code)
+        self.assertEqual(0, event.bytes_sent)
+        self.assertEqual(len(response_xml.encode('utf-8')), event.bytes_received)
+        self.assertGreaterEqual(event.elapsed, 0)
+        self.assertIsNone(event.error)
+
+    def test_bytes_sent(self):
+        with requests_mock.mock() as m:
+            m.post(self.server.auth.baseurl + '/signin', text=read_xml_asset(SIGN_IN_XML))
+            self.server.auth.sign_in(TSC.TableauAuth('testuser', 'password'))
+
+        self.assertEqual('/api/{version}/auth/signin', self.after[0].url_template)
+        self.assertGreater(self.after[0].bytes_sent, 0)
+
+    def test_connection_error(self):
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, exc=requests.exceptions.ConnectionError)
+            self.assertRaises(requests.exceptions.ConnectionError, self.server.workbooks.get)
+
+        self.assertIsNone(self.after[0].status_code)
+        self.assertIsInstance(self.after[0].error, requests.exceptions.ConnectionError)
+
+    def test_clear_request_hooks(self):
+        self.server.clear_request_hooks()
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=read_xml_asset(GET_XML))
+            self.server.workbooks.get()
+        self.assertEqual([], self.after)
+
+
+class MetricsCollectorTests(unittest.TestCase):
+    def setUp(self):
+        self.collector = TSC.MetricsCollector(buckets=(0.1, 1.0))
+        self.collector(ResponseEvent('GET', '/api/{version}/sites/{id}/workbooks', 'url', 200, 0, 100, 40, 0.05, None))
+        self.collector(ResponseEvent('GET', '/api/{version}/sites/{id}/workbooks', 'url', 200, 0, 300, 80, 0.5, None))
+        self.collector(ResponseEvent('GET', '/api/{version}/sites/{id}/workbooks', 'url', 503, 0, 0, 0, 2.0, None))
+        self.collector(ResponseEvent('DELETE', '/api/{version}/sites/{id}/users/{id}', 'url', None, 0, None, None,
+                                     0.01, Exception()))
+
+    def test_json(self):
+        stats = json.loads(self.collector.to_json())
+        self.assertEqual(['DELETE', 'GET'], [s['method'] for s in stats])
+        workbooks = stats[1]
+        self.assertEqual({'200': 2, '503': 1}, workbooks['requests'])
+        self.assertEqual({'0.1': 1, '1.0': 2}, workbooks['duration_seconds']['buckets'])
+        self.assertEqual(3, workbooks['duration_seconds']['count'])
+        self.assertAlmostEqual(2.55, workbooks['duration_seconds']['sum'])
+        self.assertEqual(400, workbooks['bytes_received'])
+        self.assertEqual(120, workbooks['wire_bytes_received'])
+        self.assertEqual({'error': 1}, stats[0]['requests'])
+
+    def test_prometheus(self):
+        text = self.collector.to_prometheus()
+        labels = 'method="GET",endpoint="/api/{version}/sites/{id}/workbooks"'
+        self.assertIn('# TYPE tableau_request_duration_seconds histogram', text)
+        self.assertIn('tableau_requests_total{%s,status="200"} 2' % labels, text)
+        self.assertIn('tableau_request_duration_seconds_bucket{%s,le="1.0"} 2' % labels, text)
+        self.assertIn('tableau_request_duration_seconds_bucket{%s,le="+Inf"} 3' % labels, text)
+        self.assertIn('tableau_request_duration_seconds_count{%s} 3' % labels, text)
+        self.assertIn('tableau_response_bytes_total{%s} 400' % labels, text)
+        self.assertIn('tableau_response_wire_bytes_total{%s} 120' % labels, text)
+
+    def test_reset(self):
+        self.collector.reset()
+        self.assertEqual([], self.collector.snapshot())
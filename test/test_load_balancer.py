@@ -0,0 +1,139 @@
+import unittest
+import requests
+import requests_mock
+import tableauserverclient as TSC
+
+from ._utils import read_xml_asset
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+GET_XML = 'workbook_get.xml'
+SIGN_IN_XML = 'auth_sign_in.xml'
+SITE_ID = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+WORKBOOKS_PATH = '/api/2.3/sites/{0}/workbooks'.format(SITE_ID)
+NODES = ['http://node1', 'http://node2', 'http://node3']
+
+
+class LoadBalancerTests(unittest.TestCase):
+    def test_round_robin(self):
+        balancer = TSC.LoadBalancer(NODES)
+        nodes = []
+        for _ in range(6):
+            node = balancer.acquire()
+            balancer.release(node, failed=False)
+            nodes.append(node.address)
+        self.assertEqual(NODES * 2, nodes)
+
+    def test_least_in_flight(self):
+        balancer = TSC.LoadBalancer(NODES[:2], routing='least_in_flight')
+        first = balancer.acquire()
+        second = balancer.acquire()
+        self.assertNotEqual(first, second)
+        balancer.release(first, failed=False)
+        self.assertIs(first, balancer.acquire())
+        balancer.acquire()
+        balancer.acquire()
+        self.assertEqual([2, 2], [node.in_flight for node in balancer.nodes])
+
+    def test_failing_node_is_left_out(self):
+        balancer = TSC.LoadBalancer(NODES[:2], max_failures=2, cooldown=30)
+        node1, node2 = balancer.nodes
+        for _ in range(2):
+            node1.in_flight += 1
+            balancer.release(node1, failed=True)
+        self.assertEqual([node2] * 3, [balancer.acquire() for _ in range(3)])
+
+        with mock.patch('tableauserverclient.server.load_balancer.time.time', return_value=node1.ejected_until):
+            self.assertIn(node1, [balancer.acquire() for _ in range(2)])
+
+    def test_every_node_left_out(self):
+        balancer = TSC.LoadBalancer(NODES[:2], max_failures=1)
+        node1, node2 = balancer.nodes
+        node1.ejected_until = 200
+        node2.ejected_until = 100
+        with mock.patch('tableauserverclient.server.load_balancer.time.time', return_value=50):
+            self.assertIs(node2, balancer.acquire())
+
+    def test_success_resets_failures(self):
+        balancer = TSC.LoadBalancer(NODES[:1], max_failures=2)
+        node = balancer.acquire()
+        balancer.release(node, failed=True)
+        balancer.acquire()
+        balancer.release(node, failed=False)
+        self.assertEqual(0, node.failures)
+        self.assertTrue(node.is_healthy(node.ejected_until))
+
+    def test_url_for(self):
+        balancer = TSC.LoadBalancer(NODES)
+        node = balancer.nodes[1]
+        self.assertEqual('http://node2/api/2.3/sites',
+                         balancer.url_for(node, 'http://node1/api/2.3/sites', 'http://node1/'))
+        self.assertEqual('http://other/x', balancer.url_for(node, 'http://other/x', 'http://node1'))
+
+    def test_arguments(self):
+        self.assertRaises(ValueError, TSC.LoadBalancer, [])
+        self.assertRaises(ValueError, TSC.LoadBalancer, NODES, routing='random')
+        self.assertRaises(ValueError, TSC.LoadBalancer, NODES, max_failures=0)
+
+
+@mock.patch('tableauserverclient.server.retry.time.sleep')
+class ServerLoadBalancingTests(unittest.TestCase):
+    def setUp(self):
+        self.server = TSC.Server(server_addresses=NODES)
+        self.server._site_id = SITE_ID
+        self.server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+    def test_requests_spread_over_nodes(self, sleep):
+        self.assertEqual('http://node1/api/2.3', self.server.baseurl)
+        with requests_mock.mock() as m:
+            for node in NODES:
+                m.get(node + WORKBOOKS_PATH, text=read_xml_asset(GET_XML))
+            for _ in range(6):
+                self.server.workbooks.get()
+        hosts = [r.netloc for r in m.request_history]
+        self.assertEqual(['node1', 'node2', 'node3'] * 2, hosts)
+
+    def test_retry_goes_to_another_node(self, sleep):
+        with requests_mock.mock() as m:
+            m.get(NODES[0] + WORKBOOKS_PATH, status_code=503, text='')
+            m.get(NODES[1] + WORKBOOKS_PATH, text=read_xml_asset(GET_XML))
+            all_workbooks, _ = self.server.workbooks.get()
+        self.assertEqual(2, len(all_workbooks))
+        self.assertEqual(['node1', 'node2'], [r.netloc for r in m.request_history])
+        self.assertEqual(1, self.server.load_balancer.nodes[0].failures)
+
+    def test_unreachable_node_is_left_out(self, sleep):
+        self.server.load_balancer.max_failures = 1
+        with requests_mock.mock() as m:
+            m.get(NODES[0] + WORKBOOKS_PATH, exc=requests.exceptions.ConnectionError)
+            for node in NODES[1:]:
+                m.get(node + WORKBOOKS_PATH, text=read_xml_asset(GET_XML))
+            for _ in range(4):
+                self.server.workbooks.get()
+        hosts = [r.netloc for r in m.request_history]
+        self.assertEqual(5, len(hosts))
+        self.assertEqual([1, 2, 2], [hosts.count(host) for host in ('node1', 'node2', 'node3')])
+        self.assertFalse(self.server.load_balancer.nodes[0].is_healthy(0))
+
+    def test_streamed_response_in_flight_until_closed(self, sleep):
+        with requests_mock.mock() as m:
+            m.get(NODES[0] + WORKBOOKS_PATH, text=read_xml_asset(GET_XML))
+            items, _ = self.server.workbooks.get(stream=True)
+            self.assertEqual(1, self.server.load_balancer.nodes[0].in_flight)
+            self.assertEqual(2, len(list(items)))
+        self.assertEqual([0, 0, 0], [node.in_flight for node in self.server.load_balancer.nodes])
+
+    def test_sign_in_shared_across_nodes(self, sleep):
+        server = TSC.Server(server_addresses=NODES[:2])
+        with requests_mock.mock() as m:
+            m.post(NODES[0] + '/api/2.3/auth/signin', text=read_xml_asset(SIGN_IN_XML))
+            m.get(NODES[1] + '/api/2.3/sites/6b7179ba-b82b-4f0f-91ed-812074ac5da6/workbooks',
+                  text=read_xml_asset(GET_XML), request_headers={'x-tableau-auth': 'eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l'})
+            server.auth.sign_in(TSC.TableauAuth('testuser', 'password'))
+            server.workbooks.get()
+
+    def test_needs_an_address(self, sleep):
+        self.assertRaises(ValueError, TSC.Server)
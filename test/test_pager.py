@@ -8,6 +8,7 @@ TEST_ASSET_DIR = os.path.join(os.path.dirname(__file__), 'assets')
 GET_XML_PAGE1 = os.path.join(TEST_ASSET_DIR, 'workbook_get_page_1.xml')
 GET_XML_PAGE2 = os.path.join(TEST_ASSET_DIR, 'workbook_get_page_2.xml')
 GET_XML_PAGE3 = os.path.join(TEST_ASSET_DIR, 'workbook_get_page_3.xml')
+GET_XML_EMPTY = os.path.join(TEST_ASSET_DIR, 'workbook_get_empty.xml')
 
 
 class PagerTests(unittest.TestCase):
@@ -86,3 +87,85 @@ class PagerTests(unittest.TestCase):
             # Should have the last workbook
             wb3 = workbooks.pop()
             self.assertEqual(wb3.name, 'Page3Workbook')
+
+    def test_pager_with_prefetch(self):
+        with open(GET_XML_PAGE1, 'rb') as f:
+            page_1 = f.read().decode('utf-8')
+        with open(GET_XML_PAGE2, 'rb') as f:
+            page_2 = f.read().decode('utf-8')
+        with open(GET_XML_PAGE3, 'rb') as f:
+            page_3 = f.read().decode('utf-8')
+        with requests_mock.mock() as m:
+            m.get(self.baseurl + "?pageNumber=1&pageSize=1", complete_qs=True, text=page_1)
+            m.get(self.baseurl + "?pageNumber=2&pageSize=1", complete_qs=True, text=page_2)
+            m.get(self.baseurl + "?pageNumber=3&pageSize=1", complete_qs=True, text=page_3)
+
+            opts = TSC.RequestOptions(1, 1)
+            workbooks = list(TSC.Pager(self.server.workbooks, opts, prefetch=2, workers=2))
+            self.assertEqual(3, len(workbooks))
+
+            # Pages are fetched concurrently but items still come back in order
+            wb1, wb2, wb3 = workbooks
+            self.assertEqual(wb1.name, 'Page1Workbook')
+            self.assertEqual(wb2.name, 'Page2Workbook')
+            self.assertEqual(wb3.name, 'Page3Workbook')
+
+            # Starting on page 2 should get 2 out of 3
+            opts = TSC.RequestOptions(2, 1)
+            workbooks = list(TSC.Pager(self.server.workbooks, opts, prefetch=4))
+            self.assertEqual(['Page2Workbook', 'Page3Workbook'], [wb.name for wb in workbooks])
+
+    def test_pager_with_prefetch_total_shrinks(self):
+        with open(GET_XML_PAGE1, 'rb') as f:
+            page_1 = f.read().decode('utf-8')
+        with open(GET_XML_PAGE2, 'rb') as f:
+            page_2 = f.read().decode('utf-8').replace('totalAvailable="3"', 'totalAvailable="2"')
+        with open(GET_XML_EMPTY, 'rb') as f:
+            page_3 = f.read().decode('utf-8')
+        with requests_mock.mock() as m:
+            m.get(self.baseurl + "?pageNumber=1&pageSize=1", complete_qs=True, text=page_1)
+            m.get(self.baseurl + "?pageNumber=2&pageSize=1", complete_qs=True, text=page_2)
+            m.get(self.baseurl + "?pageNumber=3&pageSize=1", complete_qs=True, text=page_3)
+
+            opts = TSC.RequestOptions(1, 1)
+            workbooks = list(TSC.Pager(self.server.workbooks, opts, prefetch=2))
+            self.assertEqual(['Page1Workbook', 'Page2Workbook'], [wb.name for wb in workbooks])
+
+    def test_pager_with_prefetch_total_grows(self):
+        with open(GET_XML_PAGE1, 'rb') as f:
+            page_1 = f.read().decode('utf-8').replace('totalAvailable="3"', 'totalAvailable="2"')
+        with open(GET_XML_PAGE2, 'rb') as f:
+            page_2 = f.read().decode('utf-8')
+        with open(GET_XML_PAGE3, 'rb') as f:
+            page_3 = f.read().decode('utf-8')
+        with requests_mock.mock() as m:
+            m.get(self.baseurl + "?pageNumber=1&pageSize=1", complete_qs=True, text=page_1)
+            m.get(self.baseurl + "?pageNumber=2&pageSize=1", complete_qs=True, text=page_2)
+            m.get(self.baseurl + "?pageNumber=3&pageSize=1", complete_qs=True, text=page_3)
+
+            opts = TSC.RequestOptions(1, 1)
+            workbooks = list(TSC.Pager(self.server.workbooks, opts, prefetch=1))
+            self.assertEqual(3, len(workbooks))
+
+    def test_pager_invalid_prefetch(self):
+        with self.assertRaises(ValueError):
+            TSC.Pager(self.server.workbooks, prefetch=-1)
+
+    def test_pager_with_stream(self):
+        with open(GET_XML_PAGE1, 'rb') as f:
+            page_1 = f.read().decode('utf-8')
+        with open(GET_XML_PAGE2, 'rb') as f:
+            page_2 = f.read().decode('utf-8')
+        with open(GET_XML_PAGE3, 'rb') as f:
+            page_3 = f.read().decode('utf-8')
+        with requests_mock.mock() as m:
+            m.get(self.baseurl + "?pageNumber=1&pageSize=1", complete_qs=True, text=page_1)
+            m.get(self.baseurl + "?pageNumber=2&pageSize=1", complete_qs=True, text=page_2)
+            m.get(self.baseurl + "?pageNumber=3&pageSize=1", complete_qs=True, text=page_3)
+
+            opts = TSC.RequestOptions(1, 1)
+            workbooks = list(TSC.Pager(self.server.workbooks, opts, stream=True))
+            self.assertEqual(['Page1Workbook', 'Page2Workbook', 'Page3Workbook'], [wb.name for wb in workbooks])
+
+            workbooks = list(TSC.Pager(self.server.workbooks, opts, prefetch=2, stream=True))
+            self.assertEqual(['Page1Workbook', 'Page2Workbook', 'Page3Workbook'], [wb.name for wb in workbooks])
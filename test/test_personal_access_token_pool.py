@@ -0,0 +1,131 @@
+import re
+import threading
+import time
+import unittest
+import requests_mock
+import tableauserverclient as TSC
+
+from ._utils import read_xml_asset
+
+SIGN_IN_XML = 'auth_sign_in.xml'
+SIGN_IN_ERROR_XML = 'auth_sign_in_error.xml'
+WORKBOOK_GET_XML = 'workbook_get.xml'
+
+SITE_ID = '6b7179ba-b82b-4f0f-91ed-812074ac5da6'
+
+
+def sign_in(request, context):
+    token_name = re.search(r'personalAccessTokenName="([^"]*)"', request.text).group(1)
+    sign_in.count[token_name] = sign_in.count.get(token_name, 0) + 1
+    token = '{0}-{1}'.format(token_name, sign_in.count[token_name])
+    return read_xml_asset(SIGN_IN_XML).replace('eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l', token)
+
+
+class PersonalAccessTokenPoolTests(unittest.TestCase):
+    def setUp(self):
+        sign_in.count = dict()
+        self.tokens = [TSC.PersonalAccessTokenAuth('token-{0}'.format(i), 'secret', site_id='Samples')
+                       for i in range(3)]
+        self.pool = TSC.PersonalAccessTokenPool('http://test', self.tokens)
+        self.baseurl = 'http://test/api/2.3'
+
+    def test_each_worker_gets_its_own_token(self):
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/auth/signin', text=sign_in)
+            servers = [self.pool.acquire() for _ in range(3)]
+            self.assertEqual(['token-0-1', 'token-1-1', 'token-2-1'], [s.auth_token for s in servers])
+            self.assertRaises(TimeoutError, self.pool.acquire, timeout=0.01)
+
+            self.pool.release(servers[1])
+            self.assertIs(servers[1], self.pool.acquire())
+        self.assertEqual(3, m.call_count)
+
+    def test_release_unknown_server(self):
+        self.assertRaises(ValueError, self.pool.release, TSC.Server('http://test'))
+
+    def test_failed_sign_in_returns_token(self):
+        pool = TSC.PersonalAccessTokenPool('http://test', self.tokens[:1])
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/auth/signin', status_code=401, text=read_xml_asset(SIGN_IN_ERROR_XML))
+            self.assertRaises(TSC.ServerResponseError, pool.acquire)
+            m.post(self.baseurl + '/auth/signin', text=sign_in)
+            with pool.checkout(timeout=0.01) as server:
+                self.assertEqual('token-0-1', server.auth_token)
+
+    def test_map_uses_every_token(self):
+        in_use = set()
+        lock = threading.Lock()
+        overlaps = []
+
+        def work(server, item):
+            with lock:
+                overlaps.append(server.auth_token in in_use)
+                in_use.add(server.auth_token)
+            time.sleep(0.01)
+            with lock:
+                in_use.discard(server.auth_token)
+            return item * 2
+
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/auth/signin', text=sign_in)
+            results = self.pool.map(work, range(12))
+
+        self.assertEqual([i * 2 for i in range(12)], [r.result for r in results])
+        self.assertFalse(any(overlaps))
+        self.assertEqual(3, m.call_count)
+
+    def test_session_ended_elsewhere_signs_in_again(self):
+        workbooks_url = '{0}/sites/{1}/workbooks'.format(self.baseurl, SITE_ID)
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/auth/signin', text=sign_in)
+            m.get(workbooks_url, request_headers={'x-tableau-auth': 'token-0-1'}, status_code=401,
+                  text=read_xml_asset(SIGN_IN_ERROR_XML))
+            m.get(workbooks_url, request_headers={'x-tableau-auth': 'token-0-2'}, text=read_xml_asset(WORKBOOK_GET_XML))
+            with self.pool.checkout() as server:
+                all_workbooks, _ = server.workbooks.get()
+
+        self.assertEqual(2, len(all_workbooks))
+        self.assertEqual({'token-0': 2}, sign_in.count)
+
+    def test_close_signs_out(self):
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/auth/signin', text=sign_in)
+            m.post(self.baseurl + '/auth/signout', text='')
+            with self.pool.checkout():
+                pass
+            self.pool.close()
+        self.assertEqual(['/api/2.3/auth/signin', '/api/2.3/auth/signout'], [r.path for r in m.request_history])
+
+    def test_close_while_checked_out(self):
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/auth/signin', text=sign_in)
+            m.post(self.baseurl + '/auth/signout', text='')
+            with self.assertRaises(KeyError):
+                with self.pool.checkout():
+                    self.pool.close()
+                    raise KeyError('work failed')
+
+            # The token was given back and signs in again
+            with self.pool.checkout(timeout=0.01) as server:
+                self.assertEqual('token-0-2', server.auth_token)
+
+    def test_close_during_sign_in(self):
+        def sign_in_and_close(request, context):
+            self.pool.close()
+            return sign_in(request, context)
+
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/auth/signin', text=sign_in_and_close)
+            m.post(self.baseurl + '/auth/signout', text='')
+            self.assertRaises(RuntimeError, self.pool.acquire)
+            # The session it signed into is not kept, and the token is given back
+            self.assertEqual('/api/2.3/auth/signout', m.request_history[-1].path)
+            self.assertEqual([None] * 3, self.pool._servers)
+
+            m.post(self.baseurl + '/auth/signin', text=sign_in)
+            with self.pool.checkout(timeout=0.01) as server:
+                self.assertEqual('token-0-2', server.auth_token)
+
+    def test_needs_tokens(self):
+        self.assertRaises(ValueError, TSC.PersonalAccessTokenPool, 'http://test', [])
+        self.assertEqual(3, len(self.pool))
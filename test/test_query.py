@@ -0,0 +1,187 @@
+import unittest
+import requests_mock
+import tableauserverclient as TSC
+from tableauserverclient.server.query import QuerySet
+
+from ._utils import read_xml_asset, read_xml_assets
+
+PAGE_1, PAGE_2, PAGE_3 = read_xml_assets('workbook_get_page_1.xml', 'workbook_get_page_2.xml',
+                                         'workbook_get_page_3.xml')
+
+
+class UnpaginatedModel(object):
+    # An endpoint whose get does not page, like most of the older ones
+    def __init__(self, items):
+        self.items = items
+        self.calls = 0
+
+    def get(self, req_options=None):
+        self.calls += 1
+        return list(self.items), TSC.PaginationItem()
+
+
+class QuerySetTests(unittest.TestCase):
+    def setUp(self):
+        self.server = TSC.Server('http://test')
+
+        # Fake sign in
+        self.server._site_id = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+        self.server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+        self.baseurl = self.server.workbooks.baseurl
+
+    def _register_pages(self, m):
+        m.get(self.baseurl + "?pageNumber=1&pageSize=1", complete_qs=True, text=PAGE_1)
+        m.get(self.baseurl + "?pageNumber=2&pageSize=1", complete_qs=True, text=PAGE_2)
+        m.get(self.baseurl + "?pageNumber=3&pageSize=1", complete_qs=True, text=PAGE_3)
+
+    def _pages_requested(self, m):
+        return [r.qs['pagenumber'][0] for r in m.request_history]
+
+    def test_index_fetches_only_covering_page(self):
+        with requests_mock.mock() as m:
+            self._register_pages(m)
+            queryset = self.server.workbooks.paginate(page_size=1)
+
+            self.assertEqual('Page2Workbook', queryset[1].name)
+            self.assertEqual(['2'], self._pages_requested(m))
+
+            # Pages are cached once fetched
+            self.assertEqual('Page2Workbook', queryset[1].name)
+            self.assertEqual(1, m.call_count)
+
+    def test_slice_fetches_only_covering_pages(self):
+        with requests_mock.mock() as m:
+            self._register_pages(m)
+            queryset = self.server.workbooks.paginate(page_size=1)
+
+            workbooks = queryset[1:3]
+            self.assertEqual(['Page2Workbook', 'Page3Workbook'], [wb.name for wb in workbooks])
+            self.assertEqual(['2', '3'], self._pages_requested(m))
+
+    def test_slice_past_end(self):
+        with requests_mock.mock() as m:
+            self._register_pages(m)
+            queryset = self.server.workbooks.paginate(page_size=1)
+
+            self.assertEqual(3, len(queryset[0:10]))
+            self.assertEqual(3, len(queryset[0:]))
+            self.assertEqual(['1', '2', '3'], self._pages_requested(m))
+
+    def test_negative_index(self):
+        with requests_mock.mock() as m:
+            self._register_pages(m)
+            queryset = self.server.workbooks.paginate(page_size=1)
+
+            self.assertEqual('Page3Workbook', queryset[-1].name)
+            self.assertEqual(['Page3Workbook', 'Page2Workbook', 'Page1Workbook'],
+                             [wb.name for wb in queryset[::-1]])
+
+    def test_index_relative_to_starting_page(self):
+        with requests_mock.mock() as m:
+            self._register_pages(m)
+            queryset = self.server.workbooks.paginate(page_number=2, page_size=1)
+
+            self.assertEqual('Page2Workbook', queryset[0].name)
+            self.assertEqual('Page3Workbook', queryset[-1].name)
+            with self.assertRaises(IndexError):
+                queryset[2]
+
+    def test_iterates_every_page(self):
+        with requests_mock.mock() as m:
+            self._register_pages(m)
+            queryset = self.server.workbooks.paginate(page_size=1)
+
+            workbooks = list(queryset)
+            self.assertEqual(['Page1Workbook', 'Page2Workbook', 'Page3Workbook'], [wb.name for wb in workbooks])
+            self.assertEqual(['1', '2', '3'], self._pages_requested(m))
+
+    def test_iterates_from_starting_page(self):
+        with requests_mock.mock() as m:
+            self._register_pages(m)
+            queryset = self.server.workbooks.paginate(page_number=2, page_size=1)
+
+            self.assertEqual(['Page2Workbook', 'Page3Workbook'], [wb.name for wb in queryset])
+
+    def test_count_uses_total_available(self):
+        with requests_mock.mock() as m:
+            m.get(self.baseurl + "?pageNumber=1&pageSize=1", complete_qs=True, text=PAGE_1)
+            queryset = self.server.workbooks.all()
+
+            self.assertEqual(3, queryset.count())
+            self.assertTrue(queryset.exists())
+            # Only one single item page was needed to answer both
+            self.assertEqual(1, m.call_count)
+
+    def test_count_without_pagination_is_cached(self):
+        model = UnpaginatedModel(['a', 'b'])
+        queryset = QuerySet(model)
+
+        self.assertEqual(2, queryset.count())
+        calls = model.calls
+        self.assertEqual(2, queryset.count())
+        self.assertEqual(calls, model.calls)
+
+    def test_page_size_capped_by_server(self):
+        with requests_mock.mock() as m:
+            # Asked for 100 per page, Server answers with pages of 1
+            m.get(self.baseurl + "?pageNumber=1&pageSize=100", complete_qs=True, text=PAGE_1)
+            self._register_pages(m)
+            queryset = self.server.workbooks.paginate(page_size=100)
+
+            self.assertEqual(['Page1Workbook', 'Page2Workbook', 'Page3Workbook'], [wb.name for wb in queryset])
+            self.assertEqual('Page3Workbook', queryset[2].name)
+            self.assertEqual(['1', '2', '3'], self._pages_requested(m))
+
+    def test_page_size_capped_by_server_from_starting_page(self):
+        with requests_mock.mock() as m:
+            m.get(self.baseurl + "?pageNumber=2&pageSize=100", complete_qs=True, text=PAGE_2)
+            self._register_pages(m)
+            queryset = self.server.workbooks.paginate(page_number=2, page_size=100)
+
+            self.assertEqual('Page2Workbook', queryset[0].name)
+            self.assertEqual('Page3Workbook', queryset[1].name)
+            self.assertEqual(2, queryset.count())
+
+    def test_len(self):
+        with requests_mock.mock() as m:
+            self._register_pages(m)
+            queryset = self.server.workbooks.paginate(page_size=1)
+
+            self.assertEqual(3, len(queryset))
+            self.assertEqual(3, len(list(queryset)))
+            self.assertEqual(['1', '2', '3'], self._pages_requested(m))
+
+    def test_first(self):
+        with requests_mock.mock() as m:
+            self._register_pages(m)
+            self.assertEqual('Page1Workbook', self.server.workbooks.paginate(page_size=1).first().name)
+
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=read_xml_asset('workbook_get_empty.xml'))
+            self.assertIsNone(self.server.workbooks.all().first())
+            self.assertFalse(self.server.workbooks.all().exists())
+
+    def test_page_cache_is_bounded(self):
+        with requests_mock.mock() as m:
+            self._register_pages(m)
+            queryset = self.server.workbooks.paginate(page_size=1)
+            queryset.page_cache_size = 2
+
+            list(queryset)
+            self.assertEqual([2, 3], list(queryset._page_cache))
+
+            # Evicted pages are fetched again, cached pages are not
+            queryset[2]
+            queryset[0]
+            self.assertEqual(['1', '2', '3', '1'], self._pages_requested(m))
+
+    def test_filter_clears_cache(self):
+        with requests_mock.mock() as m:
+            self._register_pages(m)
+            queryset = self.server.workbooks.paginate(page_size=1)
+            queryset[0]
+            queryset.filter(name='Page1Workbook')
+
+            self.assertEqual({}, dict(queryset._page_cache))
+            self.assertIsNone(queryset._total_available)
@@ -0,0 +1,120 @@
+import threading
+import time
+import unittest
+import requests_mock
+import tableauserverclient as TSC
+
+from ._utils import read_xml_asset
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+GET_XML = 'view_get.xml'
+
+
+class RateLimiterTests(unittest.TestCase):
+    def setUp(self):
+        self.now = [100.0]
+        patchers = [mock.patch('tableauserverclient.server.rate_limit.monotonic', lambda: self.now[0]),
+                    mock.patch('tableauserverclient.server.rate_limit.time.sleep')]
+        self.sleep = [p.start() for p in patchers][1]
+        for p in patchers:
+            self.addCleanup(p.stop)
+
+    def test_burst_then_wait(self):
+        limiter = TSC.RateLimiter(2, burst=3)
+        self.assertEqual([0, 0, 0], [limiter.acquire() for _ in range(3)])
+        self.assertEqual(0.5, limiter.acquire())
+        self.assertEqual(1.0, limiter.acquire())
+        self.assertEqual([mock.call(0.5), mock.call(1.0)], self.sleep.call_args_list)
+        self.assertEqual(1.5, limiter.time_waited)
+
+    def test_refills_over_time(self):
+        limiter = TSC.RateLimiter(10)
+        for _ in range(10):
+            limiter.acquire()
+        self.now[0] += 0.5
+        self.assertEqual([0] * 5, [limiter.acquire() for _ in range(5)])
+        self.assertEqual(0.1, limiter.acquire())
+
+    def test_never_refills_past_burst(self):
+        limiter = TSC.RateLimiter(1, burst=2)
+        self.now[0] += 60
+        self.assertEqual([0, 0, 1.0], [limiter.acquire() for _ in range(3)])
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, TSC.RateLimiter, 0)
+        self.assertRaises(ValueError, TSC.RateLimiter, 5, burst=0.5)
+
+    def test_shared(self):
+        limiter = TSC.RateLimiter.shared('http://shared-test', 5)
+        self.assertIs(limiter, TSC.RateLimiter.shared('http://shared-test', 5))
+        self.assertIs(limiter, TSC.RateLimiter.shared('http://shared-test', 5, burst=5))
+        self.assertIsNot(limiter, TSC.RateLimiter.shared('http://other-test', 5))
+
+    def test_shared_with_other_rate(self):
+        TSC.RateLimiter.shared('http://conflict-test', 5)
+        self.assertRaises(ValueError, TSC.RateLimiter.shared, 'http://conflict-test', 50)
+        self.assertRaises(ValueError, TSC.RateLimiter.shared, 'http://conflict-test', 5, burst=10)
+
+
+class RateLimiterThreadTests(unittest.TestCase):
+    def test_limits_across_threads(self):
+        limiter = TSC.RateLimiter(200, burst=1)
+        threads = [threading.Thread(target=limiter.acquire) for _ in range(21)]
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # The first call is free, the other 20 are spaced 5ms apart
+        self.assertGreaterEqual(time.time() - start, 0.09)
+
+
+class EndpointRateLimitTests(unittest.TestCase):
+    def setUp(self):
+        self.server = TSC.Server('http://test')
+        self.server.version = '2.5'
+
+        # Fake sign in
+        self.server._site_id = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+        self.server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+        self.baseurl = self.server.views.baseurl
+        self.server.rate_limiter = mock.Mock()
+        self.server.views.rate_limiter = mock.Mock()
+        self.server.views.render_rate_limiter = mock.Mock()
+
+    def test_server_and_endpoint_limiters(self):
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=read_xml_asset(GET_XML))
+            self.server.views.get()
+            self.server.workbooks.rate_limiter = mock.Mock()
+            m.get(self.server.workbooks.baseurl, text=read_xml_asset('workbook_get.xml'))
+            self.server.workbooks.get()
+
+        self.assertEqual(2, self.server.rate_limiter.acquire.call_count)
+        self.assertEqual(1, self.server.views.rate_limiter.acquire.call_count)
+        self.assertEqual(1, self.server.workbooks.rate_limiter.acquire.call_count)
+        self.server.views.render_rate_limiter.acquire.assert_not_called()
+
+    def test_render_limiter(self):
+        with requests_mock.mock() as m:
+            m.get(self.baseurl + '/d79634e1-6063-4ec9-95ff-50acbf609ff5/image', content=b'image')
+            single_view = TSC.ViewItem()
+            single_view._id = 'd79634e1-6063-4ec9-95ff-50acbf609ff5'
+            self.server.views.populate_image(single_view)
+            self.assertEqual(b'image', single_view.image)
+
+        self.assertEqual(1, self.server.rate_limiter.acquire.call_count)
+        self.assertEqual(1, self.server.views.rate_limiter.acquire.call_count)
+        self.assertEqual(1, self.server.views.render_rate_limiter.acquire.call_count)
+
+    @mock.patch('tableauserverclient.server.retry.time.sleep')
+    def test_retries_are_limited(self, sleep):
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, [{'status_code': 503, 'text': ''}, {'text': read_xml_asset(GET_XML)}])
+            self.server.views.get()
+        self.assertEqual(2, self.server.rate_limiter.acquire.call_count)
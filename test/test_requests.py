@@ -7,6 +7,11 @@ import tableauserverclient as TSC
 
 from tableauserverclient.server.endpoint.exceptions import InternalServerError, NonXMLResponseError
 
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
 
 class RequestTests(unittest.TestCase):
     def setUp(self):
@@ -18,6 +23,20 @@ class RequestTests(unittest.TestCase):
 
         self.baseurl = self.server.workbooks.baseurl
 
+    def test_default_pool(self):
+        adapter = self.server.session.get_adapter('https://test')
+        self.assertEqual(requests.adapters.DEFAULT_POOLSIZE, adapter._pool_maxsize)
+        self.assertFalse(adapter._pool_block)
+
+    def test_pool_options(self):
+        server = TSC.Server('http://test', pool_connections=2, pool_maxsize=32, pool_block=True)
+        for url in ('http://test', 'https://test'):
+            adapter = server.session.get_adapter(url)
+            self.assertEqual(2, adapter._pool_connections)
+            self.assertEqual(32, adapter._pool_maxsize)
+            self.assertTrue(adapter._pool_block)
+            self.assertEqual(32, adapter.poolmanager.connection_pool_kw['maxsize'])
+
     def test_make_get_request(self):
         with requests_mock.mock() as m:
             m.get(requests_mock.ANY)
@@ -62,3 +81,22 @@ class RequestTests(unittest.TestCase):
         with requests_mock.mock() as m:
             m.register_uri('GET', self.server.server_info.baseurl, status_code=499, text=server_response)
             self.assertRaisesRegex(NonXMLResponseError, server_response, self.server.server_info.get)
+
+    def test_debug_log_is_bounded(self):
+        body = '<tsResponse>' + 'x' * 5000 + '</tsResponse>'
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text=body, headers={'Content-Type': 'application/xml'})
+            with self.assertLogs('tableau.endpoint', level='DEBUG') as logs:
+                self.server.workbooks.get_request(self.baseurl)
+
+        self.assertEqual(2, len(logs.output))
+        for output in logs.output:
+            self.assertLess(len(output), 1200)
+            self.assertIn('({0} bytes)'.format(len(body)), output)
+
+    def test_response_is_not_decoded_without_debug(self):
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, text='<tsResponse />', headers={'Content-Type': 'application/xml'})
+            with mock.patch('tableauserverclient.server.endpoint.endpoint._preview') as preview:
+                self.server.workbooks.get_request(self.baseurl)
+        preview.assert_not_called()
@@ -0,0 +1,130 @@
+import unittest
+import requests
+import requests_mock
+from email.utils import formatdate
+import time
+import tableauserverclient as TSC
+
+from tableauserverclient.server.endpoint.exceptions import InternalServerError
+
+from ._utils import read_xml_asset
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+GET_XML = 'workbook_get.xml'
+
+
+@mock.patch('tableauserverclient.server.retry.time.sleep')
+class RetryTests(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        self.policy = TSC.RetryPolicy(total=3, backoff_factor=1, jitter=False, on_retry=self.events.append)
+        self.server = TSC.Server('http://test', retry_policy=self.policy)
+
+        # Fake sign in
+        self.server._site_id = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+        self.server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+        self.baseurl = self.server.workbooks.baseurl
+
+    def test_retries_transient_errors(self, sleep):
+        response_xml = read_xml_asset(GET_XML)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, [{'status_code': 503, 'text': ''},
+                                 {'status_code': 429, 'text': ''},
+                                 {'text': response_xml}])
+            all_workbooks, pagination_item = self.server.workbooks.get()
+            self.assertEqual(3, m.call_count)
+
+        self.assertEqual(2, len(all_workbooks))
+        self.assertEqual([503, 429], [e.status_code for e in self.events])
+        self.assertEqual(['GET', 'GET'], [e.method for e in self.events])
+        self.assertEqual([1.0, 2.0], [c[0][0] for c in sleep.call_args_list])
+        self.assertEqual(2, self.policy.retries)
+        self.assertEqual(3.0, self.policy.time_waited)
+
+    def test_gives_up_after_total(self, sleep):
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, status_code=502, text='')
+            self.assertRaises(InternalServerError, self.server.workbooks.get)
+            self.assertEqual(4, m.call_count)
+        self.assertEqual([1, 2, 3], [e.attempt for e in self.events])
+
+    def test_post_is_not_retried(self, sleep):
+        self.server.version = '2.8'
+        with requests_mock.mock() as m:
+            m.post(self.server.workbooks.baseurl + '/1f951daf-4061-451a-9df1-69a8062664f2/refresh',
+                   status_code=503, text='')
+            workbook = TSC.WorkbookItem('test')
+            workbook._id = '1f951daf-4061-451a-9df1-69a8062664f2'
+            self.assertRaises(InternalServerError, self.server.workbooks.refresh, workbook)
+            self.assertEqual(1, m.call_count)
+        sleep.assert_not_called()
+
+    def test_other_errors_are_not_retried(self, sleep):
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, status_code=500, text='')
+            self.assertRaises(InternalServerError, self.server.workbooks.get)
+            self.assertEqual(1, m.call_count)
+
+    def test_retry_after_seconds(self, sleep):
+        response_xml = read_xml_asset(GET_XML)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, [{'status_code': 429, 'text': '', 'headers': {'Retry-After': '7'}},
+                                 {'text': response_xml}])
+            self.server.workbooks.get()
+        sleep.assert_called_once_with(7.0)
+
+    def test_retry_after_is_capped(self, sleep):
+        self.policy.max_backoff = 30
+        response_xml = read_xml_asset(GET_XML)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, [{'status_code': 503, 'text': '', 'headers': {'Retry-After': '86400'}},
+                                 {'text': response_xml}])
+            self.server.workbooks.get()
+        sleep.assert_called_once_with(30)
+        self.assertEqual(30, self.events[0].delay)
+
+    def test_retry_after_date(self, sleep):
+        value = formatdate(time.time() + 60, usegmt=True)
+        delay = TSC.RetryPolicy.parse_retry_after(value)
+        self.assertTrue(55 < delay <= 60)
+        self.assertEqual(0.0, TSC.RetryPolicy.parse_retry_after(formatdate(0, usegmt=True)))
+        self.assertIsNone(TSC.RetryPolicy.parse_retry_after('soon'))
+
+    def test_connection_errors_are_retried(self, sleep):
+        response_xml = read_xml_asset(GET_XML)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, [{'exc': requests.exceptions.ConnectionError},
+                                 {'text': response_xml}])
+            self.server.workbooks.get()
+        self.assertEqual(1, len(self.events))
+        self.assertIsNone(self.events[0].status_code)
+        self.assertIsInstance(self.events[0].error, requests.exceptions.ConnectionError)
+
+    def test_certificate_and_proxy_errors_are_not_retried(self, sleep):
+        for error in (requests.exceptions.SSLError, requests.exceptions.ProxyError):
+            with requests_mock.mock() as m:
+                m.get(self.baseurl, exc=error)
+                self.assertRaises(error, self.server.workbooks.get)
+                self.assertEqual(1, m.call_count)
+        sleep.assert_not_called()
+        self.assertEqual([], self.events)
+
+    def test_backoff(self, sleep):
+        policy = TSC.RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+        self.assertEqual([0.5, 1, 2, 3, 3], [policy.backoff(attempt) for attempt in range(1, 6)])
+
+        policy.jitter = True
+        for attempt in range(1, 6):
+            self.assertTrue(0 <= policy.backoff(attempt) <= 3)
+
+    def test_disabled(self, sleep):
+        self.server.retry_policy = TSC.RetryPolicy(total=0)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl, status_code=503, text='')
+            self.assertRaises(InternalServerError, self.server.workbooks.get)
+            self.assertEqual(1, m.call_count)
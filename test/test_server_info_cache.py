@@ -0,0 +1,122 @@
+import os
+import shutil
+import tempfile
+import unittest
+import requests_mock
+import tableauserverclient as TSC
+
+from tableauserverclient.namespace import OLD_NAMESPACE, NEW_NAMESPACE
+from tableauserverclient.server.endpoint.exceptions import NonXMLResponseError
+
+from ._utils import read_xml_asset
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+SERVER_INFO_25_XML = 'server_info_25.xml'
+SIGN_IN_XML = 'auth_sign_in.xml'
+
+
+class ServerInfoCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'cache', 'server_info.json')
+        self.cache = TSC.ServerInfoCache(self.path, ttl=60)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_set_and_get(self):
+        self.assertIsNone(self.cache.get('http://test'))
+        self.cache.set('http://test/', '3.4', NEW_NAMESPACE)
+
+        entry = TSC.ServerInfoCache(self.path).get('HTTP://TEST')
+        self.assertEqual('3.4', entry['version'])
+        self.assertEqual(NEW_NAMESPACE, entry['namespace'])
+        self.assertIsNone(self.cache.get('http://other'))
+
+    def test_ttl(self):
+        self.cache.set('http://test', '3.4', NEW_NAMESPACE)
+        with mock.patch('tableauserverclient.server.server_info_cache.time.time', return_value=1e12):
+            self.assertIsNone(self.cache.get('http://test'))
+
+    def test_invalidate(self):
+        self.cache.set('http://test', '3.4', NEW_NAMESPACE)
+        self.cache.set('http://other', '3.4', NEW_NAMESPACE)
+        self.cache.invalidate('http://test')
+        self.assertIsNone(self.cache.get('http://test'))
+        self.assertIsNotNone(self.cache.get('http://other'))
+
+    def test_unreadable_file_is_ignored(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, 'w') as f:
+            f.write('{not json')
+        self.assertIsNone(self.cache.get('http://test'))
+        self.cache.set('http://test', '3.4', NEW_NAMESPACE)
+        self.assertEqual('3.4', self.cache.get('http://test')['version'])
+
+    def test_use_server_version_is_cached(self):
+        with requests_mock.mock() as m:
+            m.get('http://test/api/2.4/serverInfo', text=read_xml_asset(SERVER_INFO_25_XML))
+            server = TSC.Server('http://test', use_server_version=True, server_info_cache=self.cache)
+            self.assertEqual('2.5', server.version)
+            self.assertEqual(1, m.call_count)
+
+            server = TSC.Server('http://test', use_server_version=True, server_info_cache=self.cache)
+            self.assertEqual('2.5', server.version)
+            self.assertEqual(1, m.call_count)
+
+    def test_namespace_mismatch_invalidates(self):
+        self.cache.set('http://test', '2.3', OLD_NAMESPACE)
+        server = TSC.Server('http://test', use_server_version=True, server_info_cache=self.cache)
+        self.assertEqual(OLD_NAMESPACE, server.namespace['t'])
+
+        with requests_mock.mock() as m:
+            m.post('http://test/api/2.3/auth/signin', text=read_xml_asset(SIGN_IN_XML))
+            server.auth.sign_in(TSC.TableauAuth('testuser', 'password'))
+
+        self.assertEqual(NEW_NAMESPACE, server.namespace['t'])
+        self.assertEqual('eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l', server.auth_token)
+        self.assertIsNone(self.cache.get('http://test'))
+
+    def test_matching_namespace_keeps_entry(self):
+        self.cache.set('http://test', '2.3', NEW_NAMESPACE)
+        server = TSC.Server('http://test', use_server_version=True, server_info_cache=self.cache)
+        with requests_mock.mock() as m:
+            m.post('http://test/api/2.3/auth/signin', text=read_xml_asset(SIGN_IN_XML))
+            server.auth.sign_in(TSC.TableauAuth('testuser', 'password'))
+        self.assertIsNotNone(self.cache.get('http://test'))
+
+    def test_unknown_version_invalidates(self):
+        self.cache.set('http://test', '9.9', NEW_NAMESPACE)
+        server = TSC.Server('http://test', use_server_version=True, server_info_cache=self.cache)
+        self.assertEqual('9.9', server.version)
+        with requests_mock.mock() as m:
+            m.post('http://test/api/9.9/auth/signin', status_code=404, text='Not Found')
+            m.get('http://test/api/9.9/serverInfo', status_code=404, text='Not Found')
+            self.assertRaises(NonXMLResponseError, server.auth.sign_in, TSC.TableauAuth('testuser', 'password'))
+        self.assertIsNone(self.cache.get('http://test'))
+
+    def test_other_404_keeps_entry(self):
+        self.cache.set('http://test', '3.4', NEW_NAMESPACE)
+        server = TSC.Server('http://test', use_server_version=True, server_info_cache=self.cache)
+        server._site_id = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+        server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+        with requests_mock.mock() as m:
+            m.get(server.workbooks.baseurl, status_code=404, text='Not Found')
+            m.get('http://test/api/3.4/serverInfo', text=read_xml_asset(SERVER_INFO_25_XML))
+            self.assertRaises(NonXMLResponseError, server.workbooks.get)
+            self.assertRaises(NonXMLResponseError, server.workbooks.get)
+        self.assertIsNotNone(self.cache.get('http://test'))
+        # The version is only checked once
+        self.assertEqual(3, m.call_count)
+
+    def test_failed_write_leaves_no_temp_file(self):
+        self.cache.set('http://test', '3.4', NEW_NAMESPACE)
+        with mock.patch('tableauserverclient.server.json_file.json.dump', side_effect=IOError('disk full')):
+            self.cache.set('http://other', '3.4', NEW_NAMESPACE)
+        self.assertEqual(['server_info.json', 'server_info.json.lock'],
+                         sorted(os.listdir(os.path.dirname(self.path))))
+        self.assertIsNone(self.cache.get('http://other'))
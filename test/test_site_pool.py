@@ -0,0 +1,100 @@
+import re
+import threading
+import unittest
+import requests_mock
+import tableauserverclient as TSC
+
+from ._utils import read_xml_asset
+
+SIGN_IN_XML = 'auth_sign_in.xml'
+SITE_GET_XML = 'site_get.xml'
+WORKBOOK_GET_XML = 'workbook_get.xml'
+SERVER_INFO_XML = 'server_info_25.xml'
+
+SITE_IDS = {'': 'dad65087-b08b-4603-af4e-2887b8aafc67', 'Samples': '6b7179ba-b82b-4f0f-91ed-812074ac5da6'}
+
+
+def sign_in(request, context):
+    content_url = re.search(r'contentUrl="([^"]*)"', request.text).group(1)
+    return read_xml_asset(SIGN_IN_XML) \
+        .replace('6b7179ba-b82b-4f0f-91ed-812074ac5da6', SITE_IDS[content_url]) \
+        .replace('eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l', 'token-' + content_url)
+
+
+class SitePoolTests(unittest.TestCase):
+    def setUp(self):
+        self.pool = TSC.SitePool('http://test', TSC.TableauAuth('testuser', 'password'))
+        self.baseurl = 'http://test/api/2.3'
+
+    def test_server_signs_in_once_per_site(self):
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/auth/signin', text=sign_in)
+            server = self.pool.server('Samples')
+            self.assertIs(server, self.pool.server('Samples'))
+            self.assertEqual('token-Samples', server.auth_token)
+            self.assertEqual('token-', self.pool.server('').auth_token)
+        self.assertEqual(2, m.call_count)
+
+    def test_concurrent_sign_in(self):
+        servers = []
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/auth/signin', text=sign_in)
+            threads = [threading.Thread(target=lambda: servers.append(self.pool.server('Samples')))
+                       for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(1, m.call_count)
+        self.assertEqual(1, len(set(map(id, servers))))
+
+    def test_map_all_sites(self):
+        def get_workbooks(server, site):
+            return list(TSC.Pager(server.workbooks))
+
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/auth/signin', text=sign_in)
+            m.get(self.baseurl + '/sites', text=read_xml_asset(SITE_GET_XML))
+            for content_url, site_id in SITE_IDS.items():
+                m.get('{0}/sites/{1}/workbooks'.format(self.baseurl, site_id), text=read_xml_asset(WORKBOOK_GET_XML),
+                      request_headers={'x-tableau-auth': 'token-' + content_url})
+            results = self.pool.map(get_workbooks, concurrency=2)
+
+        self.assertEqual(['', 'Samples'], [r.item.content_url for r in results])
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual([2, 2], [len(r.result) for r in results])
+
+    def test_map_records_errors(self):
+        def fail_on_samples(server, site):
+            if site == 'Samples':
+                raise ValueError(site)
+            return server.site_id
+
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/auth/signin', text=sign_in)
+            results = self.pool.map(fail_on_samples, ['', 'Samples'])
+
+        self.assertEqual(SITE_IDS[''], results[0].result)
+        self.assertIsInstance(results[1].error, ValueError)
+
+    def test_server_version_looked_up_once(self):
+        pool = TSC.SitePool('http://test', TSC.TableauAuth('testuser', 'password'), use_server_version=True)
+        with requests_mock.mock() as m:
+            m.get(self.baseurl.replace('2.3', '2.4') + '/serverInfo', text=read_xml_asset(SERVER_INFO_XML))
+            m.post('http://test/api/2.5/auth/signin', text=sign_in)
+            self.assertEqual('2.5', pool.server('').version)
+            self.assertEqual('2.5', pool.server('Samples').version)
+        self.assertEqual(1, len([r for r in m.request_history if r.method == 'GET']))
+
+    def test_close_signs_out(self):
+        with requests_mock.mock() as m:
+            m.post(self.baseurl + '/auth/signin', text=sign_in)
+            m.post(self.baseurl + '/auth/signout', text='')
+            server = self.pool.server('Samples')
+            self.pool.close()
+        self.assertFalse(server.is_signed_in())
+        self.assertEqual('token-Samples', m.last_request.headers['x-tableau-auth'])
+
+    def test_invalid_concurrency(self):
+        self.assertRaises(ValueError, TSC.SitePool, 'http://test', TSC.TableauAuth('testuser', 'password'),
+                          concurrency=0)
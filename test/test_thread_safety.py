@@ -0,0 +1,153 @@
+import threading
+import unittest
+import tableauserverclient as TSC
+
+from ._stub_server import StubServer
+
+try:
+    from urllib.parse import urlparse, parse_qs
+except ImportError:
+    from urlparse import urlparse, parse_qs
+
+SITE_ID = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+PAGE_SIZE = 5
+PAGES = 8
+THREADS = 16
+
+PAGE_XML = u"""<?xml version='1.0' encoding='UTF-8'?>
+<tsResponse xmlns="http://tableau.com/api">
+    <pagination pageNumber="{0}" pageSize="{1}" totalAvailable="{2}" />
+    <workbooks>{3}</workbooks>
+</tsResponse>"""
+
+WORKBOOK_XML = u"""
+        <workbook id="{0}" name="{0}" contentUrl="{0}" showTabs="false" size="1"
+                  createdAt="2016-08-03T20:34:04Z" updatedAt="2016-08-04T17:56:41Z">
+            <project id="ee8c6e70-43b6-11e6-af4f-f7b0d8e20760" name="default" />
+            <owner id="5de011f8-5aa9-4d5b-b991-f462c8dd6bb7" />
+        </workbook>"""
+
+
+def workbooks_page(handler):
+    query = parse_qs(urlparse(handler.path).query)
+    page_number = int(query['pageNumber'][0])
+    page_size = int(query['pageSize'][0])
+    start = (page_number - 1) * page_size
+    workbooks = ''.join(WORKBOOK_XML.format('workbook-{0}'.format(i))
+                        for i in range(start, min(start + page_size, PAGE_SIZE * PAGES)))
+    body = PAGE_XML.format(page_number, page_size, PAGE_SIZE * PAGES, workbooks).encode('utf-8')
+    return 200, {'Content-Type': 'application/xml'}, body
+
+
+class ThreadSafetyTests(unittest.TestCase):
+    def setUp(self):
+        self.stub = StubServer({'/api/2.3/sites/{0}/workbooks'.format(SITE_ID): workbooks_page})
+        self.stub.__enter__()
+        self.server = TSC.Server(self.stub.address, pool_maxsize=THREADS)
+        self.server._site_id = SITE_ID
+        self.server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+        self.expected = ['workbook-{0}'.format(i) for i in range(PAGE_SIZE * PAGES)]
+
+    def tearDown(self):
+        self.server.transport.close()
+        self.stub.__exit__(None, None, None)
+
+    def run_threads(self, target):
+        errors = []
+
+        def run(index):
+            try:
+                target(index)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+
+    def page_through(self, server):
+        options = TSC.RequestOptions(pagesize=PAGE_SIZE)
+        return [workbook.name for workbook in TSC.Pager(server.workbooks, options)]
+
+    def test_concurrent_pagers_on_shared_server(self):
+        results = dict()
+
+        def target(index):
+            # Change the options while other threads are sending requests with them
+            self.server.add_http_options({'timeout': 30 + index})
+            results[index] = self.page_through(self.server)
+
+        self.run_threads(target)
+        self.assertEqual([self.expected] * THREADS, [results[i] for i in range(THREADS)])
+        self.assertEqual(THREADS * PAGES, len(self.stub.requests))
+        self.assertLessEqual(self.stub.connections, THREADS)
+
+    def test_concurrent_pagers_on_clones(self):
+        results = dict()
+
+        def target(index):
+            clone = self.server.clone()
+            clone.add_http_options({'timeout': 30})
+            results[index] = self.page_through(clone)
+
+        self.run_threads(target)
+        self.assertEqual([self.expected] * THREADS, [results[i] for i in range(THREADS)])
+        self.assertEqual(dict(), self.server.http_options)
+        self.assertLessEqual(self.stub.connections, THREADS)
+
+    def test_concurrent_streamed_pagers(self):
+        results = dict()
+
+        def target(index):
+            options = TSC.RequestOptions(pagesize=PAGE_SIZE)
+            results[index] = [w.name for w in TSC.Pager(self.server.clone().workbooks, options, stream=True)]
+
+        self.run_threads(target)
+        self.assertEqual([self.expected] * THREADS, [results[i] for i in range(THREADS)])
+
+
+class CloneTests(unittest.TestCase):
+    def setUp(self):
+        self.server = TSC.Server('http://test')
+        self.server.version = '3.4'
+        self.server._set_auth(SITE_ID, 'user-id', 'token')
+
+    def test_clone_shares_session(self):
+        clone = self.server.clone()
+        self.assertIs(self.server.transport, clone.transport)
+        self.assertIs(self.server.bulk, clone.bulk)
+        self.assertEqual('token', clone.auth_token)
+        self.assertEqual(SITE_ID, clone.site_id)
+
+        clone._set_auth('other-site', 'other-user', 'other-token')
+        self.assertEqual('other-token', self.server.auth_token)
+        self.server._clear_auth()
+        self.assertFalse(clone.is_signed_in())
+
+    def test_clone_isolates_settings(self):
+        clone = self.server.clone()
+        clone.version = '2.8'
+        clone.add_http_options({'verify': False})
+        clone.add_request_hook(before=print)
+
+        self.assertEqual('3.4', self.server.version)
+        self.assertEqual(dict(), self.server.http_options)
+        self.assertEqual(([], []), self.server.request_hooks)
+        self.assertIsNot(self.server.workbooks, clone.workbooks)
+        self.assertIs(clone, clone.workbooks.parent_srv)
+        self.assertEqual('http://test/api/2.8', clone.baseurl)
+
+    def test_clone_keeps_endpoint_rate_limiters(self):
+        limiter = TSC.RateLimiter(10)
+        self.server.views.render_rate_limiter = limiter
+        self.server.users.rate_limiter = limiter
+        clone = self.server.clone()
+        self.assertIs(limiter, clone.views.render_rate_limiter)
+        self.assertIs(limiter, clone.users.rate_limiter)
+
+    def test_replace_one_id(self):
+        self.server._site_id = 'new-site'
+        self.assertEqual(('new-site', 'user-id', 'token'), self.server._signed_in.ids)
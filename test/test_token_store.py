@@ -0,0 +1,185 @@
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+import requests_mock
+import tableauserverclient as TSC
+
+from tableauserverclient.server.token_store import token_key
+
+from ._utils import read_xml_asset
+
+SIGN_IN_XML = 'auth_sign_in.xml'
+SIGN_IN_ERROR_XML = 'auth_sign_in_error.xml'
+GET_XML = 'workbook_get.xml'
+PAGE_1_XML = 'workbook_get_page_1.xml'
+PAGE_2_XML = 'workbook_get_page_2.xml'
+PAGE_3_XML = 'workbook_get_page_3.xml'
+
+TOKEN = 'eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l'
+SITE_ID = '6b7179ba-b82b-4f0f-91ed-812074ac5da6'
+
+
+def sign_in_xml(token):
+    return read_xml_asset(SIGN_IN_XML).replace(TOKEN, token)
+
+
+class ReauthenticationTests(unittest.TestCase):
+    def setUp(self):
+        self.server = TSC.Server('http://test')
+        self.auth_url = self.server.auth.baseurl
+        self.workbooks_url = '{0}/sites/{1}/workbooks'.format(self.server.baseurl, SITE_ID)
+
+    def test_expired_session_is_replaced(self):
+        with requests_mock.mock() as m:
+            m.post(self.auth_url + '/signin', [{'text': sign_in_xml('first')}, {'text': sign_in_xml('second')}])
+            self.server.auth.sign_in(TSC.TableauAuth('testuser', 'password'))
+            m.get(self.workbooks_url, [{'status_code': 401, 'text': read_xml_asset(SIGN_IN_ERROR_XML)},
+                                       {'text': read_xml_asset(GET_XML)}])
+            all_workbooks, _ = self.server.workbooks.get()
+
+        self.assertEqual(2, len(all_workbooks))
+        self.assertEqual('second', self.server.auth_token)
+        requests = [r for r in m.request_history if r.method == 'GET']
+        self.assertEqual(['first', 'second'], [r.headers['x-tableau-auth'] for r in requests])
+
+    def test_pager_survives_expiry(self):
+        with requests_mock.mock() as m:
+            m.post(self.auth_url + '/signin', [{'text': sign_in_xml('first')}, {'text': sign_in_xml('second')}])
+            self.server.auth.sign_in(TSC.TableauAuth('testuser', 'password'))
+            m.get(self.workbooks_url + '?pageNumber=1', text=read_xml_asset(PAGE_1_XML))
+            m.get(self.workbooks_url + '?pageNumber=2', [{'status_code': 401,
+                                                          'text': read_xml_asset(SIGN_IN_ERROR_XML)},
+                                                         {'text': read_xml_asset(PAGE_2_XML)}])
+            m.get(self.workbooks_url + '?pageNumber=3', text=read_xml_asset(PAGE_3_XML))
+            workbooks = list(TSC.Pager(self.server.workbooks, TSC.RequestOptions(pagesize=1)))
+
+        self.assertEqual(3, len(workbooks))
+        self.assertEqual(2, len([r for r in m.request_history if r.method == 'POST']))
+
+    def test_no_credentials_no_retry(self):
+        self.server._site_id = SITE_ID
+        self.server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+        with requests_mock.mock() as m:
+            m.get(self.workbooks_url, status_code=401, text=read_xml_asset(SIGN_IN_ERROR_XML))
+            self.assertRaises(TSC.ServerResponseError, self.server.workbooks.get)
+        self.assertEqual(1, m.call_count)
+
+    def test_sign_out_forgets_credentials(self):
+        with requests_mock.mock() as m:
+            m.post(self.auth_url + '/signin', text=sign_in_xml('first'))
+            m.post(self.auth_url + '/signout', text='')
+            self.server.auth.sign_in(TSC.TableauAuth('testuser', 'password'))
+            self.server.auth.sign_out()
+        self.assertIsNone(self.server._auth_request)
+
+
+class TokenStoreTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'tokens', 'tokens.json')
+        self.store = TSC.FileTokenStore(self.path)
+        self.tableau_auth = TSC.TableauAuth('testuser', 'password', site_id='Samples')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def sign_in(self, store, mock):
+        server = TSC.Server('http://test', token_store=store)
+        mock.post(server.auth.baseurl + '/signin', text=sign_in_xml('stored'))
+        server.auth.sign_in(self.tableau_auth)
+        return server
+
+    def test_token_key(self):
+        key = token_key('http://test/', self.tableau_auth)
+        self.assertEqual(key, token_key('HTTP://TEST', TSC.TableauAuth('testuser', 'password', site_id='Samples')))
+        self.assertNotEqual(key, token_key('http://test', TSC.TableauAuth('testuser', 'other', site_id='Samples')))
+        self.assertNotEqual(key, token_key('http://test', TSC.TableauAuth('testuser', 'password')))
+        self.assertNotIn('password', key)
+
+    def test_session_is_shared(self):
+        with requests_mock.mock() as m:
+            self.sign_in(self.store, m)
+            # Another process has its own store on the same file
+            server = self.sign_in(TSC.FileTokenStore(self.path), m)
+        self.assertEqual(1, m.call_count)
+        self.assertEqual('stored', server.auth_token)
+        self.assertEqual(SITE_ID, server.site_id)
+
+    def test_in_memory_store(self):
+        store = TSC.TokenStore()
+        with requests_mock.mock() as m:
+            self.sign_in(store, m)
+            self.sign_in(store, m)
+        self.assertEqual(1, m.call_count)
+
+    def test_expired_entry(self):
+        store = TSC.FileTokenStore(self.path, ttl=-1)
+        with requests_mock.mock() as m:
+            self.sign_in(store, m)
+            self.sign_in(store, m)
+        self.assertEqual(2, m.call_count)
+
+    @unittest.skipIf(os.name != 'posix', 'file modes are POSIX only')
+    def test_file_is_private(self):
+        with requests_mock.mock() as m:
+            self.sign_in(self.store, m)
+        self.assertEqual(0, os.stat(self.path).st_mode & (stat.S_IRWXG | stat.S_IRWXO))
+
+    def test_expired_session_is_replaced_in_store(self):
+        with requests_mock.mock() as m:
+            server = self.sign_in(self.store, m)
+            other = self.sign_in(TSC.FileTokenStore(self.path), m)
+            m.post(server.auth.baseurl + '/signin', text=sign_in_xml('renewed'))
+            workbooks_url = '{0}/sites/{1}/workbooks'.format(server.baseurl, SITE_ID)
+            m.get(workbooks_url, request_headers={'x-tableau-auth': 'stored'}, status_code=401,
+                  text=read_xml_asset(SIGN_IN_ERROR_XML))
+            m.get(workbooks_url, request_headers={'x-tableau-auth': 'renewed'}, text=read_xml_asset(GET_XML))
+
+            server.workbooks.get()
+            # The other server replaces its expired session with the one already renewed
+            other.workbooks.get()
+
+        self.assertEqual(2, len([r for r in m.request_history if r.method == 'POST']))
+        self.assertEqual('renewed', other.auth_token)
+        self.assertEqual('renewed', self.store.get(token_key('http://test', self.tableau_auth))['auth_token'])
+
+    def test_invalidate_keeps_newer_session(self):
+        self.store.set('key', SITE_ID, 'user', 'new')
+        self.store.invalidate('key', 'old')
+        self.assertEqual('new', self.store.get('key')['auth_token'])
+        self.store.invalidate('key', 'new')
+        self.assertIsNone(self.store.get('key'))
+
+    def test_sign_out_keeps_shared_session(self):
+        with requests_mock.mock() as m:
+            server = self.sign_in(self.store, m)
+            server.auth.sign_out()
+        self.assertFalse(server.is_signed_in())
+        self.assertEqual(1, m.call_count)
+        self.assertIsNotNone(self.store.get(token_key('http://test', self.tableau_auth)))
+
+    def test_forced_sign_out_ends_shared_session(self):
+        with requests_mock.mock() as m:
+            server = self.sign_in(self.store, m)
+            m.post(server.auth.baseurl + '/signout', text='')
+            server.auth.sign_out(force=True)
+        self.assertFalse(server.is_signed_in())
+        self.assertEqual(['/api/2.3/auth/signin', '/api/2.3/auth/signout'], [r.path for r in m.request_history])
+        self.assertEqual('stored', m.request_history[1].headers['x-tableau-auth'])
+        self.assertIsNone(self.store.get(token_key('http://test', self.tableau_auth)))
+
+    def test_switch_site_keeps_shared_session(self):
+        with requests_mock.mock() as m:
+            server = self.sign_in(self.store, m)
+            server.version = '2.6'
+            m.post(server.auth.baseurl + '/signin', text=sign_in_xml('finance'))
+            server.auth.switch_site(TSC.SiteItem('Finance', 'finance'))
+
+        self.assertEqual(['/api/2.3/auth/signin', '/api/2.6/auth/signin'], [r.path for r in m.request_history])
+        self.assertIn('contentUrl="finance"', m.request_history[1].text)
+        self.assertEqual('finance', server.auth_token)
+        self.assertEqual('stored', self.store.get(token_key('http://test', self.tableau_auth))['auth_token'])
+        finance_auth = TSC.TableauAuth('testuser', 'password', site_id='finance')
+        self.assertEqual('finance', self.store.get(token_key('http://test', finance_auth))['auth_token'])
@@ -0,0 +1,214 @@
+import gzip
+import json
+import socket
+import unittest
+import zlib
+import requests
+import tableauserverclient as TSC
+
+from tableauserverclient.server.transport import httpx
+
+from ._stub_server import StubServer, slow
+from ._utils import read_xml_asset
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+SITE_ID = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+WORKBOOKS_PATH = '/api/2.3/sites/{}/workbooks'.format(SITE_ID)
+USERS_PATH = '/api/2.3/sites/{}/users'.format(SITE_ID)
+GET_XML = read_xml_asset('workbook_get.xml').encode('utf-8')
+USERS_XML = read_xml_asset('user_get.xml').encode('utf-8')
+DOWNLOAD = bytes(bytearray(range(256))) * 1000
+
+
+def compressed(request):
+    # Compress only when the client asked for it, like Tableau Server
+    accepted = request.headers.get('Accept-Encoding', '')
+    if 'gzip' in accepted:
+        return 200, {'Content-Type': 'text/xml', 'Content-Encoding': 'gzip'}, gzip.compress(USERS_XML)
+    if 'deflate' in accepted:
+        return 200, {'Content-Type': 'text/xml', 'Content-Encoding': 'deflate'}, zlib.compress(USERS_XML)
+    return 200, {'Content-Type': 'text/xml'}, USERS_XML
+
+
+class TransportConformance(object):
+    """
+    Behavior every Transport must have. Subclasses set `make_transport`.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.stub = StubServer({
+            WORKBOOKS_PATH: (200, {'Content-Type': 'text/xml;charset=utf-8'}, GET_XML),
+            '/unavailable': (503, {'Content-Type': 'text/xml', 'Retry-After': '1'}, b''),
+            '/redirect': (302, {'Location': '/echo'}, b''),
+            '/slow': slow(1, (200, {}, b'late')),
+            '/download': (200, {'Content-Type': 'application/octet-stream'}, DOWNLOAD),
+            USERS_PATH: compressed,
+        }).__enter__()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.stub.__exit__(None, None, None)
+
+    def setUp(self):
+        self.transport = self.make_transport()
+
+    def tearDown(self):
+        self.transport.close()
+
+    def echo(self, response):
+        self.assertEqual(200, response.status_code)
+        return json.loads(response.content.decode('utf-8'))
+
+    def test_get_with_params_and_headers(self):
+        response = self.transport.get(self.stub.url('/echo'), params={'pageSize': 1, 'filter': 'name:eq:a b'},
+                                      headers={'x-tableau-auth': 'token'})
+        echo = self.echo(response)
+        self.assertEqual('GET', echo['method'])
+        self.assertEqual({'pageSize': ['1'], 'filter': ['name:eq:a b']}, echo['query'])
+        self.assertEqual('token', echo['headers']['x-tableau-auth'])
+
+    def test_methods_and_bodies(self):
+        for method, data in (('post', b'<tsRequest />'), ('put', u'<tsRequest name="é" />'), ('delete', None)):
+            response = getattr(self.transport, method)(self.stub.url('/echo'), data=data,
+                                                       headers={'content-type': 'text/xml'})
+            echo = self.echo(response)
+            self.assertEqual(method.upper(), echo['method'])
+            expected = data.decode('utf-8') if isinstance(data, bytes) else (data or '')
+            self.assertEqual(expected, echo['body'])
+
+    def test_error_status_is_returned(self):
+        response = self.transport.get(self.stub.url('/unavailable'))
+        self.assertEqual(503, response.status_code)
+        self.assertEqual('1', response.headers['retry-after'])
+        self.assertEqual(b'', response.content)
+
+    def test_response(self):
+        response = self.transport.get(self.stub.url(WORKBOOKS_PATH))
+        self.assertEqual(GET_XML, response.content)
+        self.assertEqual('text/xml;charset=utf-8', response.headers['content-type'])
+        self.assertEqual('utf-8', response.encoding.lower())
+
+    def test_stream(self):
+        response = self.transport.get(self.stub.url('/download'), stream=True)
+        response.raw.decode_content = True
+        chunks = []
+        chunk = response.raw.read(4096)
+        while chunk:
+            chunks.append(chunk)
+            chunk = response.raw.read(4096)
+        response.close()
+        self.assertEqual(DOWNLOAD, b''.join(chunks))
+
+    def test_iter_content(self):
+        response = self.transport.get(self.stub.url('/download'), stream=True)
+        chunks = list(response.iter_content(1024))
+        response.close()
+        self.assertEqual(DOWNLOAD, b''.join(chunks))
+        self.assertTrue(all(len(chunk) <= 1024 for chunk in chunks))
+
+    def test_decompresses(self):
+        for encoding in ('gzip', 'deflate'):
+            response = self.transport.get(self.stub.url(USERS_PATH), headers={'accept-encoding': encoding})
+            self.assertEqual(encoding, response.headers['content-encoding'])
+            self.assertEqual(USERS_XML, response.content)
+
+            response = self.transport.get(self.stub.url(USERS_PATH), headers={'accept-encoding': encoding},
+                                          stream=True)
+            response.raw.decode_content = True
+            self.assertEqual(USERS_XML, response.raw.read())
+            response.close()
+
+    def test_follows_redirects(self):
+        echo = self.echo(self.transport.get(self.stub.url('/redirect')))
+        self.assertEqual('/echo', echo['path'])
+
+    def test_reuses_connections(self):
+        self.transport.get(self.stub.url('/echo')).content
+        connections = self.stub.connections
+        for _ in range(5):
+            self.transport.get(self.stub.url('/echo')).content
+        self.assertEqual(connections, self.stub.connections)
+
+    def test_connection_error(self):
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.transport.get('http://127.0.0.1:{}/echo'.format(port))
+
+    def test_timeout(self):
+        with self.assertRaises(requests.exceptions.Timeout):
+            self.transport.get(self.stub.url('/slow'), timeout=0.1)
+
+    def test_server(self):
+        server = TSC.Server(self.stub.address, transport=self.transport)
+        # Fake sign in
+        server._site_id = SITE_ID
+        server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+        all_workbooks, pagination_item = server.workbooks.get()
+        self.assertEqual(['Superstore', 'SafariSample'], [wb.name for wb in all_workbooks])
+        streamed, pagination_item = server.workbooks.get(stream=True)
+        self.assertEqual(['Superstore', 'SafariSample'], [wb.name for wb in streamed])
+        self.assertEqual(2, pagination_item.total_available)
+        self.assertEqual('j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM', self.stub.requests[-1][2]['x-tableau-auth'])
+
+    def test_server_compression(self):
+        server = TSC.Server(self.stub.address, transport=self.transport)
+        # Fake sign in
+        server._site_id = SITE_ID
+        server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+        events = []
+        server.add_request_hook(after=events.append)
+
+        all_users, _ = server.users.get()
+        streamed, _ = server.users.get(stream=True)
+        self.assertEqual([user.name for user in all_users], [user.name for user in streamed])
+        self.assertEqual('gzip, deflate', self.stub.requests[-1][2]['accept-encoding'])
+
+        compressed_size = len(gzip.compress(USERS_XML))
+        for event in events:
+            self.assertEqual(len(USERS_XML), event.bytes_received)
+            self.assertEqual(compressed_size, event.wire_bytes_received)
+
+        server.compression = False
+        server.users.get()
+        self.assertEqual('identity', self.stub.requests[-1][2]['accept-encoding'])
+        self.assertEqual(len(USERS_XML), events[-1].wire_bytes_received)
+
+
+class RequestsTransportTests(TransportConformance, unittest.TestCase):
+    def make_transport(self):
+        return TSC.RequestsTransport()
+
+    def test_default(self):
+        server = TSC.Server('http://test')
+        self.assertIsInstance(server.transport, TSC.RequestsTransport)
+        self.assertIs(server.session, server.transport.session)
+
+
+class Urllib3TransportTests(TransportConformance, unittest.TestCase):
+    def make_transport(self):
+        return TSC.Urllib3Transport()
+
+    def test_unsupported_option(self):
+        with self.assertRaises(ValueError):
+            self.transport.get(self.stub.url('/echo'), verify=False)
+
+    def test_server_has_no_session(self):
+        with mock.patch('tableauserverclient.server.server.requests.Session') as session:
+            server = TSC.Server('http://test', transport=self.transport)
+        session.assert_not_called()
+        self.assertRaises(AttributeError, getattr, server, 'session')
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class HttpxTransportTests(TransportConformance, unittest.TestCase):
+    def make_transport(self):
+        return TSC.HttpxTransport()
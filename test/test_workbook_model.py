@@ -1,6 +1,8 @@
 import unittest
 import tableauserverclient as TSC
 
+from ._utils import asset
+
 
 class WorkbookModelTests(unittest.TestCase):
     def test_invalid_project_id(self):
@@ -16,3 +18,19 @@ class WorkbookModelTests(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             workbook.show_tabs = None
+
+    def test_nested_elements_belong_to_views(self):
+        with open(asset('workbook_get_nested_views.xml'), 'rb') as f:
+            response_xml = f.read()
+        workbook = TSC.WorkbookItem.from_response(response_xml, {'t': TSC.DEFAULT_NAMESPACE})[0]
+
+        # The view's project, owner and tags come first in the document but are not the workbook's
+        self.assertEqual('ee8c6e70-43b6-11e6-af4f-f7b0d8e20760', workbook.project_id)
+        self.assertEqual('default', workbook.project_name)
+        self.assertEqual('5de011f8-5aa9-4d5b-b991-f462c8dd6bb7', workbook.owner_id)
+        self.assertEqual(set(), workbook.tags)
+
+        view = workbook.views[0]
+        self.assertEqual('1d0304cd-3796-429f-b815-7258370b9b74', view.project_id)
+        self.assertEqual('c0d5fc44-ad8c-4957-bec0-b70ed0f8df1e', view.owner_id)
+        self.assertEqual(set(['view-tag']), view.tags)
@@ -0,0 +1,205 @@
+import unittest
+from io import BytesIO
+import requests_mock
+import xml.etree.ElementTree as ET
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+import tableauserverclient as TSC
+from tableauserverclient import xml_helpers
+from tableauserverclient.namespace import Namespace, OLD_NAMESPACE
+from tableauserverclient.xml_helpers import fromstring, parse_response, ParsedResponse, StreamingDecoder
+
+from ._utils import asset, read_xml_asset
+
+GET_XML = 'workbook_get.xml'
+
+
+class XmlHelpersTests(unittest.TestCase):
+    def setUp(self):
+        with open(asset(GET_XML), 'rb') as f:
+            self.content = f.read()
+
+    def test_parse_response_passes_parsed_responses_through(self):
+        parsed = parse_response(self.content)
+        self.assertIs(parsed, parse_response(parsed))
+        self.assertIs(parsed.root, fromstring(parsed))
+
+    def test_parse_response_keeps_nothing_between_calls(self):
+        # Bodies are not cached, each one is parsed by whoever holds its ParsedResponse
+        parsed = parse_response(self.content)
+        self.assertIsNot(parsed, parse_response(self.content))
+        self.assertIsNot(parsed.root, fromstring(self.content))
+
+    def test_fromstring_accepts_elements_and_parsed_responses(self):
+        element = ET.fromstring(self.content)
+        self.assertIs(element, fromstring(element))
+
+        parsed = ParsedResponse(self.content)
+        self.assertIs(parsed.root, fromstring(parsed))
+
+    def test_is_xml(self):
+        self.assertTrue(ParsedResponse(self.content).is_xml())
+        self.assertTrue(ParsedResponse(self.content.decode('utf-8')).is_xml())
+        self.assertFalse(ParsedResponse(b'{"data": {}}').is_xml())
+
+    def test_list_request_parses_body_once(self):
+        server = TSC.Server('http://test')
+        server._site_id = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+        server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+        with requests_mock.mock() as m:
+            m.get(server.workbooks.baseurl, text=read_xml_asset(GET_XML))
+            backend = xml_helpers._backend
+            with mock.patch.object(backend, 'fromstring', wraps=backend.fromstring) as parse:
+                all_workbooks, pagination_item = server.workbooks.get()
+
+        self.assertEqual(1, parse.call_count)
+        self.assertEqual(2, pagination_item.total_available)
+        self.assertEqual(2, len(all_workbooks))
+
+    def test_error_response_parsed_once(self):
+        server = TSC.Server('http://test')
+        server._site_id = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+        server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+        error = ('<?xml version="1.0" encoding="UTF-8"?><tsResponse xmlns="http://tableau.com/api">'
+                 '<error code="404004"><summary>Not Found</summary><detail>No workbook</detail></error></tsResponse>')
+
+        with requests_mock.mock() as m:
+            m.get(server.workbooks.baseurl, text=error, status_code=404)
+            backend = xml_helpers._backend
+            with mock.patch.object(backend, 'fromstring', wraps=backend.fromstring) as parse:
+                with self.assertRaises(TSC.ServerResponseError):
+                    server.workbooks.get()
+
+        self.assertEqual(1, parse.call_count)
+
+
+class StreamingDecoderTests(unittest.TestCase):
+    def setUp(self):
+        with open(asset(GET_XML), 'rb') as f:
+            self.content = f.read()
+
+    def test_decodes_items_and_pagination(self):
+        decoder = StreamingDecoder(BytesIO(self.content), TSC.WorkbookItem)
+
+        self.assertEqual(2, decoder.pagination_item.total_available)
+        all_workbooks = list(decoder)
+        expected = TSC.WorkbookItem.from_response(self.content, {'t': TSC.DEFAULT_NAMESPACE})
+        self.assertEqual([wb.id for wb in expected], [wb.id for wb in all_workbooks])
+        self.assertEqual([wb.name for wb in expected], [wb.name for wb in all_workbooks])
+        self.assertEqual(expected[1].tags, all_workbooks[1].tags)
+
+    def test_pagination_after_items(self):
+        content = read_xml_asset(GET_XML)
+        pagination = '<pagination pageNumber="1" pageSize="100" totalAvailable="2" />'
+        content = content.replace(pagination, '').replace('</tsResponse>', pagination + '</tsResponse>')
+        decoder = StreamingDecoder(BytesIO(content.encode('utf-8')), TSC.WorkbookItem)
+
+        self.assertEqual(2, decoder.pagination_item.total_available)
+        self.assertEqual(2, len(list(decoder)))
+
+    def test_closes_source_when_done(self):
+        closed = []
+        decoder = StreamingDecoder(BytesIO(self.content), TSC.WorkbookItem, on_close=lambda: closed.append(True))
+        list(decoder)
+        self.assertEqual([True], closed)
+
+    def test_detects_namespace(self):
+        namespace = Namespace()
+        content = self.content.replace(TSC.DEFAULT_NAMESPACE.encode('utf-8'), OLD_NAMESPACE.encode('utf-8'))
+        decoder = StreamingDecoder(BytesIO(content), TSC.WorkbookItem, namespace)
+
+        self.assertEqual(2, len(list(decoder)))
+        self.assertEqual({'t': OLD_NAMESPACE}, namespace())
+
+    def test_streamed_get(self):
+        server = TSC.Server('http://test')
+        server._site_id = 'dad65087-b08b-4603-af4e-2887b8aafc67'
+        server._auth_token = 'j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM'
+
+        with requests_mock.mock() as m:
+            m.get(server.workbooks.baseurl, content=self.content)
+            all_workbooks, pagination_item = server.workbooks.get(stream=True)
+
+            self.assertEqual(2, pagination_item.total_available)
+            self.assertEqual(['Superstore', 'SafariSample'], [wb.name for wb in all_workbooks])
+
+
+@unittest.skipIf(xml_helpers.lxml_etree is None, 'lxml is not installed')
+class XmlBackendTests(unittest.TestCase):
+    FIXTURES = [
+        ('datasource_get.xml', TSC.DatasourceItem),
+        ('flow_get.xml', TSC.FlowItem),
+        ('group_get.xml', TSC.GroupItem),
+        ('job_get.xml', TSC.BackgroundJobItem),
+        ('project_get.xml', TSC.ProjectItem),
+        ('site_get.xml', TSC.SiteItem),
+        ('user_get.xml', TSC.UserItem),
+        ('view_get_usage.xml', TSC.ViewItem),
+        ('workbook_get.xml', TSC.WorkbookItem),
+    ]
+
+    def setUp(self):
+        self.backend = xml_helpers.get_xml_backend()
+
+    def tearDown(self):
+        xml_helpers.set_xml_backend(self.backend)
+
+    def _parse_with(self, backend, filename, model):
+        xml_helpers.set_xml_backend(backend)
+        content = read_xml_asset(filename).encode('utf-8')
+        ns = {'t': TSC.DEFAULT_NAMESPACE}
+        return TSC.PaginationItem.from_response(content, ns), model.from_response(content, ns)
+
+    def test_backends_agree(self):
+        for filename, model in self.FIXTURES:
+            etree_pagination, etree_items = self._parse_with('etree', filename, model)
+            lxml_pagination, lxml_items = self._parse_with('lxml', filename, model)
+
+            self.assertEqual(etree_pagination.total_available, lxml_pagination.total_available, filename)
+            self.assertEqual(len(etree_items), len(lxml_items), filename)
+            for etree_item, lxml_item in zip(etree_items, lxml_items):
+                self.assertEqual(etree_item.id, lxml_item.id, filename)
+                self.assertEqual(getattr(etree_item, 'name', None), getattr(lxml_item, 'name', None), filename)
+
+    def test_lxml_parse_error(self):
+        xml_helpers.set_xml_backend('lxml')
+        with self.assertRaises(ET.ParseError):
+            fromstring(b'this is not xml')
+
+    def test_lxml_find(self):
+        xml_helpers.set_xml_backend('lxml')
+        root = fromstring(read_xml_asset(GET_XML).encode('utf-8'))
+        ns = {'t': TSC.DEFAULT_NAMESPACE}
+
+        self.assertEqual(2, len(xml_helpers.findall(root, './/t:workbook', ns)))
+        self.assertEqual('100', xml_helpers.find(root, 't:pagination', ns).get('pageSize'))
+        self.assertIsNone(xml_helpers.find(root, 't:missing', ns))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            xml_helpers.set_xml_backend('sax')
+
+
+class QualifiedNamesTests(unittest.TestCase):
+    def test_qualified_names_are_shared(self):
+        ns = {'t': TSC.DEFAULT_NAMESPACE}
+        names = xml_helpers.qualified_names(ns)
+
+        self.assertEqual('{http://tableau.com/api}owner', names['owner'])
+        self.assertIs(names, xml_helpers.qualified_names(dict(ns)))
+        old_names = xml_helpers.qualified_names({'t': OLD_NAMESPACE})
+        self.assertEqual('{http://tableausoftware.com/api}owner', old_names['owner'])
+
+    def test_find_child_ignores_nested(self):
+        ns = {'t': TSC.DEFAULT_NAMESPACE}
+        root = ET.fromstring(read_xml_asset('workbook_get_nested_views.xml').encode('utf-8'))
+        workbook = root.find('.//t:workbook', ns)
+
+        owner = xml_helpers.find_child(workbook, 'owner', ns)
+        self.assertEqual('5de011f8-5aa9-4d5b-b991-f462c8dd6bb7', owner.get('id'))
+        self.assertIsNone(xml_helpers.find_child(workbook, 'tags', ns))